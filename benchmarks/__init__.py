@@ -0,0 +1,4 @@
+"""Offline benchmarks for the dashboard's data layer.
+
+Run from the repository root, e.g. ``python -m benchmarks.prefetch``.
+"""
@@ -0,0 +1,266 @@
+"""Synthetic scoops-finder objects for offline benchmarking.
+
+``write_fixtures(root, rows)`` lays out every object the registry knows about
+under ``root`` using the same file names and columns as the S3 bucket, so a
+``LocalBackend(root)`` can stand in for the S3 bucket.
+
+    python -m benchmarks.fixtures data/scoops-finder --rows 5000
+
+writes the tree the ``local`` data backend reads by default.
+"""
+import argparse
+import datetime
+import json
+import os
+import random
+
+import pandas as pd
+
+IMAGING_BRANDS = ["Canon", "Brother", "HP", "Epson", "Kyocera", "Lexmark", "Ricoh", "Sharp", "Xerox", "HP Inc."]
+COMPUTER_BRANDS = ["Dell Technologies", "HP Inc.", "Lenovo", "Apple", "ASUS", "Acer", "Microsoft", "Samsung"]
+TV_BRANDS = ["LG", "Samsung", "Sharp Corporation", "Insignia", "Sony Group Corporation", "Toshiba"]
+MARKETS = ["United States", "Canada", "Japan", "Taiwan", "Australia", "New Zealand", "Switzerland"]
+
+
+def _date(rng):
+    day = datetime.date(2019, 1, 1) + datetime.timedelta(days=rng.randrange(2000))
+    return f"{day.isoformat()}T00:00:00.000"
+
+
+def _model(rng, brand):
+    return f"{brand.split()[0][:3].upper()}-{rng.choice('LMCX')}{rng.randrange(1000, 9999)}{rng.choice(['', 'DW', 'CDW'])}"
+
+
+def _markets(rng):
+    return ", ".join(rng.sample(MARKETS, rng.randrange(1, 4)))
+
+
+def _energy_star_common(rng, i, brands):
+    brand = rng.choice(brands)
+    return {
+        'pd_id': 1000000 + i,
+        'date_available_on_market': _date(rng),
+        'date_qualified': _date(rng),
+        'brand_name': brand,
+        'model_name': _model(rng, brand),
+        'model_number': _model(rng, brand),
+        'upc': str(rng.randrange(10**11, 10**12)),
+        'markets': _markets(rng),
+        'energy_star_model_identifier': f"ES-{i}",
+    }
+
+
+def imaging(rng, rows):
+    records = []
+    for i in range(rows):
+        record = _energy_star_common(rng, i, IMAGING_BRANDS)
+        record.update({
+            'product_type': rng.choice(['Printers', 'Multifunction Devices (MFD)', 'Scanners']),
+            'remanufactured_product': rng.choice(['Yes', None]),
+            'color_capability': rng.choice(['Color', 'Monochrome']),
+            'monochrome_product_speed_ipm_or_mppm': rng.randrange(10, 80),
+            'automatic_duplex_output_capable': rng.choice(['Yes', 'No']),
+            'typical_electricity_consumption_tec_kwh_wk': round(rng.random() * 2, 3),
+            'power_in_sleep_w': round(rng.random() * 3, 2),
+            'power_in_standby_w': round(rng.random(), 2),
+        })
+        records.append(record)
+    return pd.DataFrame(records)
+
+
+def computers(rng, rows):
+    records = []
+    for i in range(rows):
+        record = _energy_star_common(rng, i, COMPUTER_BRANDS)
+        record.update({
+            'type': rng.choice(['Notebook', 'Desktop', 'Tablet/Slate', 'Workstation']),
+            'touch_screen': rng.choice(['Yes', 'No']),
+            'category_2_processor_brand': rng.choice(['Intel', 'AMD', 'Apple']),
+            'category_2_processor_name': f"CPU {rng.randrange(100, 999)}",
+            'category_2_physical_cpu_cores_count': rng.choice([4, 6, 8, 12]),
+            'category_2_base_processor_speed_per_core_ghz': round(1 + rng.random() * 3, 1),
+            'category_2_operating_system_name': rng.choice(['Windows 11', 'macOS', 'ChromeOS']),
+            'category_2_system_memory_gb': rng.choice([8, 16, 32]),
+            'product_dimm_count': rng.choice([1, 2]),
+            'ethernet_capability': rng.choice(['Yes', 'No']),
+            'bluetooh_capability': rng.choice(['Yes', 'No']),
+        })
+        records.append(record)
+    return pd.DataFrame(records)
+
+
+def televisions(rng, rows):
+    records = []
+    for i in range(rows):
+        record = _energy_star_common(rng, i, TV_BRANDS)
+        record.update({
+            'product_type': rng.choice(['Television', 'Set-top Box']),
+            'application': rng.choice(['Consumer', 'Hospitality']),
+            'display_type': rng.choice(['LCD', 'OLED']),
+            'backlight_technology_type': rng.choice(['LED', 'Mini-LED', None]),
+            'diagonal_viewable_screen_size_inches': rng.choice([43, 55, 65, 75]),
+            'screen_area_square_inches': rng.randrange(800, 2500),
+            'native_horizontal_resolution_pixels': 3840,
+            'native_vertical_resolution_pixels': 2160,
+            'resolution_format': '4K',
+            'high_contrast_ratio_hcr_display': rng.choice(['Yes', 'No']),
+            'low_power_wireless_technologies_supported': rng.choice(['Bluetooth', None]),
+            'features': rng.choice(['HDR', 'Smart TV', None]),
+            'automatic_brightness_control': rng.choice(['Yes', 'No']),
+            'additional_model_information': None,
+        })
+        records.append(record)
+    return pd.DataFrame(records)
+
+
+def wifi(rng, rows):
+    categories = ['Computers & Accessories', 'Televisions & Set Top Boxes', 'Phones']
+    brands = IMAGING_BRANDS + COMPUTER_BRANDS + TV_BRANDS
+    records = []
+    for i in range(rows):
+        brand = rng.choice(brands)
+        records.append({
+            'CID': f"WFA{100000 + i}",
+            'Date of Last Certification': _date(rng)[:10],
+            'Brand': brand,
+            'Product': f"{brand} {_model(rng, brand)}",
+            'Model Number': _model(rng, brand),
+            'Category': rng.choice(categories),
+        })
+    return pd.DataFrame(records)
+
+
+def epeat(rng, rows):
+    types = {'Imaging Equipment': ['Printer', 'Multifunction Device', 'Copier'],
+             'Computers & Displays': ['Notebook', 'Desktop', 'Tablet', 'Monitors']}
+    records = []
+    for i in range(rows):
+        category = rng.choice(list(types))
+        brand = rng.choice(IMAGING_BRANDS if category == 'Imaging Equipment' else COMPUTER_BRANDS)
+        records.append({
+            'Id': 200000 + i,
+            'Registered On': _date(rng),
+            'Product Name': f"{brand} {_model(rng, brand)}",
+            'Manufacturer': brand,
+            'Product Category': category,
+            'Product Type': rng.choice(types[category]),
+            'Status': rng.choice(['Active', 'Archived']),
+            'Registered In': rng.choice(MARKETS),
+            'Climate+': rng.choice([True, False]),
+            'Total Score': rng.randrange(20, 90),
+            'EPEAT Tier': rng.choice(['Gold', 'Silver', 'Bronze']),
+            'Manufacturer Part Number': _model(rng, brand),
+            'Universal Product Code': str(rng.randrange(10**11, 10**12)),
+        })
+    return pd.DataFrame(records)
+
+
+def bluetooth(rng, rows):
+    companies = ["Sharp Corporation", "HP Inc.", "Seiko Epson Corporation", "Apple Inc.", "Acer Inc.",
+                 "LG Electronics Inc.", "Samsung Electronics Co., Ltd.", "Unrelated Audio Ltd."]
+    return [{
+        'ListingId': 300000 + i,
+        'Name': f"Product {i}",
+        'CompanyName': rng.choice(companies),
+        'ListingDate': _date(rng),
+        'ProductListings': [{'Name': f"Variant {i}-{j}", 'ModelNumber': f"BT{i}{j}"} for j in range(2)],
+    } for i in range(rows)]
+
+
+def mfi_records(rng, rows):
+    brands = ['Canon', 'Brother', 'EPSON', 'HP', 'Lenovo', 'DELL', 'Sony', 'LG', 'Belkin']
+    return [{
+        'upcEan': str(rng.randrange(10**11, 10**12)),
+        'models': f"M{rng.randrange(100, 999)}",
+        'brand': rng.choice(brands),
+        'accessoryName': f"Accessory {i}",
+        'accessoryCategory': rng.choice(['Printer', 'Keyboard', 'Speaker', 'Cable']),
+    } for i in range(rows)]
+
+
+def tco(rng, rows):
+    return [{
+        'id': 400000 + i,
+        'idkey': f"k{i}",
+        'brand': rng.choice(COMPUTER_BRANDS),
+        'name': f"TCO product {i}",
+        'category': rng.choice(["Notebooks", "Desktops", "All-inOnePCs", "Tablets", "Displays"]),
+        'tec': round(rng.random() * 50, 1),
+        'cert_no': f"TCO{i}",
+        'cert_id': i,
+        'cert_date': _date(rng)[:10],
+        'cert_expiry_date': _date(rng)[:10],
+        'recycled_plastic': rng.randrange(0, 80),
+        'size': rng.choice([13, 14, 15, 24]),
+        'resolution_height': 1080,
+        'resolution_width': 1920,
+        'total_weight': round(rng.random() * 3, 2),
+    } for i in range(rows)]
+
+
+def _changelog(rng, frame):
+    frame = frame.copy()
+    frame.insert(0, 'Date Detected', [_date(rng) for _ in range(len(frame))])
+    return frame
+
+
+def write_fixtures(root, rows=5000, seed=0):
+    """Write every scoops-finder object under ``root`` with about ``rows`` rows each."""
+    rng = random.Random(seed)
+    os.makedirs(root, exist_ok=True)
+    changelog_rows = max(rows // 10, 1)
+
+    def csv(name, frame):
+        frame.to_csv(os.path.join(root, name), index=False)
+
+    def dump(name, payload):
+        with open(os.path.join(root, name), "w") as f:
+            json.dump(payload, f)
+
+    csv("imaging-data.csv", imaging(rng, rows))
+    csv("computers-data.csv", computers(rng, rows))
+    csv("televisions-data.csv", televisions(rng, rows))
+    csv("baseline3.csv", wifi(rng, rows))
+    csv("baseline4.csv", epeat(rng, rows))
+    dump("bluetooth.json", bluetooth(rng, rows))
+    dump("mfi.json", {"content": mfi_records(rng, rows)})
+    dump("tco_data.json", tco(rng, rows))
+
+    csv("imaging-changelog.csv", _changelog(rng, imaging(rng, changelog_rows)))
+    csv("computers-changelog.csv", _changelog(rng, computers(rng, changelog_rows)))
+    csv("televisions-changelog.csv", _changelog(rng, televisions(rng, changelog_rows)))
+    csv("changelog-epeat.csv", _changelog(rng, epeat(rng, changelog_rows)))
+    wifi_changelog = _changelog(rng, wifi(rng, changelog_rows)).rename(columns={'Date Detected': 'Date'})
+    csv("changelog-wifi.csv", wifi_changelog)
+    dump("changelog-bluetooth.json",
+         [dict(item, **{'Date Detected': _date(rng)}) for item in bluetooth(rng, changelog_rows)])
+    # The real changelog carries non-dict bookkeeping entries between records
+    dump("changelog-mfi.json",
+         [dict(item, **{'Date Detected': _date(rng)}) for item in mfi_records(rng, changelog_rows)] + ["checkpoint"])
+
+    brands = IMAGING_BRANDS[:6]
+    tracking = pd.DataFrame([{
+        'Product Name': f"Placement {i}",
+        'Brand': rng.choice(brands),
+        'Action': rng.choice(['Added', 'Removed']),
+        'Date Detected': _date(rng)[:10],
+    } for i in range(changelog_rows)])
+    csv("tracking.csv", tracking)
+    csv("combined_products.csv", tracking.drop(columns=['Action']))
+    days = sorted({_date(rng)[:10] for _ in range(30)})
+    csv("brand_counts.csv", pd.DataFrame([
+        {'Date': day, 'Brand': brand, 'Count': rng.randrange(20, 200)} for day in days for brand in brands]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write synthetic scoops-finder objects to a directory.")
+    parser.add_argument("root", nargs="?", default=os.path.join("data", "scoops-finder"))
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    write_fixtures(args.root, rows=args.rows, seed=args.seed)
+    print(f"Wrote fixtures to {args.root}")
+
+
+if __name__ == "__main__":
+    main()
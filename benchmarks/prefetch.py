@@ -0,0 +1,50 @@
+"""Cold-load latency of a page's datasets, sequential vs. prefetched.
+
+    python -m benchmarks.prefetch --rows 20000 --latency 0.3
+
+Fixtures are generated into a temporary directory and served through
+``LocalBackend`` with ``--latency`` seconds added per object to stand
+in for the S3 round trip.
+"""
+import argparse
+import tempfile
+import time
+
+from benchmarks.fixtures import write_fixtures
+from scooper.backends import LocalBackend
+from scooper.registry import DatasetRegistry
+
+# The imaging Raw Data page, the widest fan-out in the app
+PAGE_DATASETS = ["imaging", "epeat", "wifi", "bluetooth", "mfi"]
+
+
+def _cold_load(root, latency, prefetch):
+    registry = DatasetRegistry(LocalBackend(root, latency=latency))
+    start = time.perf_counter()
+    if prefetch:
+        registry.prefetch(PAGE_DATASETS)
+    else:
+        for name in PAGE_DATASETS:
+            registry.get(name)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--latency", type=float, default=0.3)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        write_fixtures(root, rows=args.rows)
+        sequential = min(_cold_load(root, args.latency, False) for _ in range(args.repeat))
+        prefetched = min(_cold_load(root, args.latency, True) for _ in range(args.repeat))
+
+    print(f"{len(PAGE_DATASETS)} datasets, {args.rows} rows, {args.latency:.2f}s latency")
+    print(f"sequential: {sequential:.3f}s")
+    print(f"prefetched: {prefetched:.3f}s ({sequential / prefetched:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Import and rerun time of ``streamlit_app.py``.
+
+    python -m benchmarks.startup --rows 5000 --reruns 5 --budget 0.5
+
+Streamlit executes the whole script again on every interaction, so anything at
+module level (network calls, heavy imports) is paid on every rerun of every
+session. ``import`` is the cost of importing the app in a fresh interpreter on
+top of ``import streamlit``, with its slowest direct imports from
+``-X importtime``. ``rerun`` drives the login page and the logged-in home page
+through ``AppTest`` against ``benchmarks.fixtures`` data. The exit status is 1
+when the import overhead exceeds ``--budget`` seconds, so a regression fails CI.
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.fixtures import write_fixtures
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_TIMED_IMPORT = """
+import time
+start = time.perf_counter()
+import streamlit
+base = time.perf_counter()
+import streamlit_app
+end = time.perf_counter()
+print(base - start, end - base)
+"""
+
+
+def _import_seconds():
+    """(import streamlit, import streamlit_app on top of it) in a fresh interpreter."""
+    output = subprocess.run([sys.executable, "-c", _TIMED_IMPORT], cwd=ROOT, check=True,
+                            capture_output=True, text=True).stdout
+    base, app = output.split()[-2:]
+    return float(base), float(app)
+
+
+def _slowest_imports(limit):
+    """Cumulative seconds of the modules ``streamlit_app`` imports directly, slowest first."""
+    stderr = subprocess.run([sys.executable, "-X", "importtime", "-c", "import streamlit_app"], cwd=ROOT,
+                            check=True, capture_output=True, text=True).stderr
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Nesting is two spaces per level, the app itself is at level zero
+        if name.startswith("   ") and not name.startswith("    "):
+            imports.append((int(cumulative) / 1e6, name.strip()))
+    return sorted(imports, reverse=True)[:limit]
+
+
+def _reruns(root, reruns):
+    try:
+        from streamlit.testing.v1 import AppTest
+    except ImportError:
+        return None
+    timings = {}
+    for page, logged_in in [("login", False), ("home", True)]:
+        app = AppTest.from_file(os.path.join(ROOT, "streamlit_app.py"), default_timeout=120)
+        app.secrets["data"] = {"backend": "local", "local_root": root, "disk_cache": False}
+        app.session_state["logged_in"] = logged_in
+        start = time.perf_counter()
+        app.run()
+        first = time.perf_counter() - start
+        times = []
+        for _ in range(reruns):
+            start = time.perf_counter()
+            app.run()
+            times.append(time.perf_counter() - start)
+        timings[page] = (first, min(times) if times else first)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--reruns", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--budget", type=float, default=None,
+                        help="fail when importing the app costs more than this many seconds")
+    args = parser.parse_args()
+
+    samples = [_import_seconds() for _ in range(args.repeat)]
+    base = min(sample[0] for sample in samples)
+    app = min(sample[1] for sample in samples)
+    print(f"import streamlit:     {base:.3f}s")
+    print(f"import streamlit_app: {app:.3f}s on top")
+    for seconds, name in _slowest_imports(5):
+        print(f"  {name:<24} {seconds:.3f}s")
+
+    with tempfile.TemporaryDirectory() as root:
+        write_fixtures(root, rows=args.rows)
+        timings = _reruns(root, args.reruns)
+    if timings is None:
+        print("rerun: skipped, needs streamlit.testing (streamlit>=1.28)")
+    else:
+        for page, (first, rerun) in timings.items():
+            print(f"{page:<6} first run: {first:.3f}s, rerun: {rerun:.3f}s")
+
+    if args.budget is not None and app > args.budget:
+        print(f"import overhead {app:.3f}s exceeds the {args.budget:.3f}s budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Data access helpers for the Scooper dashboard."""
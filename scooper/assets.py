@@ -0,0 +1,68 @@
+"""Images and icon fonts the dashboard shows, served from ``static/``.
+
+With ``server.enableStaticServing`` on (see ``.streamlit/config.toml``)
+Streamlit serves the ``static/`` folder next to ``streamlit_app.py`` at
+``app/static/``, so browsers load everything from the dashboard itself and
+nothing is fetched from a third-party host, online or air-gapped.
+
+The Scooper logo and page icon are committed as ``static/scooper-logo.png``
+and ``static/scooper-s.png``, the Font Awesome webfonts under
+``static/fonts/``; the LinkedIn and portfolio links use their glyphs.
+"""
+import os
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "static")
+
+# Where the browser finds STATIC_DIR
+STATIC_URL = "app/static"
+
+# name -> file under STATIC_DIR
+IMAGES = {
+    "icon": "scooper-s.png",
+    "logo": "scooper-logo.png",
+}
+
+# The few Font Awesome icons the pages use. Streamlit serves .css files from
+# static/ as text/plain, which browsers refuse as a stylesheet, so these rules
+# are inlined once per page run and only the fonts come from static/.
+ICON_CSS = """
+@font-face {{
+    font-family: "Font Awesome Brands"; font-style: normal; font-weight: 400; font-display: block;
+    src: url("{static}/fonts/fa-brands-400.woff2") format("woff2");
+}}
+@font-face {{
+    font-family: "Font Awesome Solid"; font-style: normal; font-weight: 900; font-display: block;
+    src: url("{static}/fonts/fa-solid-900.woff2") format("woff2");
+}}
+.fab, .fas {{
+    display: inline-block; font-style: normal; font-variant: normal; line-height: 1;
+    text-rendering: auto; -webkit-font-smoothing: antialiased;
+}}
+.fab {{ font-family: "Font Awesome Brands"; font-weight: 400; }}
+.fas {{ font-family: "Font Awesome Solid"; font-weight: 900; }}
+.fa-apple:before {{ content: "\\f179"; }}
+.fa-bluetooth:before {{ content: "\\f293"; }}
+.fa-briefcase:before {{ content: "\\f0b1"; }}
+.fa-leaf:before {{ content: "\\f06c"; }}
+.fa-linkedin:before {{ content: "\\f08c"; }}
+"""
+
+
+def asset_path(name):
+    """Local file of image ``name`` for ``st.image`` and ``page_icon``."""
+    return os.path.join(STATIC_DIR, IMAGES[name])
+
+
+def asset_url(name):
+    """URL of image ``name`` for HTML."""
+    return f"{STATIC_URL}/{IMAGES[name]}"
+
+
+def logo_html(width):
+    """The Scooper logo ``width`` pixels wide."""
+    return f"<img src='{asset_url('logo')}' width='{width}'>"
+
+
+def icon_css():
+    """``<style>`` block defining the Font Awesome icons."""
+    return f"<style>{ICON_CSS.format(static=STATIC_URL)}</style>"
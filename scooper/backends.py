@@ -0,0 +1,84 @@
+"""Storage backends the registry reads the scoops-finder objects from.
+
+A backend only needs ``open(path, mode)`` and ``info(path)``, where ``path`` is
+``scoops-finder/<key>``. ``S3Backend`` wraps the Streamlit ``FilesConnection``
+used in production; ``LocalBackend`` serves the same layout from a directory
+so the dashboard can run, be profiled and be benchmarked without AWS.
+
+Chosen from the ``[data]`` section of the secrets file::
+
+    [data]
+    backend = "local"              # "s3" (default) or "local"
+    local_root = "data/scoops-finder"
+
+The ``SCOOPER_BACKEND`` environment variable overrides ``backend``, which is
+handy on CI boxes without a secrets file. Generate a local tree with
+``python -m benchmarks.fixtures data/scoops-finder``.
+"""
+import os
+import time
+
+import streamlit as st
+
+from scooper.config import settings
+
+DEFAULT_LOCAL_ROOT = os.path.join("data", "scoops-finder")
+
+
+class S3Backend:
+    """The scoops-finder bucket through ``st.connection('s3')``."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def info(self, path):
+        # Bypass the fsspec listing cache so a rewritten object shows its new ETag
+        return self.conn.fs.info(path, refresh=True)
+
+    def open(self, path, mode="rb", *args, **kwargs):
+        return self.conn.open(path, mode, *args, **kwargs)
+
+
+class LocalBackend:
+    """Serves ``scoops-finder/<key>`` paths from a local directory.
+
+    ``latency`` adds a fixed delay per open to mimic an S3 round trip when
+    benchmarking the loader offline.
+    """
+
+    def __init__(self, root, latency=0.0):
+        self.root = root
+        self.latency = latency
+
+    def _local_path(self, path):
+        # Drop the bucket name, the directory stands in for the bucket itself
+        _, _, key = path.partition("/")
+        return os.path.join(self.root, key)
+
+    def info(self, path):
+        stat = os.stat(self._local_path(path))
+        return {"mtime": stat.st_mtime_ns, "size": stat.st_size}
+
+    def open(self, path, mode="rb", *args, **kwargs):
+        if self.latency:
+            time.sleep(self.latency)
+        return open(self._local_path(path), mode, *args, **kwargs)
+
+
+def make_backend(config=None):
+    """Backend selected by ``config`` (default: the ``[data]`` settings)."""
+    if config is None:
+        config = settings("data")
+    kind = os.environ.get("SCOOPER_BACKEND") or config.get("backend", "s3")
+    if kind == "local":
+        root = config.get("local_root", DEFAULT_LOCAL_ROOT)
+        if not os.path.isdir(root):
+            raise FileNotFoundError(
+                f"Local data directory {root!r} does not exist, "
+                f"create it with: python -m benchmarks.fixtures {root}")
+        return LocalBackend(root, latency=config.get("local_latency", 0.0))
+    if kind == "s3":
+        # Imported here so offline runs do not need the S3 connection package
+        from st_files_connection import FilesConnection
+        return S3Backend(st.connection('s3', type=FilesConnection))
+    raise ValueError(f"Unknown data backend {kind!r}, expected 's3' or 'local'")
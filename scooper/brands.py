@@ -0,0 +1,45 @@
+"""Brands each product category shows from the shared Bluetooth and MFi listings.
+
+The Bluetooth SIG and Apple MFi listings cover every manufacturer, while the
+pages only ever show a handful of them. The registry keeps the union of these
+lists while parsing and each page narrows it down to its own category.
+"""
+
+BLUETOOTH_COMPANIES = {
+    'imaging': [
+        "Sharp Corporation", "Toshiba", "Brother Industries, Ltd", "Seiko Epson Corporation",
+        "Canon Marketing Japan Inc.", "HP Inc.", "Ricoh Company Ltd", "XEROX", "Kyocera Corporation",
+    ],
+    'computers': [
+        "Sharp Corporation", "Toshiba Corporation", "Acer", "Apple Inc.", "Google LLC", "Lenovo (Singapore)",
+        "Dell Computer Corporation", "Asustek Computer Inc.", "Acer Inc.", "Micro-Star International CO., LTD.",
+    ],
+    'televisions': [
+        "Sharp Corporation", "Hisense Company Limited", "AmTRAN Technology Co., Ltd", "TCL Communication Ltd.",
+        "LG Electronics Inc.", "Samsung Electronics Co., Ltd.",
+    ],
+}
+
+BLUETOOTH_CHANGELOG_COMPANIES = {
+    'computers': [
+        "Xiaomi Inc.", "Dell Computer Corporation",
+        "Panasonic Holdings Corporation", "LG Electronics Inc.",
+        "Samsung Electronics Co., Ltd.", "NEC Personal Computers, Ltd.",
+        "Lenovo (Singapore) Pte Ltd.", "Acer Inc.", "Sharp Corporation",
+        "Toshiba Corporation", "Huawei Technologies Co., Ltd.",
+        "Microsoft Corporation", "Google LLC", "ASUStek Computer Inc.",
+        "Fujitsu Client Computing Limited", "Apple Inc.",
+    ],
+    'televisions': BLUETOOTH_COMPANIES['televisions'],
+}
+
+MFI_BRANDS = {
+    'imaging': ['Canon', 'Brother', 'EPSON', 'HP', 'TOSHIBA', 'SHARP'],
+    'computers': ['Lenovo', 'Razer', 'HP', 'TOSHIBA', 'SAMSUNG', "DELL"],
+    'televisions': ['Sony', 'LG', 'TCL', 'Hisense', 'JVCKENWOOD Corporation', 'SHARP'],
+}
+
+
+def union(lists):
+    """Every brand that appears in any of the category ``lists``."""
+    return frozenset(brand for brands in lists.values() for brand in brands)
@@ -0,0 +1,164 @@
+"""HTML for the card grids on the Recent pages.
+
+A grid is one string: the card stylesheet followed by every card, so a page
+paints it with a single ``st.markdown`` call. The strings are memoized per data
+version in ``scooper.derived``, reruns only resend them.
+"""
+import html
+
+import pandas as pd
+
+# Emoji shown after each certification source
+SOURCE_EMOJI = {
+    "Energy Star": "⚡",
+    "WiFi Alliance": "📶",
+    "EPEAT": "🌎",
+    "TCO": "♻️",
+}
+
+CARD_CSS = """
+/* One CSS grid instead of a st.columns row per pair of cards */
+.card-grid {
+    display: grid;
+    grid-template-columns: repeat(2, 1fr);
+    grid-gap: 0 20px;
+}
+
+.card {
+    height: auto;
+    min-height: 120px;
+    position: relative;
+    width: 100%; /* This makes each card responsive within its grid column */
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    padding: 2px;
+    border-radius: 24px;
+    overflow: hidden;
+    line-height: 1.6;
+    transition: all 0.48s cubic-bezier(0.23, 1, 0.32, 1);
+    margin: 15px; /* Added margin */
+}
+
+.content {
+width: 100%;
+display: flex;
+flex-direction: column;
+align-items: flex-start;
+gap: 24px;
+padding: 20px;
+padding-bottom: 0px;
+border-radius: 22px;
+color: #ffffff;
+overflow: hidden;
+background: #ffffff;
+transition: all 0.48s cubic-bezier(0.23, 1, 0.32, 1);
+}
+
+.content .heading {
+font-weight: 600;
+font-size: 20px;
+line-height: 1;
+z-index: 1;
+transition: all 0.48s cubic-bezier(0.23, 1, 0.32, 1);
+}
+
+.content .para {
+z-index: 1;
+opacity: 0.8;
+font-size: 16px;
+font-weight: 400;
+transition: all 0.48s cubic-bezier(0.23, 1, 0.32, 1);
+}
+
+.card::before {
+content: "";
+position: absolute;
+height: 500%;
+width: 500%;
+border-radius: inherit;
+background: #3775cb;
+background: linear-gradient(to right, #3775cb, #3775cb);
+transform-origin: center;
+}
+
+.card:hover::before {
+animation-play-state: running;
+z-index: -1;
+width: 20%;
+}
+.card:hover .content .heading,
+.card:hover .content .para {
+color: #000000;
+}
+
+.card:hover {
+box-shadow: 0rem 6px 13px rgba(10, 60, 255, 0.1),
+    0rem 24px 24px rgba(10, 60, 255, 0.09),
+    0rem 55px 33px rgba(10, 60, 255, 0.05),
+    0rem 97px 39px rgba(10, 60, 255, 0.01), 0rem 152px 43px rgba(10, 60, 255, 0);
+color: #000000;
+}
+
+@media (max-width: 640px) {
+    .card-grid {
+        grid-template-columns: 1fr;
+    }
+}
+"""
+
+
+def _card(heading, lines):
+    """One card; ``lines`` are already escaped HTML fragments."""
+    return (f'<div class="card"><div class="content"><p class="heading">{_text(heading)}</p>'
+            f'<p class="para">{"<br>".join(lines)}</p></div></div>')
+
+
+def card_grid(cards):
+    """Stylesheet plus a two column grid of ``cards``."""
+    return f'<style>{CARD_CSS}</style><div class="card-grid">{"".join(cards)}</div>'
+
+
+def _text(value):
+    return html.escape(str(value)) if pd.notna(value) else ''
+
+
+def _date(value):
+    return value.strftime('%Y-%m-%d') if pd.notna(value) else ''
+
+
+def certification_cards(records):
+    """Card grid for ``scooper.derived.recent_products`` rows."""
+    cards = []
+    for row in records.to_dict('records'):
+        lines = [
+            f"Brand: {_text(row['Brand'])}",
+            f"Product Type: {_text(row['Product Type'])}",
+            f"Certification Date: {_date(row['Certification Date'])}",
+            f"Source: {_text(row['Source'])} {SOURCE_EMOJI.get(row['Source'], '📝')}",
+        ]
+        if row['Also Listed By']:
+            lines.append(f"Also Listed By: {_text(row['Also Listed By'])}")
+        cards.append(_card(row['Product'], lines))
+    return card_grid(cards)
+
+
+# Placement action -> card title
+PLACEMENT_TITLES = {
+    'Added': "New Product Added 🆕",
+    'Removed': "Product Removed ❌",
+}
+
+
+def placement_cards(records):
+    """Card grid for rows of the placements ``tracking`` table."""
+    cards = []
+    for row in records.to_dict('records'):
+        lines = [
+            PLACEMENT_TITLES.get(row['Action'], "Certification Spotted"),
+            f"Brand: {_text(row['Brand'])}",
+            f"Product Type: {_text(row['Product Name'])}",
+            f"Certification Date: {_date(row['Date Detected'])}",
+        ]
+        cards.append(_card(row['Product Name'], lines))
+    return card_grid(cards)
@@ -0,0 +1,11 @@
+"""Settings for the data layer, read from ``.streamlit/secrets.toml``."""
+import streamlit as st
+
+
+def settings(section):
+    """Contents of ``[section]`` in the secrets file, or ``{}`` when absent."""
+    try:
+        return dict(st.secrets.get(section, {}))
+    except Exception:
+        # No secrets.toml at all, e.g. in offline benchmarks
+        return {}
@@ -0,0 +1,646 @@
+"""Cache of normalized frames derived from the registry datasets.
+
+The Recent and Insights pages of every product category stack the same
+Energy Star / WiFi Alliance / EPEAT / TCO rows under a common set of columns.
+Those frames only change when one of the underlying datasets is reloaded, so
+they are built once per (source, category, data version) and shared. Every
+normalized row carries a ``Product ID`` (see ``scooper.entities``) linking it
+to the same product's rows in the other sources.
+"""
+import threading
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from scooper.brands import BLUETOOTH_COMPANIES, MFI_BRANDS
+from scooper.cards import certification_cards, placement_cards
+from scooper.facets import FacetIndex, MultiValued
+from scooper.entities import EntityTable, first_per_product, product_ids
+from scooper.registry import get_registry
+from scooper.search import SearchTable, TokenIndex, TrigramIndex
+
+CERTIFICATION_COLUMNS = ['Product', 'Brand', 'Certification Date', 'Product Type', 'Source', 'Product ID']
+
+IMAGING_BRANDS = ["Canon", "Brother", "HP", "Epson", "Konica Minolta", "Kyocera",
+                  "Lexmark", "Ricoh", "Sharp", "Toshiba", "Xerox", "Pantum", "Fujifilm", "HP Inc.",
+                  "Zhuhai Pantum Electronics Co., Ltd."]
+
+COMPUTER_EPEAT_TYPES = ["Notebook", "Desktop", "Integrated Desktop Computer", "Tablet", "Signage Display",
+                        "Workstation", "Thin Client"]
+
+COMPUTER_TCO_CATEGORIES = ["Notebooks", "Desktops", "All-inOnePCs", "Tablets"]
+
+
+def _certifications(df, source, **columns):
+    """Rename ``columns`` (target=source column) and stamp the ``Source``."""
+    out = df[list(columns.values())].copy()
+    out.columns = list(columns.keys())
+    out['Source'] = source
+    return out
+
+
+def _imaging_energy_star(df):
+    df = df[(df['brand_name'].isin(IMAGING_BRANDS)) &
+            (df['product_type'].isin(['Printers', 'Multifunction Devices (MFD)'])) &
+            (~df['model_name'].str.contains('Model Printer|Label Printer', case=False))]
+    return _certifications(df, 'Energy Star', **{
+        'Product': 'model_name', 'Brand': 'brand_name',
+        'Certification Date': 'date_available_on_market', 'Product Type': 'product_type'})
+
+
+def _imaging_wifi(df):
+    df = df[df['Brand'].isin(IMAGING_BRANDS)]
+    return _certifications(df, 'WiFi Alliance', **{
+        'Product': 'Product', 'Brand': 'Brand',
+        'Certification Date': 'Date of Last Certification', 'Product Type': 'Category'})
+
+
+def _imaging_epeat(df):
+    df = df[(df['Manufacturer'].isin(IMAGING_BRANDS)) &
+            (df['Product Type'].isin(['Printer', 'Multifunction Device']))]
+    return _certifications(df, 'EPEAT Registry', **{
+        'Product': 'Product Name', 'Brand': 'Manufacturer',
+        'Certification Date': 'Registered On', 'Product Type': 'Product Type'})
+
+
+def _computers_energy_star(df):
+    out = _certifications(df, 'Energy Star', **{
+        'Product': 'model_name', 'Brand': 'brand_name',
+        'Certification Date': 'date_available_on_market', 'Product Type': 'type'})
+    out['Product'] = out['Product'].str.replace(r"\(ENERGY STAR\)", "", regex=True)
+    return out
+
+
+def _computers_epeat(df):
+    df = df[(df["Product Type"].isin(COMPUTER_EPEAT_TYPES)) & (df["Registered In"] == "United States")]
+    return _certifications(df, 'EPEAT', **{
+        'Product': 'Product Name', 'Brand': 'Manufacturer',
+        'Certification Date': 'Registered On', 'Product Type': 'Product Type'})
+
+
+def _computers_wifi(df):
+    df = df[df["Category"] == "Computers & Accessories"]
+    return _certifications(df, 'WiFi Alliance', **{
+        'Product': 'Product', 'Brand': 'Brand',
+        'Certification Date': 'Date of Last Certification', 'Product Type': 'Category'})
+
+
+def _computers_tco(df):
+    df = df[df["category"].isin(COMPUTER_TCO_CATEGORIES)]
+    return _certifications(df, 'TCO', **{
+        'Product': 'name', 'Brand': 'brand',
+        'Certification Date': 'cert_date', 'Product Type': 'category'})
+
+
+def _televisions_energy_star(df):
+    return _certifications(df, 'Energy Star', **{
+        'Product': 'model_name', 'Brand': 'brand_name',
+        'Certification Date': 'date_available_on_market', 'Product Type': 'product_type'})
+
+
+def _televisions_wifi(df):
+    df = df[df["Category"] == "Televisions & Set Top Boxes"]
+    return _certifications(df, 'WiFi Alliance', **{
+        'Product': 'Product', 'Brand': 'Brand',
+        'Certification Date': 'Date of Last Certification', 'Product Type': 'Category'})
+
+
+CATEGORY_LABELS = {'imaging': 'Imaging', 'computers': 'Computers', 'televisions': 'Televisions'}
+
+IMAGING_EPEAT_TYPES = ["Multifunction Device", "Printer", "Copier", "Professional Imaging Product",
+                       "Digital Duplicator"]
+
+# MFi accessories listed under computer brands that are not computer accessories
+COMPUTER_MFI_EXCLUDE = ["Printer", "Ink", "OfficeJet Pro", "DeskJet", "Speaker", "Sprocket", "Headset", "Tango",
+                        "Boombox"]
+
+MFI_DISPLAY_COLUMNS = {
+    'upcEan': 'UPC',
+    'models': 'Models',
+    'brand': 'Brand',
+    'accessoryName': 'Accessory Name',
+    'accessoryCategory': 'Accessory Category',
+}
+
+
+def _newest_energy_star(df):
+    return df.sort_values('date_available_on_market', ascending=False)
+
+
+def _wifi_category(category):
+    def select(df):
+        df = df[df['Category'] == category]
+        return df.sort_values('Date of Last Certification', ascending=False)
+    return select
+
+
+def _bluetooth_companies(category):
+    def select(df):
+        return df[df['CompanyName'].isin(BLUETOOTH_COMPANIES[category])]
+    return select
+
+
+def _mfi_brands(category):
+    def select(df):
+        df = df[df['brand'].isin(MFI_BRANDS[category])]
+        return df.rename(columns=MFI_DISPLAY_COLUMNS).loc[:, list(MFI_DISPLAY_COLUMNS.values())]
+    return select
+
+
+def _imaging_epeat_raw(df):
+    return df[df['Product Type'].isin(IMAGING_EPEAT_TYPES)]
+
+
+def _computers_epeat_raw(df):
+    df = df[(df['Product Category'] == "Computers & Displays") & (df['Product Type'] != "Monitors")]
+    return df.sort_values('Registered On', ascending=False)
+
+
+def _computers_mfi_raw(df):
+    df = df[df['brand'].isin(MFI_BRANDS['computers'])]
+    df = df[~df['accessoryName'].str.contains('|'.join(COMPUTER_MFI_EXCLUDE), case=False, na=False)]
+    return df.rename(columns=MFI_DISPLAY_COLUMNS).loc[:, list(MFI_DISPLAY_COLUMNS.values())]
+
+
+# category -> Raw Data table -> (registry dataset, selection), in page order
+RAW_SOURCES = {
+    'imaging': {
+        'Energy Star': ('imaging', _newest_energy_star),
+        'EPEAT Registry': ('epeat', _imaging_epeat_raw),
+        'WiFi Alliance': ('wifi', _wifi_category('Computers & Accessories')),
+        'Bluetooth': ('bluetooth', _bluetooth_companies('imaging')),
+        'Apple MFI': ('mfi', _mfi_brands('imaging')),
+    },
+    'computers': {
+        'Energy Star': ('computers', _newest_energy_star),
+        'EPEAT Registry': ('epeat', _computers_epeat_raw),
+        'WiFi Alliance': ('wifi', _wifi_category('Computers & Accessories')),
+        'Bluetooth': ('bluetooth', _bluetooth_companies('computers')),
+        'Apple MFI': ('mfi', _computers_mfi_raw),
+    },
+    'televisions': {
+        'Energy Star': ('televisions', _newest_energy_star),
+        'WiFi Alliance': ('wifi', _wifi_category('Televisions & Set Top Boxes')),
+        'Bluetooth': ('bluetooth', _bluetooth_companies('televisions')),
+        'Apple MFI': ('mfi', _mfi_brands('televisions')),
+    },
+}
+
+
+def _flag_labels(column):
+    # Blank upstream means No, as on the Remanufactured filter
+    return lambda df: df[column].fillna(False).map({True: 'Yes', False: 'No'})
+
+
+def _epeat_status(df):
+    return pd.Series(np.where(df['Status'] == 'Active', 'Active', np.where(df['Status'] == False, 'NA', None)),
+                     index=df.index)
+
+
+_EPEAT_FACETS = {
+    'Product Type': 'Product Type',
+    'Manufacturer': 'Manufacturer',
+    'Status': _epeat_status,
+    'Registered In': 'Registered In',
+    'EPEAT Tier': 'EPEAT Tier',
+}
+
+_WIFI_FACETS = {'Category': 'Category', 'Brand': 'Brand'}
+
+_BLUETOOTH_FACETS = {'CompanyName': 'CompanyName'}
+
+# category -> Raw Data table -> facet -> column (or labelling function) behind its filters
+RAW_FACETS = {
+    'imaging': {
+        'Energy Star': {
+            'product_type': 'product_type',
+            'brand_name': 'brand_name',
+            'remanufactured_product': _flag_labels('remanufactured_product'),
+            'markets': MultiValued('markets'),
+            'color_capability': 'color_capability',
+        },
+        'EPEAT Registry': _EPEAT_FACETS,
+        'WiFi Alliance': _WIFI_FACETS,
+        'Bluetooth': _BLUETOOTH_FACETS,
+    },
+    'computers': {
+        'Energy Star': {
+            'type': 'type',
+            'brand_name': 'brand_name',
+            'markets': MultiValued('markets'),
+            'touch_screen': 'touch_screen',
+        },
+        'EPEAT Registry': _EPEAT_FACETS,
+        'WiFi Alliance': _WIFI_FACETS,
+        'Bluetooth': _BLUETOOTH_FACETS,
+    },
+    'televisions': {
+        'Energy Star': {
+            'product_type': 'product_type',
+            'brand_name': 'brand_name',
+            'markets': MultiValued('markets'),
+            'display_type': 'display_type',
+        },
+        'WiFi Alliance': _WIFI_FACETS,
+        'Bluetooth': _BLUETOOTH_FACETS,
+    },
+}
+
+# Brand filter and newest-first order of the Raw Placement Data page
+PLACEMENT_FACETS = {'Brand': 'Brand'}
+PLACEMENT_SORTS = ['Date Detected']
+
+# Raw Data table -> columns its "Sort by" / Newest-Oldest selectboxes order by
+RAW_SORTS = {
+    'Energy Star': ['date_qualified', 'date_available_on_market'],
+    'EPEAT Registry': ['Registered On'],
+    'WiFi Alliance': ['Date of Last Certification'],
+    'Bluetooth': ['ListingDate'],
+}
+
+# Cards on the Recent certification and placement pages
+RECENT_LIMIT = 20
+PLACEMENT_LIMIT = 5
+
+# Rows shown per table before "Show more" on the Raw Data search
+SEARCH_RESULTS_LIMIT = 25
+
+# Raw Data table -> (brand column, model number / product name columns) for fuzzy lookup
+MODEL_FIELDS = {
+    'Energy Star': ('brand_name', ['model_name', 'model_number']),
+    'EPEAT Registry': ('Manufacturer', ['Manufacturer Part Number', 'Product Name']),
+    'WiFi Alliance': ('Brand', ['Model Number', 'Product']),
+    'Bluetooth': ('CompanyName', ['Name']),
+    'Apple MFI': ('Brand', ['Models', 'Accessory Name']),
+}
+
+
+def _model_records(tables):
+    """One row per (dataset, row, model field) of ``{dataset: SearchTable}`` for ``TrigramIndex``."""
+    pieces = []
+    for dataset, table in tables.items():
+        frame = table.frame
+        brand, fields = MODEL_FIELDS[table.table]
+        for field in fields:
+            if field not in frame.columns:
+                continue
+            pieces.append(pd.DataFrame({
+                'Source': table.table,
+                'Brand': frame[brand].to_numpy() if brand in frame.columns else None,
+                'Field': field,
+                'value': frame[field].to_numpy(),
+                'dataset': dataset,
+                'row': range(len(frame)),
+            }))
+    records = pd.concat(pieces, ignore_index=True)
+    return records[records['value'].notna()].reset_index(drop=True)
+
+
+def _search_datasets():
+    return sorted({dataset for sources in RAW_SOURCES.values() for dataset, _ in sources.values()})
+
+
+# category -> source -> (registry dataset, normalizer)
+CERTIFICATION_SOURCES = {
+    'imaging': {
+        'energy_star': ('imaging', _imaging_energy_star),
+        'wifi': ('wifi', _imaging_wifi),
+        'epeat': ('epeat', _imaging_epeat),
+    },
+    'computers': {
+        'energy_star': ('computers', _computers_energy_star),
+        'epeat': ('epeat', _computers_epeat),
+        'wifi': ('wifi', _computers_wifi),
+        'tco': ('tco', _computers_tco),
+    },
+    'televisions': {
+        'energy_star': ('televisions', _televisions_energy_star),
+        'wifi': ('wifi', _televisions_wifi),
+    },
+}
+
+
+def _bluetooth_listings(category):
+    def normalize(df):
+        df = df[df['CompanyName'].isin(BLUETOOTH_COMPANIES[category])]
+        out = _certifications(df, 'Bluetooth', **{
+            'Product': 'Name', 'Brand': 'CompanyName', 'Certification Date': 'ListingDate'})
+        out['Product Type'] = 'Bluetooth'
+        return out
+    return normalize
+
+
+def _mfi_listings(category):
+    def normalize(df):
+        df = df[df['brand'].isin(MFI_BRANDS[category])]
+        return _certifications(df, 'Apple MFI', **{
+            'Product': 'accessoryName', 'Brand': 'brand', 'Product Type': 'accessoryCategory'})
+    return normalize
+
+
+# Sources only linked through the entity table, they are not shown on the Recent and Insights pages
+LISTING_SOURCES = {
+    category: {
+        'bluetooth': ('bluetooth', _bluetooth_listings(category)),
+        'mfi': ('mfi', _mfi_listings(category)),
+    } for category in BLUETOOTH_COMPANIES
+}
+
+
+def _entity_sources():
+    """``(category, source, dataset)`` for every source linked by the entity table."""
+    return [(category, source, dataset)
+            for sources in (CERTIFICATION_SOURCES, LISTING_SOURCES)
+            for category in sources
+            for source, (dataset, _) in sources[category].items()]
+
+
+class DerivedCache:
+    """Memoizes frames built from registry datasets, keyed by their versions."""
+
+    def __init__(self, registry):
+        self._registry = registry
+        self._frames = {}
+        self._locks = {}
+        self._guard = threading.Lock()
+
+    def memo(self, key, datasets, build, depends=()):
+        """Return ``build()`` for ``key``, rebuilt only when ``datasets`` or ``depends`` change.
+
+        Only the latest version of each key is kept, so superseded frames are
+        released as soon as their replacement is built.
+        """
+        versions = tuple(self._registry.version(name) for name in datasets) + tuple(depends)
+        cached = self._frames.get(key)
+        if cached is not None and cached[0] == versions:
+            return cached[1]
+        with self._guard:
+            lock = self._locks.setdefault(key, threading.Lock())
+        with lock:
+            cached = self._frames.get(key)
+            if cached is None or cached[0] != versions:
+                cached = (versions, build())
+                self._frames[key] = cached
+            return cached[1]
+
+    def certifications(self, category, source):
+        """Normalized ``CERTIFICATION_COLUMNS`` frame for one source of a category."""
+        sources = CERTIFICATION_SOURCES[category] if source in CERTIFICATION_SOURCES[category] \
+            else LISTING_SOURCES[category]
+        dataset, normalize = sources[source]
+
+        def build():
+            out = normalize(self._registry.get(dataset))
+            if 'Certification Date' not in out.columns:
+                out['Certification Date'] = pd.NaT
+            out['Product ID'] = product_ids(out['Brand'], out['Product'])
+            return out[CERTIFICATION_COLUMNS]
+
+        return self.memo(('certifications', category, source), [dataset], build)
+
+    def combined_certifications(self, category):
+        """Every source of ``category`` stacked, deduplicated and sorted newest first."""
+        sources = CERTIFICATION_SOURCES[category]
+        datasets = [dataset for dataset, _ in sources.values()]
+        # Fetch the inputs in parallel before ``memo`` asks for their versions
+        self._registry.prefetch(datasets)
+
+        def build():
+            # Every source's date is already a datetime64 column, parsed at ingest
+            combined = pd.concat([self.certifications(category, source) for source in sources],
+                                 ignore_index=True)
+            combined = combined.drop_duplicates()
+            combined = combined.sort_values(by='Certification Date', ascending=False)
+            return combined.reset_index(drop=True)
+
+        return self.memo(('combined_certifications', category), datasets, build)
+
+    def entity_table(self):
+        """``EntityTable`` of every certification and listing, across categories.
+
+        Each source is normalized and keyed on its own, so a reloaded dataset
+        only re-keys its own rows before the table is re-stacked.
+        """
+        entity_sources = _entity_sources()
+        datasets = sorted({dataset for _, _, dataset in entity_sources})
+        self._registry.prefetch(datasets)
+
+        def build():
+            records = pd.concat([self.certifications(category, source).assign(Category=category)
+                                 for category, source, _ in entity_sources], ignore_index=True)
+            # A product listed under two categories (WiFi, Bluetooth) is still one certification
+            records = records.drop_duplicates(subset=['Source', 'Product ID', 'Product', 'Certification Date'])
+            return EntityTable(records)
+
+        return self.memo(('entity_table',), datasets, build)
+
+    def recent_products(self, category, limit=RECENT_LIMIT):
+        """Newest ``limit`` distinct products of ``category``, one row each.
+
+        ``Also Listed By`` names the product's other sources once the entity
+        table has been built (by the warmer or the search page); the Recent page
+        never waits for every other category's datasets just for that line.
+        """
+        datasets = [dataset for dataset, _ in CERTIFICATION_SOURCES[category].values()]
+        self._registry.prefetch(datasets)
+        built, entities = self._built_entity_table()
+
+        def build():
+            recent = first_per_product(self.combined_certifications(category)).head(limit).copy()
+            if entities is None:
+                recent['Also Listed By'] = ''
+                return recent
+            recent['Also Listed By'] = [
+                ', '.join(s for s in entities.sources(product_id) if s != source)
+                if isinstance(product_id, str) else ''
+                for product_id, source in zip(recent['Product ID'], recent['Source'])]
+            return recent
+
+        return self.memo(('recent_products', category, limit), datasets, build, depends=(built,))
+
+    def _built_entity_table(self):
+        """(versions, EntityTable) of the last entity table built, (None, None) before the first."""
+        return self._frames.get(('entity_table',), (None, None))
+
+    def recent_cards(self, category):
+        """The Recent page's card grid as one HTML string, rebuilt only with its data."""
+        datasets = [dataset for dataset, _ in CERTIFICATION_SOURCES[category].values()]
+        self._registry.prefetch(datasets)
+        built, _ = self._built_entity_table()
+        return self.memo(('recent_cards', category), datasets,
+                         lambda: certification_cards(self.recent_products(category)), depends=(built,))
+
+    def placement_cards(self):
+        """Card grid of the latest placements, one per product."""
+        def build():
+            tracking = self._registry.get('tracking').drop_duplicates(subset="Product Name")
+            latest = tracking.sort_values(by='Date Detected', ascending=True).tail(PLACEMENT_LIMIT)
+            return placement_cards(latest.iloc[::-1])
+
+        return self.memo(('placement_cards',), ['tracking'], build)
+
+    def raw_sources(self, category):
+        """``{table: frame}`` for the Raw Data page of ``category``, before any user filter."""
+        sources = RAW_SOURCES[category]
+        datasets = [dataset for dataset, _ in sources.values()]
+        self._registry.prefetch(datasets)
+        return self.memo(('raw_sources', category), datasets, lambda: {
+            table: select(self._registry.get(dataset)) for table, (dataset, select) in sources.items()})
+
+    def facets(self, category, table):
+        """``FacetIndex`` over the ``RAW_FACETS`` and ``RAW_SORTS`` of one Raw Data table of ``category``."""
+        dataset, _ = RAW_SOURCES[category][table]
+        return self.memo(('facets', category, table), [dataset],
+                         lambda: FacetIndex(self.raw_sources(category)[table], RAW_FACETS[category][table],
+                                            sorts=RAW_SORTS.get(table, ())))
+
+    def placement_facets(self):
+        """``FacetIndex`` over the placements shown on the Raw Placement Data page."""
+        return self.memo(('placement_facets',), ['combined_products'],
+                         lambda: FacetIndex(self._registry.get('combined_products'), PLACEMENT_FACETS,
+                                            sorts=PLACEMENT_SORTS))
+
+    def search_tables(self):
+        """``{dataset: SearchTable}`` behind every search, shared by all categories."""
+        datasets = _search_datasets()
+
+        def build():
+            members = {}
+            for category, sources in RAW_SOURCES.items():
+                frames = self.raw_sources(category)
+                for table, (dataset, _) in sources.items():
+                    members.setdefault(dataset, (table, []))[1].append((category, frames[table]))
+            tables = {}
+            for dataset, (table, frames) in members.items():
+                # Selections keep the registry's row labels, so shared rows collapse to one
+                union = pd.concat([frame for _, frame in frames])
+                union = union[~union.index.duplicated()]
+                masks = {category: union.index.isin(frame.index) for category, frame in frames}
+                tables[dataset] = SearchTable(table, union, TokenIndex(union), masks)
+            return tables
+
+        return self.memo(('search_tables',), datasets, build)
+
+    def model_index(self):
+        """``(TrigramIndex, {category: record mask})`` over the model fields of ``search_tables``."""
+        datasets = _search_datasets()
+
+        def build():
+            tables = self.search_tables()
+            records = _model_records(tables)
+            masks = {}
+            for category in RAW_SOURCES:
+                mask = np.zeros(len(records), dtype=bool)
+                for dataset, table in tables.items():
+                    selected = (records['dataset'] == dataset).to_numpy()
+                    if category in table.categories:
+                        mask[selected] = table.categories[category][records['row'].to_numpy()[selected]]
+                masks[category] = mask
+            return TrigramIndex(records), masks
+
+        return self.memo(('model_index',), datasets, build)
+
+    def warm(self):
+        """Build every derived frame ahead of the first request for it."""
+        for category in CERTIFICATION_SOURCES:
+            self.combined_certifications(category)
+            for table in RAW_FACETS[category]:
+                self.facets(category, table)
+        self.entity_table()
+        # After the entity table, so the cards come out with "Also Listed By"
+        for category in CERTIFICATION_SOURCES:
+            self.recent_cards(category)
+        self.model_index()
+
+
+@st.cache_resource
+def get_derived():
+    return DerivedCache(get_registry())
+
+
+def combined_certifications(category):
+    """Shared, read-only combined certifications frame for ``category``."""
+    return get_derived().combined_certifications(category)
+
+
+def entity_table():
+    """Shared ``EntityTable`` linking every source's records by ``Product ID``."""
+    return get_derived().entity_table()
+
+
+def recent_cards(category):
+    """Card grid HTML of the Recent page of ``category``."""
+    return get_derived().recent_cards(category)
+
+
+def recent_placement_cards():
+    """Card grid HTML of the Recent Placements page."""
+    return get_derived().placement_cards()
+
+
+def raw_sources(category):
+    """Shared, read-only Raw Data tables for ``category``."""
+    return get_derived().raw_sources(category)
+
+
+def raw_facets(category):
+    """``{table: FacetIndex}`` behind the filters of ``category``'s Raw Data page."""
+    derived = get_derived()
+    return {table: derived.facets(category, table) for table in RAW_FACETS[category]}
+
+
+def placement_facets():
+    """``FacetIndex`` behind the brand filter of the Raw Placement Data page."""
+    return get_derived().placement_facets()
+
+
+def search_raw_sources(category, query, limit=SEARCH_RESULTS_LIMIT):
+    """``{table: (match count, best rows)}`` for every Raw Data table of ``category`` with a hit.
+
+    Only the top ``limit`` rows of each table are materialized.
+    """
+    tables = get_derived().search_tables()
+    results = {}
+    for table, (dataset, _) in RAW_SOURCES[category].items():
+        rows = tables[dataset].search(query, [category])
+        if len(rows):
+            results[table] = (len(rows), tables[dataset].frame.iloc[rows[:limit]])
+    return results
+
+
+def search_everything(query, categories=None, limit=SEARCH_RESULTS_LIMIT):
+    """Global search over every category's Raw Data tables.
+
+    Returns ``({label: (match count, best rows)}, {category: match count})``.
+    ``categories`` narrows the tables' matches; the per-category counts are
+    taken before that filter so they can label the category facet.
+    """
+    results = {}
+    facet_counts = {category: 0 for category in RAW_SOURCES}
+    for dataset, table in get_derived().search_tables().items():
+        rows = table.search(query)
+        for category, count in table.category_counts(rows).items():
+            facet_counts[category] += count
+        if categories is not None:
+            rows = rows[table.mask(categories)[rows]]
+        if len(rows):
+            label = table.table
+            if table.table == 'Energy Star':
+                label = f"Energy Star ({CATEGORY_LABELS[dataset]})"
+            results[label] = (len(rows), table.frame.iloc[rows[:limit]])
+    return results, facet_counts
+
+
+def search_models(query, categories=None, limit=20):
+    """Best fuzzy model-number matches for ``query``, optionally within ``categories``."""
+    index, masks = get_derived().model_index()
+    allowed = None
+    if categories is not None:
+        allowed = np.zeros(len(index.records), dtype=bool)
+        for category in categories:
+            allowed |= masks[category]
+    # Over-fetch, a row can match through more than one of its fields
+    matches = index.search(query, limit=limit * 2, allowed=allowed)
+    matches = matches.drop_duplicates(subset=['dataset', 'row']).head(limit)
+    return matches.rename(columns={'value': 'Match', 'score': 'Score'}).drop(columns=['dataset', 'row'])
@@ -0,0 +1,56 @@
+"""Local columnar tier between the in-memory registry and S3.
+
+Every object the registry parses is also written as an Arrow IPC (Feather)
+file next to a small JSON file holding the upstream version stamp. After a
+restart, or on a new replica, objects whose stamp has not changed are read
+back memory-mapped instead of being downloaded and CSV/JSON-parsed again.
+"""
+import json
+import logging
+import os
+
+import pyarrow as pa
+import pyarrow.feather as feather
+
+logger = logging.getLogger(__name__)
+
+
+class ColumnarCache:
+    def __init__(self, root):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+
+    def _paths(self, name):
+        base = os.path.join(self.root, name)
+        return f"{base}.arrow", f"{base}.json"
+
+    def load(self, name, stamp):
+        """Cached frame for ``name`` if it was stored under ``stamp``, else None."""
+        data_path, meta_path = self._paths(name)
+        try:
+            with open(meta_path) as f:
+                if json.load(f).get("stamp") != stamp:
+                    return None
+            return feather.read_table(data_path, memory_map=True).to_pandas()
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, pa.ArrowException) as e:
+            # Truncated or corrupt files only; anything else is a bug and should surface
+            logger.warning("Ignoring unreadable cache for %s: %s", name, e)
+            return None
+
+    def store(self, name, stamp, frame):
+        data_path, meta_path = self._paths(name)
+        try:
+            # Drop the old stamp first, then write through temp files and rename,
+            # so a reader never pairs a stamp with the wrong data
+            if os.path.exists(meta_path):
+                os.remove(meta_path)
+            frame.reset_index(drop=True).to_feather(f"{data_path}.tmp")
+            os.replace(f"{data_path}.tmp", data_path)
+            with open(f"{meta_path}.tmp", "w") as f:
+                json.dump({"stamp": stamp, "rows": len(frame)}, f)
+            os.replace(f"{meta_path}.tmp", meta_path)
+        except Exception as e:
+            # Mixed-type object columns cannot always be expressed in Arrow; keep it memory-only
+            logger.warning("Not caching %s on disk: %s", name, e)
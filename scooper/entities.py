@@ -0,0 +1,94 @@
+"""Links certification records from different sources to one product.
+
+Energy Star, EPEAT, WiFi Alliance and TCO list the same product under
+different brand spellings ("HP Inc." / "HP", "Seiko Epson Corporation" /
+"EPSON") and differently punctuated model names. Every record gets a
+``Product ID`` built from a normalized brand key and model key, so records of
+one product share an id that stays stable across data refreshes.
+"""
+import re
+
+import pandas as pd
+
+from scooper.search import normalize_model
+
+# Trailing words dropped from brand names before comparing them
+LEGAL_SUFFIXES = {'inc', 'incorporated', 'corp', 'corporation', 'co', 'company', 'ltd', 'limited', 'llc', 'plc',
+                  'pte', 'gmbh', 'ag', 'sa', 'group', 'holdings'}
+
+# Brand keys (after suffix removal) that name the same manufacturer
+BRAND_ALIASES = {
+    'hp inc': 'hp',
+    'seiko epson': 'epson',
+    'brother industries': 'brother',
+    'canon marketing japan': 'canon',
+    'zhuhai pantum electronics': 'pantum',
+    'lenovo singapore': 'lenovo',
+    'dell computer': 'dell',
+    'dell technologies': 'dell',
+    'asustek computer': 'asus',
+    'micro star international': 'msi',
+    'fujitsu client computing': 'fujitsu',
+    'nec personal computers': 'nec',
+    'huawei technologies': 'huawei',
+    'lg electronics': 'lg',
+    'samsung electronics': 'samsung',
+    'hisense visual technology': 'hisense',
+    'tcl communication': 'tcl',
+    'sony corperation': 'sony',
+}
+
+
+def brand_key(brand):
+    """Canonical lower-case brand: "Seiko Epson Corporation" -> "epson"."""
+    words = re.findall(r'[0-9a-z]+', str(brand).lower())
+    while len(words) > 1 and words[-1] in LEGAL_SUFFIXES:
+        words.pop()
+    key = ' '.join(words)
+    return BRAND_ALIASES.get(key, key)
+
+
+def model_key(model, brand):
+    """Normalized model with a leading brand name removed: ("HP LaserJet M428", "hp") -> "laserjetm428"."""
+    key = normalize_model(model)
+    prefix = brand.replace(' ', '')
+    if prefix and key.startswith(prefix) and len(key) - len(prefix) >= 3:
+        key = key[len(prefix):]
+    return key
+
+
+def product_ids(brands, models):
+    """``Product ID`` for each (brand, model) pair, as a Series aligned with ``brands``."""
+    # Few distinct brands, so normalize each spelling once
+    brand_keys = brands.map({brand: brand_key(brand) for brand in brands.dropna().unique()}).fillna('')
+    model_keys = [model_key(model, brand) if pd.notna(model) else ''
+                  for model, brand in zip(models, brand_keys)]
+    ids = [f"{brand}:{model}" if model else None for brand, model in zip(brand_keys, model_keys)]
+    return pd.Series(ids, index=brands.index, dtype=object)
+
+
+def first_per_product(frame, by=('Product ID',)):
+    """Keep the first row of each product (per ``by``), plus rows without a ``Product ID``."""
+    return frame[~frame.duplicated(subset=list(by)) | frame['Product ID'].isna()]
+
+
+class EntityTable:
+    """Every certification record, grouped by ``Product ID`` for O(1) lookup."""
+
+    def __init__(self, records):
+        self.records = records.reset_index(drop=True)
+        # Product ID -> positions of its records
+        self._members = self.records.dropna(subset=['Product ID']).groupby('Product ID').indices
+
+    def __len__(self):
+        return len(self._members)
+
+    def certifications(self, product_id):
+        """Every record of ``product_id`` across sources and categories."""
+        rows = self._members.get(product_id)
+        if rows is None:
+            return self.records.iloc[0:0]
+        return self.records.iloc[rows]
+
+    def sources(self, product_id):
+        return sorted(self.certifications(product_id)['Source'].unique())
@@ -0,0 +1,132 @@
+"""Precomputed indexes behind the Raw Data filters.
+
+Energy Star lists every market a model is sold in as one comma separated
+string ("United States, Canada, Japan"). ``MultiHotIndex`` splits such a column
+once per data version into a rows x values boolean matrix, so the options of a
+filter are the sorted ``values`` and each value's rows are one matrix column
+instead of a per-row split.
+
+``FacetIndex`` keeps one packed row bitmap per value of every filter of a
+table. Any combination of selections is the AND of their bitmaps, and the
+options left for a dropdown are the values whose bitmap still overlaps it, so
+the cascading selectboxes never touch the frame until the final rows are taken.
+It also keeps the row order of each sortable column, so a sorted view is that
+order with the unselected rows dropped rather than a fresh sort, and callers
+take only the rows they show from those positions.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+# Set bits in each byte value, to count the rows of a packed bitmap
+_POPCOUNT = np.array([bin(byte).count('1') for byte in range(256)], dtype=np.int64)
+
+
+class MultiHotIndex:
+    """Boolean matrix of which ``sep`` separated values each row of ``series`` holds."""
+
+    def __init__(self, series, sep=','):
+        self.index = series.index
+        values = series.reset_index(drop=True).dropna().astype(str).str.split(sep).explode().str.strip()
+        values = values[values != '']
+        codes, uniques = pd.factorize(values, sort=True)
+        self.values = list(uniques)
+        # Column-major so each value's rows are one contiguous slice
+        self.matrix = np.zeros((len(series), len(self.values)), dtype=bool, order='F')
+        self.matrix[values.index.to_numpy(), codes] = True
+
+
+@dataclass(frozen=True)
+class MultiValued:
+    """Facet over a column holding several ``sep`` separated values per row."""
+    column: str
+    sep: str = ','
+
+
+class FacetIndex:
+    """Packed row bitmaps per (facet, value) of ``frame``.
+
+    ``facets`` maps each facet to a column name, a ``MultiValued`` column or a
+    function of the frame returning one label per row (None for no label).
+    Single-valued facets list their values in frame order, like ``unique()``;
+    multi-valued ones sorted. ``sorts`` names the columns ``select`` can sort by.
+    """
+
+    def __init__(self, frame, facets, sorts=()):
+        self.frame = frame
+        self.size = len(frame)
+        self.values = {}
+        self.bitmaps = {}
+        self._positions = {}
+        for facet, spec in facets.items():
+            if isinstance(spec, MultiValued):
+                hot = MultiHotIndex(frame[spec.column], spec.sep)
+                values = hot.values
+                bitmaps = np.packbits(hot.matrix.T, axis=1)
+            else:
+                labels = frame[spec] if isinstance(spec, str) else spec(frame)
+                codes, uniques = pd.factorize(labels.to_numpy())
+                values = list(uniques)
+                bitmaps = np.array([np.packbits(codes == code) for code in range(len(values))], dtype=np.uint8)
+                bitmaps = bitmaps.reshape(len(values), (self.size + 7) // 8)
+            self.values[facet] = values
+            self.bitmaps[facet] = bitmaps
+            self._positions[facet] = {value: i for i, value in enumerate(values)}
+        # column -> ascending -> row positions in that order, blanks last as in sort_values
+        self._orders = {}
+        for column in sorts:
+            values = frame[column].reset_index(drop=True)
+            self._orders[column] = {ascending: values.sort_values(ascending=ascending, kind='stable').index.to_numpy()
+                                    for ascending in (True, False)}
+
+    def bitmap(self, selections):
+        """Packed bitmap of the rows matching every selection, None when nothing is selected.
+
+        ``selections`` maps facets to a value, 'any' leaves a facet unfiltered.
+        """
+        bits = None
+        for facet, value in selections.items():
+            if value == 'any':
+                continue
+            position = self._positions[facet].get(value)
+            if position is None:
+                # A value from a stale selection matches nothing
+                bits = np.zeros((self.size + 7) // 8, dtype=np.uint8)
+                continue
+            value_bits = self.bitmaps[facet][position]
+            bits = value_bits.copy() if bits is None else np.bitwise_and(bits, value_bits, out=bits)
+        return bits
+
+    def counts(self, facet, selections):
+        """``{value: rows}`` of ``facet`` among the rows matching ``selections``, empty values left out."""
+        bits = self.bitmap(selections)
+        bitmaps = self.bitmaps[facet]
+        if bits is not None:
+            bitmaps = bitmaps & bits
+        counts = _POPCOUNT[bitmaps].sum(axis=1)
+        return {value: int(count) for value, count in zip(self.values[facet], counts) if count}
+
+    def count(self, selections):
+        """Rows matching ``selections``."""
+        bits = self.bitmap(selections)
+        return self.size if bits is None else int(_POPCOUNT[bits].sum())
+
+    def options(self, facet, selections):
+        """'any' plus the values of ``facet`` left by ``selections``."""
+        return ['any'] + list(self.counts(facet, selections))
+
+    def select(self, selections, sort=None, ascending=True):
+        """Positions of the rows of ``frame`` matching ``selections``, in frame order or ordered by ``sort``.
+
+        Nothing is copied: ``frame.iloc`` of a slice of them takes just the rows shown.
+        """
+        bits = self.bitmap(selections)
+        if sort is None:
+            if bits is None:
+                return np.arange(self.size)
+            return np.flatnonzero(np.unpackbits(bits, count=self.size))
+        order = self._orders[sort][ascending]
+        if bits is not None:
+            order = order[np.unpackbits(bits, count=self.size).astype(bool)[order]]
+        return order
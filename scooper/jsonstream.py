@@ -0,0 +1,53 @@
+"""Record-at-a-time reader for the large JSON listings.
+
+``bluetooth.json`` and ``mfi.json`` hold every listing from every manufacturer,
+but the app keeps only a few brands and a few fields of each. Reading them
+through ``ijson`` applies the schema's brand predicate and field projection
+while parsing, so memory grows with the rows kept rather than the whole file.
+Without ``ijson`` installed the same filtering runs after a plain ``json.load``.
+"""
+import json
+
+import pandas as pd
+
+from scooper.schemas import apply_types
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+def iter_items(f, prefix="item"):
+    """Yield the elements of the array at ``prefix`` (ijson syntax) one by one."""
+    if ijson is not None:
+        yield from ijson.items(f, prefix, use_float=True)
+        return
+    data = json.load(f)
+    for key in prefix.split(".")[:-1]:
+        data = data.get(key, []) if isinstance(data, dict) else []
+    yield from data
+
+
+def read_records(f, schema=None, prefix="item"):
+    """DataFrame of the dict records at ``prefix`` that pass ``schema.where``."""
+    rows = []
+    for item in iter_items(f, prefix):
+        # The changelogs mix bookkeeping entries in with the records, keep only the dicts
+        if not isinstance(item, dict):
+            continue
+        if schema is None:
+            rows.append(item)
+            continue
+        if any(item.get(column) not in allowed for column, allowed in schema.where.items()):
+            continue
+        if schema.columns:
+            item = {column: item[column] for column in schema.columns if column in item}
+        rows.append(item)
+    frame = pd.json_normalize(rows)
+    if schema is None:
+        return frame
+    if frame.empty and schema.columns:
+        # Keep the expected columns so the pages can still select from an empty frame
+        frame = pd.DataFrame(columns=list(schema.columns))
+    return apply_types(frame, schema)
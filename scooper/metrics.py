@@ -0,0 +1,190 @@
+"""Timings and sizes for every dataset the registry hands out.
+
+The registry reports one ``LoadEvent`` per request for a dataset: whether it was
+served from memory (``hit``), kept after an ETag check (``revalidated``), read
+back from the local Arrow cache (``disk``) or downloaded (``miss``), along with
+download and parse time, bytes read, shape and in-memory size. Events raised
+while a page renders are grouped under that page. Everything is kept in memory
+for the admin panel and appended to a JSON-lines log.
+
+Configured from the ``[metrics]`` section of the secrets file::
+
+    [metrics]
+    admins = ["matt"]
+    log_path = "logs/data-loads.jsonl"   # "" disables the log
+    history = 500
+"""
+import contextvars
+import dataclasses
+import io
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Optional
+
+import pandas as pd
+import streamlit as st
+
+from scooper.config import settings
+
+DEFAULT_LOG_PATH = os.path.join("logs", "data-loads.jsonl")
+
+logger = logging.getLogger(__name__)
+
+# PageLoad collecting the events of the page rendering in this context, if any
+_current_page = contextvars.ContextVar("scooper_current_page", default=None)
+
+
+@dataclass
+class LoadEvent:
+    dataset: str
+    # hit, revalidated, disk or miss
+    outcome: str
+    seconds: float
+    download_seconds: float = 0.0
+    parse_seconds: float = 0.0
+    bytes: int = 0
+    rows: int = 0
+    columns: int = 0
+    memory_bytes: int = 0
+    page: Optional[str] = None
+    at: float = field(default_factory=time.time)
+
+
+@dataclass
+class PageLoad:
+    page: Optional[str] = None
+    seconds: float = 0.0
+    events: list = field(default_factory=list)
+    at: float = field(default_factory=time.time)
+
+    def count(self, outcome):
+        return sum(event.outcome == outcome for event in self.events)
+
+
+class MeteredReader(io.RawIOBase):
+    """Counts the bytes read from ``f`` and the time spent waiting for them.
+
+    Wrap it in ``io.BufferedReader`` so parsers see an ordinary binary file.
+    Time outside ``readinto`` is the parser's own.
+    """
+
+    def __init__(self, f):
+        self._f = f
+        self.bytes = 0
+        self.seconds = 0.0
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        start = time.perf_counter()
+        data = self._f.read(len(buffer))
+        self.seconds += time.perf_counter() - start
+        n = len(data)
+        buffer[:n] = data
+        self.bytes += n
+        return n
+
+
+def frame_stats(frame):
+    """Rows, columns and deep in-memory size of ``frame``."""
+    rows, columns = frame.shape
+    return rows, columns, int(frame.memory_usage(deep=True).sum())
+
+
+class LoadMetrics:
+    def __init__(self, log_path=None, history=500):
+        self.log_path = log_path
+        self.events = deque(maxlen=history)
+        self.pages = deque(maxlen=history)
+        self._lock = threading.Lock()
+
+    def record(self, event):
+        page = _current_page.get()
+        if page is not None:
+            # Published with the page once it has finished rendering
+            page.events.append(event)
+        else:
+            self._publish([event])
+
+    @contextmanager
+    def page(self, label):
+        """Group the loads made inside the block under one page.
+
+        ``label`` is called on exit, after the page's own navigation buttons
+        have updated the session state.
+        """
+        page = PageLoad()
+        token = _current_page.set(page)
+        start = time.perf_counter()
+        try:
+            yield page
+        finally:
+            page.seconds = time.perf_counter() - start
+            _current_page.reset(token)
+            page.page = label()
+            for event in page.events:
+                event.page = page.page
+            with self._lock:
+                self.pages.append(page)
+            self._publish(page.events, page)
+
+    def summary(self):
+        """One row per dataset: outcome counts plus the latest load's stats."""
+        with self._lock:
+            events = list(self.events)
+        if not events:
+            return pd.DataFrame()
+        frame = pd.DataFrame([dataclasses.asdict(event) for event in events])
+        counts = pd.crosstab(frame['dataset'], frame['outcome'])
+        loads = frame[frame['outcome'].isin(['miss', 'disk'])].groupby('dataset').last()
+        loads = loads[['download_seconds', 'parse_seconds', 'bytes', 'rows', 'columns', 'memory_bytes']]
+        return counts.join(loads, how='left')
+
+    def page_summary(self):
+        with self._lock:
+            pages = list(self.pages)
+        return pd.DataFrame([{
+            'Page': page.page,
+            'Seconds': round(page.seconds, 3),
+            'Hits': page.count('hit'),
+            'Revalidated': page.count('revalidated'),
+            'Disk': page.count('disk'),
+            'Misses': page.count('miss'),
+            'At': pd.Timestamp(page.at, unit='s'),
+        } for page in reversed(pages)])
+
+    def _publish(self, events, page=None):
+        with self._lock:
+            self.events.extend(events)
+        if not self.log_path:
+            return
+        lines = [json.dumps(dict(dataclasses.asdict(event), type="load")) for event in events]
+        if page is not None:
+            lines.append(json.dumps({"type": "page", "page": page.page, "seconds": page.seconds,
+                                     "loads": len(page.events), "misses": page.count('miss'), "at": page.at}))
+        try:
+            directory = os.path.dirname(self.log_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with self._lock, open(self.log_path, "a") as f:
+                f.write("".join(line + "\n" for line in lines))
+        except OSError as e:
+            logger.warning("Could not write load metrics to %s: %s", self.log_path, e)
+
+
+@st.cache_resource
+def get_metrics():
+    config = settings("metrics")
+    return LoadMetrics(log_path=config.get("log_path", DEFAULT_LOG_PATH),
+                       history=config.get("history", 500))
+
+
+def is_admin(username):
+    return username is not None and username in settings("metrics").get("admins", [])
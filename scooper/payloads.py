@@ -0,0 +1,75 @@
+"""Arrow tables of the table pages the dashboard has shown, reused across reruns.
+
+Changing one filter on a Raw Data page reruns the whole script, and every
+table on it used to be converted from pandas to Arrow again even though only
+one of them changed. ``PayloadCache`` keeps each page as a ``pyarrow.Table``
+keyed by the versions of the datasets it came from and the state that picked
+its rows (filters, sort, page). An unchanged table hands ``st.dataframe`` the
+Arrow table built the first time it was shown, so the page is neither rebuilt
+nor converted from pandas again.
+"""
+import threading
+from collections import OrderedDict
+
+import pyarrow as pa
+import streamlit as st
+
+from scooper.registry import get_registry
+
+# Pages are small; this holds thousands of them across every session
+DEFAULT_MAX_BYTES = 128 * 1024 * 1024
+
+
+def _to_arrow(frame):
+    try:
+        return pa.Table.from_pandas(frame)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Mixed-type object columns; st.dataframe has its own fallbacks for these
+        return frame
+
+
+def _size(payload):
+    if isinstance(payload, pa.Table):
+        return payload.nbytes
+    return int(payload.memory_usage(deep=True).sum())
+
+
+class PayloadCache:
+    """Least recently used Arrow tables, up to ``max_bytes`` in total."""
+
+    def __init__(self, registry, max_bytes=DEFAULT_MAX_BYTES):
+        self._registry = registry
+        self.max_bytes = max_bytes
+        # key -> (payload, bytes)
+        self._payloads = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def table(self, name, datasets, state, build):
+        """Arrow table of ``build()`` (a DataFrame) for table ``name`` in ``state``.
+
+        Rebuilt only when ``datasets`` change version or the table is shown in a
+        state not seen recently, so ``state`` must determine the rows completely.
+        """
+        key = (name, tuple(self._registry.version(dataset) for dataset in datasets), repr(state))
+        with self._lock:
+            cached = self._payloads.get(key)
+            if cached is not None:
+                self._payloads.move_to_end(key)
+                return cached[0]
+        payload = _to_arrow(build())
+        with self._lock:
+            if key not in self._payloads:
+                size = _size(payload)
+                self._payloads[key] = (payload, size)
+                self._bytes += size
+                # Superseded versions are never asked for again and age out first
+                while self._bytes > self.max_bytes and len(self._payloads) > 1:
+                    _, (_, size) = self._payloads.popitem(last=False)
+                    self._bytes -= size
+        return payload
+
+
+@st.cache_resource
+def get_payloads():
+    return PayloadCache(get_registry())
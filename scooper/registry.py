@@ -0,0 +1,272 @@
+"""Shared registry for the scoops-finder datasets.
+
+Every page used to open its own S3 connection and ``conn.read`` the objects it
+needed. The registry owns a single storage backend (``scooper.backends``) and
+keeps one parsed DataFrame per object, which is handed to every page and every session. Frames returned by the
+registry are shared, so callers must treat them as read-only and copy before
+mutating.
+
+Parsed objects are also kept in a local Arrow cache (see ``scooper.diskcache``)
+so a restarted server only downloads what changed upstream. Configured from the
+``[data]`` section of the secrets file::
+
+    [data]
+    disk_cache = true
+    cache_dir = "~/.cache/scooper"
+"""
+import contextvars
+import io
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import pandas as pd
+import streamlit as st
+
+from scooper import jsonstream, schemas
+from scooper.backends import make_backend
+from scooper.config import settings
+from scooper.diskcache import ColumnarCache
+from scooper.metrics import LoadEvent, MeteredReader, frame_stats, get_metrics
+
+BUCKET = "scoops-finder"
+
+# Same freshness window as the old ``conn.read(..., ttl=600)`` calls
+DEFAULT_TTL = 600
+
+# Local columnar copies survive restarts here unless [data] cache_dir says otherwise
+DEFAULT_CACHE_DIR = "~/.cache/scooper"
+
+# Bump whenever a parser or read schema changes so local copies written by
+# older code are not served under an unchanged upstream stamp
+PARSER_VERSION = 4
+
+# Upper bound on concurrent downloads when a page prefetches its datasets
+PREFETCH_WORKERS = 8
+
+
+def _parse_csv(f, schema=None):
+    return schemas.read_csv(f, schema)
+
+
+def _parse_records(f, schema=None):
+    return jsonstream.read_records(f, schema)
+
+
+def _parse_mfi(f, schema=None):
+    return jsonstream.read_records(f, schema, prefix="content.item")
+
+
+def _parse_tco(f, schema=None):
+    frame = pd.DataFrame(json.load(f))
+    return schemas.apply_types(frame, schema) if schema is not None else frame
+
+
+@dataclass(frozen=True)
+class Dataset:
+    name: str
+    key: str
+    parse: Callable
+    # Column subset and types handed to ``parse``, None reads everything as-is
+    schema: Optional[schemas.ReadSchema] = None
+
+    @property
+    def path(self):
+        return f"{BUCKET}/{self.key}"
+
+
+DATASETS = {dataset.name: dataset for dataset in [
+    Dataset("imaging", "imaging-data.csv", _parse_csv, schemas.IMAGING),
+    Dataset("computers", "computers-data.csv", _parse_csv, schemas.COMPUTERS),
+    Dataset("televisions", "televisions-data.csv", _parse_csv, schemas.TELEVISIONS),
+    Dataset("wifi", "baseline3.csv", _parse_csv, schemas.WIFI),
+    Dataset("epeat", "baseline4.csv", _parse_csv, schemas.EPEAT),
+    Dataset("bluetooth", "bluetooth.json", _parse_records, schemas.BLUETOOTH),
+    Dataset("mfi", "mfi.json", _parse_mfi, schemas.MFI),
+    Dataset("tco", "tco_data.json", _parse_tco, schemas.TCO),
+    Dataset("imaging_changelog", "imaging-changelog.csv", _parse_csv, schemas.ENERGY_STAR_CHANGELOG),
+    Dataset("computers_changelog", "computers-changelog.csv", _parse_csv, schemas.ENERGY_STAR_CHANGELOG),
+    Dataset("televisions_changelog", "televisions-changelog.csv", _parse_csv, schemas.ENERGY_STAR_CHANGELOG),
+    Dataset("epeat_changelog", "changelog-epeat.csv", _parse_csv, schemas.EPEAT_CHANGELOG),
+    Dataset("wifi_changelog", "changelog-wifi.csv", _parse_csv, schemas.WIFI_CHANGELOG),
+    Dataset("bluetooth_changelog", "changelog-bluetooth.json", _parse_records, schemas.BLUETOOTH_CHANGELOG),
+    Dataset("mfi_changelog", "changelog-mfi.json", _parse_records, schemas.MFI_CHANGELOG),
+    Dataset("tracking", "tracking.csv", _parse_csv, schemas.PLACEMENTS),
+    Dataset("brand_counts", "brand_counts.csv", _parse_csv),
+    Dataset("combined_products", "combined_products.csv", _parse_csv, schemas.PLACEMENTS),
+]}
+
+
+@dataclass
+class _Entry:
+    frame: pd.DataFrame
+    version: str
+    # Upstream ETag / last-modified stamp, None when the backend could not say
+    stamp: str
+    checked_at: float
+
+
+class DatasetRegistry:
+    """Loads each dataset at most once per TTL window and shares the result.
+
+    With ``revalidate`` on, an expired entry first asks the backend for the
+    object's ETag (or last-modified time) and keeps the parsed frame when it has
+    not changed. The scraper only rewrites the bucket once a day, so most TTL
+    cycles cost a metadata call instead of a full download and parse.
+    """
+
+    def __init__(self, backend, ttl=DEFAULT_TTL, revalidate=True, disk_cache=None, metrics=None):
+        # Anything with open()/info(), see scooper.backends
+        self._backend = backend
+        self.ttl = ttl
+        self.revalidate = revalidate
+        # Optional ColumnarCache consulted before going back to the bucket
+        self.disk_cache = disk_cache
+        # Optional LoadMetrics told about every hit, revalidation and load
+        self.metrics = metrics
+        self._entries = {}
+        # One lock per dataset so concurrent sessions wait for a single download
+        self._locks = {name: threading.Lock() for name in DATASETS}
+
+    def get(self, name):
+        return self._entry(name, count_hit=True).frame
+
+    def prefetch(self, names):
+        """Load ``names`` concurrently and return them as a ``{name: frame}`` dict.
+
+        Cold-cache latency becomes roughly that of the slowest object instead of
+        the sum of all of them. Datasets that are already fresh return at once.
+        """
+        names = list(dict.fromkeys(names))
+        missing = [name for name in names
+                   if name not in self._entries or self._expired(self._entries[name])]
+        if len(missing) > 1:
+            with ThreadPoolExecutor(max_workers=min(PREFETCH_WORKERS, len(missing))) as pool:
+                # Copy the context so loads are still attributed to the calling page;
+                # result() re-raises the first loader error in the calling thread
+                futures = [pool.submit(contextvars.copy_context().run, self._entry, name) for name in missing]
+                for future in futures:
+                    future.result()
+        return {name: self.get(name) for name in names}
+
+    def refresh(self, names=None):
+        """Revalidate ``names`` (default: every dataset) now, ignoring the TTL."""
+        names = list(names or DATASETS)
+        with ThreadPoolExecutor(max_workers=min(PREFETCH_WORKERS, len(names))) as pool:
+            list(pool.map(self._force_refresh, names))
+
+    def version(self, name):
+        """Opaque token that changes whenever the contents of ``name`` change."""
+        return self._entry(name).version
+
+    def invalidate(self, name=None):
+        names = [name] if name else list(DATASETS)
+        for n in names:
+            with self._locks[n]:
+                self._entries.pop(n, None)
+
+    def _entry(self, name, count_hit=False):
+        dataset = DATASETS[name]
+        entry = self._entries.get(name)
+        if entry is not None and not self._expired(entry):
+            if count_hit:
+                self._record(name, "hit", 0.0)
+            return entry
+        start = time.perf_counter()
+        with self._locks[name]:
+            # Another session may have refreshed it while we were waiting
+            entry = self._entries.get(name)
+            if entry is None or self._expired(entry):
+                entry = self._refresh(dataset, entry)
+                self._entries[name] = entry
+            elif count_hit:
+                self._record(name, "hit", time.perf_counter() - start)
+            return entry
+
+    def _force_refresh(self, name):
+        with self._locks[name]:
+            self._entries[name] = self._refresh(DATASETS[name], self._entries.get(name))
+
+    def _expired(self, entry):
+        return time.time() - entry.checked_at > self.ttl
+
+    def _refresh(self, dataset, entry):
+        start = time.perf_counter()
+        stamp = self._stamp(dataset) if self.revalidate or self.disk_cache is not None else None
+        if self.revalidate and entry is not None and stamp is not None and stamp == entry.stamp:
+            entry.checked_at = time.time()
+            self._record(dataset.name, "revalidated", time.perf_counter() - start)
+            return entry
+        if self.disk_cache is not None and stamp is not None:
+            read_start = time.perf_counter()
+            frame = self.disk_cache.load(dataset.name, f"{PARSER_VERSION}:{stamp}")
+            if frame is not None:
+                self._record(dataset.name, "disk", time.perf_counter() - start, frame,
+                             download_seconds=time.perf_counter() - read_start)
+                return _Entry(frame=frame, version=stamp, stamp=stamp, checked_at=time.time())
+        entry = self._load(dataset, stamp, start)
+        if self.disk_cache is not None and stamp is not None:
+            self.disk_cache.store(dataset.name, f"{PARSER_VERSION}:{stamp}", entry.frame)
+        return entry
+
+    def _stamp(self, dataset):
+        """ETag or last-modified/size of the object, None if unavailable."""
+        try:
+            info = self._backend.info(dataset.path)
+        except Exception:
+            # A failed metadata call just means a full reload
+            return None
+        etag = info.get("ETag") or info.get("etag")
+        if etag:
+            return str(etag).strip('"')
+        modified = info.get("LastModified") or info.get("mtime")
+        if modified is None:
+            return None
+        return f"{modified}:{info.get('size')}"
+
+    def _record(self, name, outcome, seconds, frame=None, **stats):
+        if self.metrics is None:
+            return
+        if frame is not None:
+            stats["rows"], stats["columns"], stats["memory_bytes"] = frame_stats(frame)
+        self.metrics.record(LoadEvent(dataset=name, outcome=outcome, seconds=seconds, **stats))
+
+    def _load(self, dataset, stamp=None, start=None):
+        start = start or time.perf_counter()
+        open_start = time.perf_counter()
+        # Binary so ijson can stream it; pandas and json accept bytes too
+        with self._backend.open(dataset.path, "rb") as f:
+            opened = time.perf_counter() - open_start
+            reader = MeteredReader(f)
+            parse_start = time.perf_counter()
+            frame = dataset.parse(io.BufferedReader(reader), dataset.schema)
+            parsed = time.perf_counter() - parse_start
+        self._record(dataset.name, "miss", time.perf_counter() - start, frame,
+                     download_seconds=opened + reader.seconds, parse_seconds=parsed - reader.seconds,
+                     bytes=reader.bytes)
+        # The stamp doubles as the version so an unchanged upload keeps derived caches warm
+        version = stamp or str(time.time_ns())
+        return _Entry(frame=frame, version=version, stamp=stamp, checked_at=time.time())
+
+
+@st.cache_resource
+def get_registry():
+    config = settings("data")
+    disk_cache = None
+    if config.get("disk_cache", True):
+        disk_cache = ColumnarCache(os.path.expanduser(config.get("cache_dir", DEFAULT_CACHE_DIR)))
+    return DatasetRegistry(make_backend(config), disk_cache=disk_cache, metrics=get_metrics())
+
+
+def load_dataset(name):
+    """Shared, read-only DataFrame for one of the ``DATASETS``."""
+    return get_registry().get(name)
+
+
+def prefetch_datasets(*names):
+    """Fetch every dataset a page needs in parallel before it starts rendering."""
+    return get_registry().prefetch(names)
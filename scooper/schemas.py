@@ -0,0 +1,158 @@
+"""Read schemas for the scoops-finder objects.
+
+A schema names the columns the app actually uses and how to type them, so the
+reader never materializes the rest and every page gets real datetimes and
+booleans instead of re-slicing strings. Columns missing upstream are skipped
+rather than failing the load. Date columns are parsed here, once per data
+version; pages only format them for display.
+"""
+from dataclasses import dataclass, field
+from typing import Optional
+
+import pandas as pd
+from pandas.api.types import is_object_dtype, is_string_dtype
+
+from scooper import brands
+
+# Spellings the scrapers use for flag columns
+TRUE_VALUES = {"Yes", "yes", "Y", "True", "true", True}
+FALSE_VALUES = {"No", "no", "N", "False", "false", False}
+
+
+@dataclass(frozen=True)
+class ReadSchema:
+    # None keeps every column, e.g. for tables shown whole on the Raw Data pages
+    columns: Optional[tuple] = None
+    dtypes: dict = field(default_factory=dict)
+    dates: tuple = ()
+    flags: tuple = ()
+    # column -> allowed values, rows with anything else are dropped while reading
+    where: dict = field(default_factory=dict)
+
+
+def read_csv(f, schema=None):
+    """``pd.read_csv`` restricted to ``schema.columns`` and typed per the schema."""
+    if schema is None:
+        return pd.read_csv(f)
+    wanted = set(schema.columns) if schema.columns else None
+    frame = pd.read_csv(f, usecols=(lambda column: column in wanted) if wanted else None,
+                        dtype=schema.dtypes or None)
+    return apply_types(frame, schema)
+
+
+def apply_types(frame, schema):
+    """Parse ``schema.dates`` to datetime64 and ``schema.flags`` to nullable booleans."""
+    for column in schema.dates:
+        if column in frame.columns:
+            frame[column] = _to_date(frame[column])
+    for column in schema.flags:
+        if column in frame.columns:
+            frame[column] = _to_flag(frame[column])
+    return frame
+
+
+def _to_date(series):
+    # Text loads as the ``str`` dtype under pandas 3 and as object before it
+    if is_string_dtype(series) or is_object_dtype(series):
+        text = series.astype('string')
+        # ISO timestamps keep their calendar day, as the pages' old ``.str[:10]`` did
+        if text.str.match(r'\d{4}-\d{2}-\d{2}').fillna(True).all():
+            return pd.to_datetime(text.str[:10], format='%Y-%m-%d', errors='coerce')
+    # Mixed UTC offsets raise even with errors='coerce' unless everything is moved to UTC
+    dates = pd.to_datetime(series, errors='coerce', utc=True, format='mixed')
+    return dates.dt.tz_localize(None).dt.normalize()
+
+
+def _to_flag(series):
+    values = set(series.dropna().unique())
+    # Leave anything we do not recognize alone rather than silently losing it
+    if not values <= TRUE_VALUES | FALSE_VALUES:
+        return series
+    return series.map(lambda v: v in TRUE_VALUES if pd.notna(v) else pd.NA).astype('boolean')
+
+
+_ENERGY_STAR_COMMON = ('pd_id', 'date_available_on_market', 'date_qualified', 'brand_name', 'model_name',
+                       'model_number', 'upc', 'markets', 'energy_star_model_identifier')
+_ENERGY_STAR_DTYPES = {'upc': str, 'model_number': str, 'energy_star_model_identifier': str}
+_ENERGY_STAR_DATES = ('date_available_on_market', 'date_qualified')
+
+IMAGING = ReadSchema(
+    columns=_ENERGY_STAR_COMMON + (
+        'product_type', 'remanufactured_product', 'color_capability', 'monochrome_product_speed_ipm_or_mppm',
+        'automatic_duplex_output_capable', 'typical_electricity_consumption_tec_kwh_wk', 'power_in_sleep_w',
+        'power_in_standby_w'),
+    dtypes=_ENERGY_STAR_DTYPES,
+    dates=_ENERGY_STAR_DATES,
+    flags=('remanufactured_product', 'automatic_duplex_output_capable'),
+)
+
+COMPUTERS = ReadSchema(
+    columns=_ENERGY_STAR_COMMON + (
+        'type', 'touch_screen', 'category_2_processor_brand', 'category_2_processor_name',
+        'category_2_physical_cpu_cores_count', 'category_2_base_processor_speed_per_core_ghz',
+        'category_2_operating_system_name', 'category_2_system_memory_gb', 'product_dimm_count',
+        'ethernet_capability', 'bluetooh_capability'),
+    dtypes=_ENERGY_STAR_DTYPES,
+    dates=_ENERGY_STAR_DATES,
+    # touch_screen stays a string, it feeds a Yes/No filter on the Raw Data page
+    flags=('ethernet_capability', 'bluetooh_capability'),
+)
+
+TELEVISIONS = ReadSchema(
+    columns=_ENERGY_STAR_COMMON + (
+        'product_type', 'application', 'display_type', 'backlight_technology_type',
+        'diagonal_viewable_screen_size_inches', 'screen_area_square_inches', 'native_horizontal_resolution_pixels',
+        'native_vertical_resolution_pixels', 'resolution_format', 'high_contrast_ratio_hcr_display',
+        'low_power_wireless_technologies_supported', 'features', 'automatic_brightness_control',
+        'additional_model_information'),
+    dtypes=_ENERGY_STAR_DTYPES,
+    dates=_ENERGY_STAR_DATES,
+    flags=('high_contrast_ratio_hcr_display', 'automatic_brightness_control'),
+)
+
+# baseline4.csv
+EPEAT = ReadSchema(
+    columns=('Id', 'Registered On', 'Product Name', 'Manufacturer', 'Product Category', 'Product Type', 'Status',
+             'Registered In', 'Climate+', 'Total Score', 'EPEAT Tier', 'Manufacturer Part Number',
+             'Universal Product Code'),
+    dtypes={'Manufacturer Part Number': str, 'Universal Product Code': str},
+    dates=('Registered On',),
+    flags=('Climate+',),
+)
+
+# baseline3.csv, shown whole on the Raw Data pages so every column is kept
+WIFI = ReadSchema(dates=('Date of Last Certification',))
+
+_BLUETOOTH_FIELDS = ('ListingId', 'Name', 'CompanyName', 'ListingDate', 'ProductListings')
+_MFI_FIELDS = ('upcEan', 'models', 'brand', 'accessoryName', 'accessoryCategory')
+
+BLUETOOTH = ReadSchema(
+    columns=_BLUETOOTH_FIELDS,
+    dates=('ListingDate',),
+    where={'CompanyName': brands.union(brands.BLUETOOTH_COMPANIES)},
+)
+
+BLUETOOTH_CHANGELOG = ReadSchema(
+    columns=('Date Detected',) + _BLUETOOTH_FIELDS,
+    dates=('Date Detected', 'ListingDate'),
+    where={'CompanyName': brands.union(brands.BLUETOOTH_CHANGELOG_COMPANIES)},
+)
+
+MFI = ReadSchema(
+    columns=_MFI_FIELDS,
+    where={'brand': brands.union(brands.MFI_BRANDS)},
+)
+
+# Every brand is shown on the changelog pages, so only the fields are projected
+MFI_CHANGELOG = ReadSchema(columns=('Date Detected',) + _MFI_FIELDS, dates=('Date Detected',))
+
+# tco_data.json, every column is shown on the computers Raw Data page
+TCO = ReadSchema(dates=('cert_date', 'cert_expiry_date'))
+
+# Changelogs are shown whole, only their dates are typed
+ENERGY_STAR_CHANGELOG = ReadSchema(dates=('Date Detected',) + _ENERGY_STAR_DATES)
+EPEAT_CHANGELOG = ReadSchema(dates=('Date Detected', 'Registered On'))
+WIFI_CHANGELOG = ReadSchema(dates=('Date',))
+
+# tracking.csv and combined_products.csv, the placement pages
+PLACEMENTS = ReadSchema(dates=('Date Detected',))
@@ -0,0 +1,256 @@
+"""Token index behind the "Search Across DataFrames" boxes.
+
+Each cell is lower-cased and split into alphanumeric tokens once per data
+version. The postings are stored sorted by token, so every token that starts
+with a query term sits in one contiguous slice: a query is a binary search
+per term plus an intersection of row positions, with no per-row Python work.
+Recent queries are remembered so that a query extending one of them (the
+next keystroke) only intersects the earlier result with its last term.
+
+A query word joining several tokens with punctuation ("2023-05", "hp-m")
+must appear as typed inside one cell, as the old substring search required,
+so only the candidate rows are checked against the cell text.
+
+When no row has a token starting with every term, the terms are looked up
+inside tokens instead, so a model number fragment like "8900" still finds
+"MFC-L8900CDW". That scan runs over the distinct tokens, not the cells.
+"""
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+TOKEN_PATTERN = r'[0-9a-z]+'
+_TOKEN_RE = re.compile(TOKEN_PATTERN)
+
+# Queries remembered per index so the next keystroke can narrow their rows
+QUERY_CACHE_SIZE = 64
+
+
+def tokenize(text):
+    return _TOKEN_RE.findall(str(text).lower())
+
+
+def phrases(query):
+    """Words of ``query`` made of more than one token, lower-cased and trimmed: "HP-M428," -> "hp-m428"."""
+    words = (re.sub(r'^[^0-9a-z]+|[^0-9a-z]+$', '', word) for word in str(query).lower().split())
+    return [word for word in words if len(tokenize(word)) > 1]
+
+
+class TokenIndex:
+    """Row positions of ``frame`` keyed by the tokens found in any of its cells."""
+
+    def __init__(self, frame):
+        self.size = len(frame)
+        # Shared and read-only, kept to check phrases against the candidate rows
+        self.frame = frame
+        pieces = []
+        for column in frame.columns:
+            values = frame[column].reset_index(drop=True).dropna()
+            tokens = values.astype(str).str.lower().str.findall(TOKEN_PATTERN).explode().dropna()
+            pieces.append(pd.DataFrame({'token': tokens.to_numpy(dtype=object),
+                                        'row': tokens.index.to_numpy(dtype=np.int64)}))
+        pairs = pd.concat(pieces, ignore_index=True) if pieces else pd.DataFrame({'token': [], 'row': []})
+        pairs = pairs.drop_duplicates().sort_values(['token', 'row'], kind='stable')
+        tokens = pairs['token'].to_numpy(dtype=object)
+        self.rows = pairs['row'].to_numpy(dtype=np.int64)
+        if len(tokens):
+            starts = np.flatnonzero(np.r_[True, tokens[1:] != tokens[:-1]])
+        else:
+            starts = np.array([], dtype=np.int64)
+        # vocabulary[i]'s rows are rows[offsets[i]:offsets[i + 1]]
+        self.vocabulary = tokens[starts]
+        self.offsets = np.r_[starts, len(tokens)]
+        # Vocabulary position of each posting, to take the rows of many tokens at once
+        self._posting_tokens = np.repeat(np.arange(len(starts)), np.diff(self.offsets))
+        # Recent queries (as term tuples) -> matching rows, for search-as-you-type
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def prefix_rows(self, term):
+        """Sorted row positions with a token starting with ``term``."""
+        lo = np.searchsorted(self.vocabulary, term, side='left')
+        hi = np.searchsorted(self.vocabulary, term + '\uffff', side='left')
+        if lo == hi:
+            return np.array([], dtype=np.int64)
+        return np.unique(self.rows[self.offsets[lo]:self.offsets[hi]])
+
+    def exact_rows(self, term):
+        """Sorted row positions with a token equal to ``term``."""
+        i = np.searchsorted(self.vocabulary, term, side='left')
+        if i == len(self.vocabulary) or self.vocabulary[i] != term:
+            return np.array([], dtype=np.int64)
+        return self.rows[self.offsets[i]:self.offsets[i + 1]]
+
+    def infix_rows(self, term):
+        """Sorted row positions with a token containing ``term`` anywhere."""
+        inside = pd.Series(self.vocabulary, dtype=object).str.contains(term, regex=False).to_numpy(dtype=bool)
+        if not inside.any():
+            return np.array([], dtype=np.int64)
+        return np.unique(self.rows[inside[self._posting_tokens]])
+
+    def search(self, query):
+        """Rows matching every term of ``query``, each as a token prefix, best first.
+
+        Without any such row, terms may match inside a token instead. Rows
+        score two points per term matching a whole token and one per term
+        only matching part of one; ties keep frame order (newest first).
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return np.array([], dtype=np.int64)
+        rows = self._matching(tuple(terms))
+        if not len(rows):
+            # Fragments from inside a token, e.g. "8900" of "MFC-L8900CDW"
+            rows = self._containing(terms)
+        rows = self._with_phrases(rows, phrases(query))
+        scores = np.zeros(len(rows), dtype=np.int64)
+        for term in terms:
+            scores += 1 + np.isin(rows, self.exact_rows(term), assume_unique=True)
+        return rows[np.argsort(-scores, kind='stable')]
+
+    def _with_phrases(self, rows, required):
+        """The ``rows`` having each ``required`` phrase inside a single cell."""
+        if not required or not len(rows):
+            return rows
+        cells = self.frame.iloc[rows]
+        texts = [cells[column].astype(str).str.lower().where(cells[column].notna(), '')
+                 for column in cells.columns]
+        keep = np.ones(len(rows), dtype=bool)
+        for phrase in required:
+            found = np.zeros(len(rows), dtype=bool)
+            for text in texts:
+                found |= text.str.contains(phrase, regex=False).to_numpy(dtype=bool)
+            keep &= found
+        return rows[keep]
+
+    def _containing(self, terms):
+        """Rows with a token containing each of ``terms``, for queries no token prefix matches."""
+        matched = None
+        for term in terms:
+            rows = self.infix_rows(term)
+            matched = rows if matched is None else np.intersect1d(matched, rows, assume_unique=True)
+            if not len(matched):
+                break
+        return matched
+
+    def _matching(self, terms):
+        with self._lock:
+            cached = self._cache.get(terms)
+            if cached is not None:
+                self._cache.move_to_end(terms)
+                return cached
+            base = self._narrowing_base(terms)
+        if base is not None:
+            # Typing one more character only narrows what the shorter query matched
+            matched = np.intersect1d(base, self.prefix_rows(terms[-1]), assume_unique=True)
+        else:
+            matched = None
+            # Rarest terms first keeps the intersections small
+            for rows in sorted((self.prefix_rows(term) for term in terms), key=len):
+                matched = rows if matched is None else np.intersect1d(matched, rows, assume_unique=True)
+                if not len(matched):
+                    break
+        with self._lock:
+            self._cache[terms] = matched
+            if len(self._cache) > QUERY_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return matched
+
+    def _narrowing_base(self, terms):
+        """Cached rows of the longest query this one extends, if any (lock held)."""
+        *head, last = terms
+        head = tuple(head)
+        for cut in range(len(last) - 1, 0, -1):
+            cached = self._cache.get(head + (last[:cut],))
+            if cached is not None:
+                return cached
+        return self._cache.get(head) if head else None
+
+
+@dataclass
+class SearchTable:
+    """One dataset's rows, as shown by any category, indexed once.
+
+    ``categories`` maps each category to a boolean mask over ``frame`` marking
+    the rows that category's Raw Data page shows, so a WiFi row listed under
+    both Imaging and Computers is stored and tokenized a single time.
+    """
+    table: str
+    frame: pd.DataFrame
+    index: TokenIndex
+    categories: dict
+
+    def search(self, query, categories=None):
+        """Ranked row positions for ``query``, limited to rows shown by ``categories``."""
+        rows = self.index.search(query)
+        if categories is not None:
+            rows = rows[self.mask(categories)[rows]]
+        return rows
+
+    def mask(self, categories):
+        mask = np.zeros(len(self.frame), dtype=bool)
+        for category in categories:
+            if category in self.categories:
+                mask |= self.categories[category]
+        return mask
+
+    def category_counts(self, rows):
+        return {category: int(mask[rows].sum()) for category, mask in self.categories.items()}
+
+
+def normalize_model(text):
+    """Lower-case ``text`` and drop punctuation and spaces: "MFC-L8900 CDW" -> "mfcl8900cdw"."""
+    return re.sub(r'[^0-9a-z]', '', str(text).lower())
+
+
+def trigrams(key):
+    if len(key) < 3:
+        return {key} if key else set()
+    return {key[i:i + 3] for i in range(len(key) - 2)}
+
+
+class TrigramIndex:
+    """Fuzzy lookup of model numbers and product names by shared trigrams.
+
+    ``records`` is a frame with ``value`` (the text to match) plus any columns
+    to hand back with each match. A query only touches the postings of its own
+    trigrams, then ranks candidates by how much of the query they contain and,
+    for ties, by trigram Jaccard similarity.
+    """
+
+    def __init__(self, records):
+        self.records = records.reset_index(drop=True)
+        postings = {}
+        sizes = np.zeros(len(self.records), dtype=np.int64)
+        for entry, value in enumerate(self.records['value']):
+            grams = trigrams(normalize_model(value))
+            sizes[entry] = len(grams)
+            for gram in grams:
+                postings.setdefault(gram, []).append(entry)
+        self.sizes = sizes
+        self.postings = {gram: np.asarray(entries, dtype=np.int64) for gram, entries in postings.items()}
+
+    def search(self, query, limit=20, min_score=0.5, allowed=None):
+        """Best ``limit`` records for ``query`` with a ``score`` column, best first.
+
+        ``allowed`` is an optional boolean mask over the records to choose from.
+        """
+        grams = trigrams(normalize_model(query))
+        lists = [self.postings[gram] for gram in grams if gram in self.postings]
+        if not lists:
+            return self.records.iloc[0:0].assign(score=[])
+        entries, shared = np.unique(np.concatenate(lists), return_counts=True)
+        containment = shared / len(grams)
+        jaccard = shared / (len(grams) + self.sizes[entries] - shared)
+        keep = containment >= min_score
+        if allowed is not None:
+            keep &= allowed[entries]
+        entries, containment, jaccard = entries[keep], containment[keep], jaccard[keep]
+        order = np.lexsort((-jaccard, -containment))[:limit]
+        matches = self.records.iloc[entries[order]].copy()
+        matches['score'] = np.round(containment[order] * 0.8 + jaccard[order] * 0.2, 3)
+        return matches
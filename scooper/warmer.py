@@ -0,0 +1,138 @@
+"""Background cache warmer aligned with the daily scoops-finder scrape.
+
+The scraper rewrites the bucket every day at 9 AM America/Los_Angeles. Shortly
+after that (``offset_minutes``) the warmer revalidates every dataset and
+rebuilds the derived frames, so the first visitor after a refresh does not pay
+for the downloads and parses.
+
+Configured from the ``[warmer]`` section of the secrets file::
+
+    [warmer]
+    enabled = true
+    offset_minutes = 15
+    retries = 3
+    retry_delay_seconds = 300
+    warm_on_start = true
+"""
+import datetime
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+import pytz
+import streamlit as st
+
+from scooper.config import settings
+from scooper.derived import get_derived
+from scooper.registry import get_registry
+
+REFRESH_TIMEZONE = pytz.timezone('America/Los_Angeles')
+REFRESH_HOUR = 9
+
+logger = logging.getLogger(__name__)
+
+
+def next_refresh(now=None):
+    """Next scheduled scrape (9 AM Pacific) strictly after ``now``."""
+    if now is None:
+        now = datetime.datetime.now(datetime.timezone.utc)
+    now = now.astimezone(REFRESH_TIMEZONE)
+    day = now.date()
+    if now.hour >= REFRESH_HOUR:
+        day += datetime.timedelta(days=1)
+    # localize() rather than replace() so the hour stays right across DST changes
+    return REFRESH_TIMEZONE.localize(datetime.datetime.combine(day, datetime.time(REFRESH_HOUR)))
+
+
+@dataclass
+class WarmupStatus:
+    last_started: Optional[datetime.datetime] = None
+    last_finished: Optional[datetime.datetime] = None
+    duration: Optional[float] = None
+    attempts: int = 0
+    error: Optional[str] = None
+    next_run: Optional[datetime.datetime] = None
+    runs: int = 0
+
+
+class CacheWarmer:
+    """Runs ``steps`` once after every scheduled refresh, retrying on failure."""
+
+    def __init__(self, steps, offset_minutes=15, retries=3, retry_delay_seconds=300, warm_on_start=True):
+        self.steps = steps
+        self.offset = datetime.timedelta(minutes=offset_minutes)
+        self.retries = retries
+        self.retry_delay = retry_delay_seconds
+        self.warm_on_start = warm_on_start
+        self.status = WarmupStatus()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._loop, name="scooper-cache-warmer", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def run_once(self):
+        """Run every step, retrying the whole warm-up up to ``retries`` times."""
+        status = self.status
+        status.last_started = datetime.datetime.now(REFRESH_TIMEZONE)
+        start = time.perf_counter()
+        for attempt in range(1, self.retries + 2):
+            status.attempts = attempt
+            try:
+                for step in self.steps:
+                    step()
+                status.error = None
+                break
+            except Exception as e:
+                status.error = f"{type(e).__name__}: {e}"
+                logger.warning("Cache warm-up attempt %d failed: %s", attempt, status.error)
+                if attempt > self.retries or self._stop.wait(self.retry_delay):
+                    break
+        status.duration = time.perf_counter() - start
+        status.last_finished = datetime.datetime.now(REFRESH_TIMEZONE)
+        status.runs += 1
+        logger.info("Cache warm-up finished in %.1fs after %d attempt(s)", status.duration, status.attempts)
+
+    def _loop(self):
+        if self.warm_on_start:
+            self.run_once()
+        while not self._stop.is_set():
+            wake = next_refresh() + self.offset
+            # If we are still inside the offset window after 9 AM, today's run is pending
+            if wake - datetime.timedelta(days=1) > datetime.datetime.now(datetime.timezone.utc):
+                wake -= datetime.timedelta(days=1)
+            self.status.next_run = wake
+            delay = (wake - datetime.datetime.now(datetime.timezone.utc)).total_seconds()
+            if self._stop.wait(max(delay, 0)):
+                break
+            self.run_once()
+
+
+def _warm_steps():
+    registry = get_registry()
+    derived = get_derived()
+    return [registry.refresh, derived.warm]
+
+
+@st.cache_resource
+def get_warmer():
+    """Process-wide warmer, started on first use unless disabled in settings."""
+    config = settings("warmer")
+    warmer = CacheWarmer(
+        _warm_steps(),
+        offset_minutes=config.get("offset_minutes", 15),
+        retries=config.get("retries", 3),
+        retry_delay_seconds=config.get("retry_delay_seconds", 300),
+        warm_on_start=config.get("warm_on_start", True),
+    )
+    if config.get("enabled", True):
+        warmer.start()
+    return warmer
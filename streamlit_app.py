@@ -1,29 +1,30 @@
 import streamlit as st
 import datetime
-import numpy as np
-import pandas as pd
 import altair as alt
-from st_files_connection import FilesConnection
 import hashlib
-from io import BytesIO
-from PIL import Image
-import requests
-import matplotlib.pyplot as plt
-from streamlit_echarts import st_echarts
 import pytz
-
-
-# URL of the image you want to use as the page icon
-icon_url = "https://i.postimg.cc/Y0XLcpg7/scooper-s.png"
-
-# Download the image
-response = requests.get(icon_url)
-image = Image.open(BytesIO(response.content))
-
-# Set the Streamlit page configuration with the custom icon
+from scooper.assets import asset_path, icon_css, logo_html
+from scooper.brands import BLUETOOTH_CHANGELOG_COMPANIES
+from scooper.entities import first_per_product
+from scooper.registry import load_dataset, prefetch_datasets
+from scooper.derived import (CATEGORY_LABELS, SEARCH_RESULTS_LIMIT, combined_certifications, placement_facets,
+                             raw_facets, raw_sources, recent_cards, recent_placement_cards, search_everything,
+                             search_models, search_raw_sources)
+from scooper.metrics import get_metrics, is_admin
+from scooper.payloads import get_payloads
+from scooper.warmer import get_warmer, next_refresh
+
+try:
+    # Reruns the page on every keystroke; without it searches run on Enter
+    from st_keyup import st_keyup
+except ImportError:
+    st_keyup = None
+
+
+# Set the Streamlit page configuration with the custom icon, bundled in static/
 st.set_page_config(
     page_title="Scooper Dashboard",
-    page_icon=image,
+    page_icon=asset_path("icon"),
     layout="wide",
     initial_sidebar_state="expanded"
 )
@@ -58,17 +59,17 @@ def display_dashboard():
         personal_website_url = "https://matt-lohier.com/"  # Change this to your personal website URL
         st.markdown(f"""
         <a href="{linkedin_url}" target="_blank" style='display: inline-block; padding-right: 10px;'>
-            <img src='https://cdn-icons-png.flaticon.com/512/174/174857.png' style='width:32px; height:32px;'>
+            <i class='fab fa-linkedin' style='font-size:32px; color:#0a66c2;'></i>
         </a><!--
         --><a href="{personal_website_url}" target="_blank" style='display: inline-block;'>
-            <img src='https://i.postimg.cc/9MbrTWL9/portfolio.png' style='width:32px; height:32px;'>
+            <i class='fas fa-briefcase' style='font-size:32px; color:#262730;'></i>
         </a>
         """, unsafe_allow_html=True)
         st.markdown('---')
 
 
 def sidebar():
-    st.sidebar.image("https://i.postimg.cc/XJdg0y7b/scooper-logo.png", use_column_width=True)
+    st.sidebar.image(asset_path("logo"), use_column_width=True)
     st.sidebar.markdown("---")
     #st.divider()
     # Define product categories and their corresponding buttons
@@ -101,6 +102,8 @@ def sidebar():
             st.session_state['page'] = 'certifications'
         if 'Placements' in buttons and st.button("Placements", key="placements_button"):
             st.session_state['page'] = 'placements'
+        if st.button("Search All 🔎", key="search_button"):
+            st.session_state['page'] = 'search'
     
     # Inject CSS to make container's children (buttons) 100% width
     st.sidebar.markdown("""
@@ -162,13 +165,10 @@ def sidebar():
     now = datetime.datetime.now(datetime.timezone.utc).astimezone(timezone)
     
     # Determine the next refresh time (9 AM PST)
-    next_refresh = now.replace(hour=9, minute=0, second=0, microsecond=0)
-    if now.hour >= 9 or (now.hour == 9 and now.minute > 0):  # Check past 9 AM PST
-        next_refresh += datetime.timedelta(days=1)
+    refresh_at = next_refresh(now)
     
     # Calculate time left until next refresh
-    time_left = next_refresh - now
-    total_seconds = time_left.total_seconds()
+    time_left = refresh_at - now
 
     # Calculate progress (based on how many seconds have elapsed in the current 24-hour period)
     progress = (1 - (time_left.seconds / 86400)) * 100
@@ -178,6 +178,12 @@ def sidebar():
     st.sidebar.progress(int(progress))
     st.sidebar.markdown(f"**Refresh in: {hours_left} hours**")
 
+    # Show when the background warmer last preloaded the data and how long it took
+    warm_status = get_warmer().status
+    if warm_status.last_finished is not None:
+        st.sidebar.caption(f"Data warmed {warm_status.last_finished:%b %d %I:%M %p %Z} "
+                           f"in {warm_status.duration:.1f}s")
+
 
 def login(username, password):
     try:
@@ -199,9 +205,9 @@ def display_login_form():
     col1, col2, col3 = st.columns([1, 2, 1])
     
     with col2:  # Middle column for the form
-        st.markdown("""
+        st.markdown(f"""
         <center>
-            <img src='https://i.postimg.cc/XJdg0y7b/scooper-logo.png' width='300'>
+            {logo_html(300)}
         </center>
         """, unsafe_allow_html=True)
         with st.form(key='login_form'):
@@ -213,6 +219,7 @@ def display_login_form():
             if login_button:
                 if login(username, password):  # Assume login is a function defined to check credentials
                     st.session_state['logged_in'] = True  # Update session state
+                    st.session_state['username'] = username
                     st.rerun()
                 else:
                     st.error("Invalid username or password")
@@ -276,386 +283,215 @@ def display_certifications_imaging():
 
 
 def show_recent_cert():
-    conn = st.connection('s3', type=FilesConnection)
-    df = conn.read("scoops-finder/imaging-data.csv", input_format="csv", ttl=600)
-
-    # Specify the columns to keep
-    columns_to_keep = ['brand_name', 'model_name', 'product_type',
-                    'color_capability', 'date_available_on_market', 'date_qualified',
-                    'markets', 'monochrome_product_speed_ipm_or_mppm']
-
-    # Create a new DataFrame with only the specified columns
-    new_df = df[columns_to_keep]
-
-    # Rename the columns
-    new_df = new_df.rename(columns={
-        'brand_name': 'Brand',
-        'model_name': 'Model',
-        'product_type': 'Product Type',
-        'color_capability': 'Color/Mono',
-        'date_available_on_market': 'Date Available',
-        'date_qualified': 'Date Qualified',
-        'markets': 'Target Markets',
-        'monochrome_product_speed_ipm_or_mppm': 'Print Speed'
-    })
-
-    # Specify the brands to filter
-    brands_to_show = ["Canon", "Brother", "HP", "Epson", "Konica Minolta", "Kyocera",
-                    "Lexmark", "Ricoh", "Sharp", "Toshiba", "Xerox", "Pantum", "Fujifilm", "HP Inc.", "Zhuhai Pantum Electronics Co., Ltd."]
-
-    # Specify the product types to filter
-    product_types_to_show = ['Printers', 'Multifunction Devices (MFD)']
-
-    # Cut off the "Date Available" and "Date Qualified" columns to remove anything after the first 10 digits
-    new_df['Date Available'] = new_df['Date Available'].str[:10]
-    new_df['Date Qualified'] = new_df['Date Qualified'].str[:10]
-
-    # Filter the new DataFrame to only include specified brands, product types, and hide entries with "Label Printer" in the Model column
-    filtered_df = new_df[(new_df['Brand'].isin(brands_to_show)) &
-                        (new_df['Product Type'].isin(product_types_to_show)) &
-                        (~new_df['Model'].str.contains('Model Printer|Label Printer', case=False))]
-
-    # Sort the filtered DataFrame by Date Available (Newest to Oldest)
-    filtered_df.sort_values(by='Date Available', ascending=False, inplace=True)
-    filtered_df.reset_index(drop=True, inplace=True)
-    estardf = filtered_df
-
-    # Print filtered results.
-    # Add metric to show latest 3 records based on product name
-    # latest_records = filtered_df.head(3)['Model'].tolist()
-    # st.metric("Latest 3 Products", ", ".join(latest_records))
-    # Create connection object and retrieve file contents.
-    # Specify input format is a csv and to cache the result for 600 seconds.
-    conn = st.connection('s3', type=FilesConnection)
-    df2 = conn.read("scoops-finder/baseline3.csv", input_format="csv", ttl=600)
-    # Keep only the desired columns
-    df2_modified = df2[["CID", "Date of Last Certification", "Brand", "Product", "Model Number", "Category"]]
-    # Filter by specified brands
-    df2_modified = df2_modified[df2_modified["Brand"].isin(brands_to_show)]
-    # Sort the dataframe by "Date of Last Certification", from newest to oldest
-    df2_modified.sort_values(by="Date of Last Certification", ascending=False, inplace=True)
-    df2_modified.reset_index(drop=True, inplace=True)
-    df2_modified.drop_duplicates(inplace=True)
-    # Write the modified dataframe
-    conn = st.connection('s3', type=FilesConnection)
-    df3 = conn.read("scoops-finder/baseline4.csv", input_format="csv", ttl=600)
-    # Keep only the desired columns
-    df3_modified = df3[["Id", "Registered On", "Product Type", "Product Name", "Manufacturer"]]
-    # Filter by specified brands
-    df3_modified = df3_modified[df3_modified["Manufacturer"].isin(brands_to_show)]
-    # Sort the dataframe by "Date of Last Certification", from newest to oldest
-    df3_modified.sort_values(by="Registered On", ascending=False, inplace=True)
-    df3_modified.reset_index(drop=True, inplace=True)
-    df3_modified.drop_duplicates(inplace=True)
-    # Write the modified dataframe
-    # Rename and remove columns for filtered_df
-    filtered_df = filtered_df.rename(columns={'Model': 'Product Name', 'Date Available': 'Certification Date'})
-    filtered_df = filtered_df.drop(columns=['Color/Mono', 'Date Qualified', 'Target Markets', 'Print Speed'])
-    filtered_df = filtered_df[['Product Name', 'Brand', 'Certification Date', 'Product Type']]
-    # Rename and remove columns for df2_modified
-    df2_modified = df2_modified.rename(columns={'Manufacturer': 'Brand', 'Product': 'Product Name', 'Date of Last Certification': 'Certification Date', 'Category': 'Product Type'})
-    df2_modified = df2_modified.drop(columns=['CID', 'Model Number'])
-    df2_modified = df2_modified[['Product Name', 'Brand', 'Certification Date', 'Product Type']]
-    # Rename and remove columns for df3_modified
-    df3_modified = df3_modified.rename(columns={'Registered On': 'Certification Date', 'Manufacturer': 'Brand'})
-    df3_modified = df3_modified.drop(columns=['Id'])
-    df3_modified = df3_modified[['Product Name', 'Brand', 'Certification Date', 'Product Type']]
-    df3_modified = df3_modified[df3_modified['Product Type'].isin(['Printer', 'Multifunction Device'])]
-    
-    # Add a "Source" column to each dataframe
-    filtered_df['Source'] = 'Energy Star'
-    df2_modified['Source'] = 'WiFi Alliance'
-    df3_modified['Source'] = 'EPEAT Registry'
-    
-    # Concatenate the dataframes
-    combined_df = pd.concat([filtered_df, df2_modified, df3_modified], ignore_index=True)
-    # Assuming "Certification Date" is already in string format
-    # If not, convert it to string before truncating
-    
-    # Truncate the date to keep only the first 10 characters
-    combined_df['Certification Date'] = combined_df['Certification Date'].str[:10]
-    # Convert the truncated date to datetime format
-    combined_df['Certification Date'] = pd.to_datetime(combined_df['Certification Date'], errors='coerce')
-    # Sort the combined dataframe by "Certification Date" in descending order
-    combined_df.sort_values(by='Certification Date', ascending=False, inplace=True)
-    # Reset index
-
-    combined_df.reset_index(drop=True, inplace=True)
-    combined_df.drop_duplicates(inplace=True)
-    combined_df['Certification Date'] = combined_df['Certification Date'].astype(str).str[:10]
-    # Show only the newest 5 records
-    newest_records = combined_df.head(20)
-    
     st.header('Recent Certifications')
-    lnk = '<link rel="stylesheet" href="https://use.fontawesome.com/releases/v5.12.1/css/all.css" crossorigin="anonymous">'
-    wch_colour_font = (0, 0, 0)
-    fontsize = 14
-    valign = "left"
-    iconname = "fas fa-xmark"
-    sline = "New Certifications Detected"
-    container = st.container()
-
-    st.markdown('''
-    <style>
-    .grid-container {
-        display: grid;
-        grid-template-columns: repeat(3, 1fr); /* Maintains 3 columns */
-        grid-gap: 20px; /* Space between cards */
-        padding: 10px;
-        width: auto; /* Adjust based on the actual space available or use 100% if it should be fully responsive */
-    }
+    # Newest 20 products, each once whichever sources list it, as one cached HTML grid
+    st.markdown(recent_cards('imaging'), unsafe_allow_html=True)
 
-    .card {
-        height: auto;
-        min-height: 120px;
-        position: relative;
-        width: 100%; /* This makes each card responsive within its grid column */
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        padding: 2px;
-        border-radius: 24px;
-        overflow: hidden;
-        line-height: 1.6;
-        transition: all 0.48s cubic-bezier(0.23, 1, 0.32, 1);
-        margin: 15px; /* Added margin */
-    }
 
-    .content {
-    width: 100%;
-    display: flex;
-    flex-direction: column;
-    align-items: flex-start;
-    gap: 24px;
-    padding: 20px;
-    padding-bottom: 0px;
-    border-radius: 22px;
-    color: #ffffff;
-    overflow: hidden;
-    background: #ffffff;
-    transition: all 0.48s cubic-bezier(0.23, 1, 0.32, 1);
-    }
+def format_dates(frame, columns):
+    """Copy of ``frame`` with the datetime ``columns`` as YYYY-MM-DD text, for display only."""
+    return frame.assign(**{column: frame[column].dt.strftime('%Y-%m-%d') for column in columns})
 
-    .content .heading {
-    font-weight: 600;
-    font-size: 20px;
-    line-height: 1;
-    z-index: 1;
-    transition: all 0.48s cubic-bezier(0.23, 1, 0.32, 1);
-    }
 
-    .content .para {
-    z-index: 1;
-    opacity: 0.8;
-    font-size: 16px;
-    font-weight: 400;
-    transition: all 0.48s cubic-bezier(0.23, 1, 0.32, 1);
-    }
+def facet_selectbox(label, facets, facet, filters, key, options=None, default='any', **kwargs):
+    """Selectbox over ``facet`` of a ``FacetIndex`` with live row counts, e.g. "HP (312)".
 
-    .card::before {
-    content: "";
-    position: absolute;
-    height: 500%;
-    width: 500%;
-    border-radius: inherit;
-    background: #3775cb;
-    background: linear-gradient(to right, #3775cb, #3775cb);
-    transform-origin: center;
-    }
+    Options default to the values left by ``filters`` (the dropdowns above
+    this one); the choice is added to ``filters`` for the ones below. ``key``
+    names the table, e.g. 'imaging_epeat'; the widget key adds the facet.
+    """
+    counts = facets.counts(facet, filters)
+    if options is None:
+        options = ['any'] + list(counts)
+    total = facets.count(filters)
+    widget_key = f'{key}_{facet}'
+    if st.session_state.get(widget_key, options[0]) not in options:
+        # The filters above no longer leave the previous choice
+        del st.session_state[widget_key]
+
+    index = options.index(default) if default in options else 0
+    selected = st.selectbox(label, options, index=index, key=widget_key,
+                            format_func=lambda v: f"{v} ({total if v == 'any' else counts.get(v, 0):,})", **kwargs)
+    filters[facet] = selected
+    return selected
+
+
+PAGE_SIZES = [25, 50, 100, 250]
+
+
+def paged_dataframe(frame, key, datasets, state=None, dates=(), rows=None, rename=None, columns=None):
+    """Show one page of ``frame`` with the total row count, a page size and jump-to-page.
+
+    ``rows`` are the positions in ``frame`` to show, in order (all of them by
+    default), e.g. from ``FacetIndex.select``. Only the visible page is taken,
+    has its columns renamed by ``rename`` and cut to ``columns``, its ``dates``
+    formatted, and is sent to the browser, so the work and the payload stay the
+    same size however long the table grows. ``state`` is whatever picked the
+    rows out of ``datasets`` (filters, sort); changing it goes back to page 1.
+    """
+    total = len(frame) if rows is None else len(rows)
+    size = st.session_state.get(f'{key}_page_size', PAGE_SIZES[1])
+    pages = max(1, -(-total // size))
+    # A new widget per state and page size, so it starts on page 1 and within bounds
+    signature = hashlib.md5(repr((state, size, pages)).encode()).hexdigest()[:8]
 
-    .card:hover::before {
-    animation-play-state: running;
-    z-index: -1;
-    width: 20%;
-    }
-    .card:hover .content .heading,
-    .card:hover .content .para {
-    color: #000000;
-    }
+    col1, col2, col3 = st.columns([2, 1, 1])
+    with col2:
+        page = st.number_input(f'Page (of {pages:,})', min_value=1, max_value=pages, value=1, step=1,
+                               key=f'{key}_page_{signature}')
+    with col3:
+        st.selectbox('Rows per page', PAGE_SIZES, index=1, key=f'{key}_page_size')
+    start = (page - 1) * size
+    with col1:
+        st.caption(f"Rows {start + 1:,}–{min(start + size, total):,} of {total:,}" if total else "No rows")
 
-    .card:hover {
-    box-shadow: 0rem 6px 13px rgba(10, 60, 255, 0.1),
-        0rem 24px 24px rgba(10, 60, 255, 0.09),
-        0rem 55px 33px rgba(10, 60, 255, 0.05),
-        0rem 97px 39px rgba(10, 60, 255, 0.01), 0rem 152px 43px rgba(10, 60, 255, 0);
-    color: #000000;
-    }
+    def page_rows():
+        page_frame = frame.iloc[start:start + size] if rows is None else frame.iloc[rows[start:start + size]]
+        if rename:
+            page_frame = page_frame.rename(columns=rename)
+        if columns is not None:
+            page_frame = page_frame.loc[:, columns]
+        return format_dates(page_frame, dates) if dates else page_frame
 
-    </style>
-    ''', unsafe_allow_html=True)
+    # Arrow table of this page, shared with earlier reruns and sessions until the data changes
+    st.dataframe(get_payloads().table(key, datasets, (state, start, size), page_rows), use_container_width=True)
 
-    emoji_dict = {
-            "Energy Star": "⚡",
-            "WiFi Alliance": "📶",
-            "EPEAT": "🌎"
-        }
 
-    # Sample data iteration - replace 'newest_records' with your actual DataFrame
-    
-    # Define the number of columns
-    num_columns = 2
-    rows = [st.columns(num_columns) for _ in range((len(newest_records) + num_columns - 1) // num_columns)]
-
-    # Initialize a counter for DataFrame row indices
-    row_index = 0
-
-    # Fill each cell in the grid with content
-    for row in rows:
-        for col in row:
-            if row_index < len(newest_records):
-                with col:
-                    row_data = newest_records.iloc[row_index]
-                    product_name = row_data['Product Name']
-                    certification_date = row_data['Certification Date']
-                    brand = row_data['Brand']
-                    product_type = row_data['Product Type']
-                    source = row_data['Source']
-                    emoji = emoji_dict.get(source, "📝")
-
-                    # Embed data into HTML
-                    html_content = f"""
-                    <div class="card">
-                        <div class="content">
-                            <p class="heading">{product_name}</p>
-                            <p class="para">
-                                Brand: {brand}<br>
-                                Product Type: {product_type}<br>
-                                Certification Date: {certification_date}<br>
-                                Source: {source} {emoji}
-                            </p>
-                        </div>
-                    </div>
-                    """
-                    st.markdown(html_content, unsafe_allow_html=True)
-
-                    row_index += 1   
+def search_box(label, key):
+    if st_keyup is not None:
+        return st_keyup(label, key=key, debounce=300)
+    return st.text_input(label, key=key)
 
 
-def show_raw_data_cert():
-    st.header('Raw Certification Data')
+def show_raw_search(category):
+    st.subheader("Search Across DataFrames")
 
-    conn = st.connection('s3', type=FilesConnection)
-    df_raw_certs2 = conn.read("scoops-finder/imaging-data.csv", input_format="csv", ttl=600)
-    df_sorted = df_raw_certs2.sort_values(by="date_available_on_market", ascending=False)
+    # Search Box, results follow each keystroke when streamlit-keyup is installed
+    search_query = search_box("Enter a search term:", key=f"raw_search_{category}")
 
-    def extract_unique_countries(market_col):
-        unique_countries = set()
-        # Split each row's market string by comma and strip spaces
-        market_col.apply(lambda x: unique_countries.update(map(str.strip, x.split(','))))
-        return ['any'] + sorted(unique_countries)
+    if search_query:
+        # "Show more" raises the per-table limit until the query changes
+        limit_key = f"raw_search_limit_{category}"
+        if st.session_state.get(f"{limit_key}_query") != search_query:
+            st.session_state[f"{limit_key}_query"] = search_query
+            st.session_state[limit_key] = SEARCH_RESULTS_LIMIT
+        limit = st.session_state[limit_key]
 
-    unique_countries = extract_unique_countries(df_sorted['markets'])
+        # Token index lookups, best matches first, only the top rows materialized
+        results = search_raw_sources(category, search_query, limit=limit)
 
-    conn = st.connection('s3', type=FilesConnection)
-    df_raw_certs4 = conn.read("scoops-finder/baseline4.csv", input_format="csv", ttl=600)
+        if results:
+            st.caption(" · ".join(f"{df_name}: {count}" for df_name, (count, _) in results.items()))
+            for df_name, (count, result_df) in results.items():
+                st.subheader(f"Results from {df_name}:")
+                st.caption(f"Showing {len(result_df)} of {count} matches")
+                st.dataframe(result_df)
+            if any(count > limit for count, _ in results.values()):
+                if st.button("Show more", key=f"{limit_key}_more"):
+                    st.session_state[limit_key] += SEARCH_RESULTS_LIMIT
+                    st.rerun()
+        else:
+            st.write("No results found")
 
-    allowed_types = [
-        "Multifunction Device", 
-        "Printer", 
-        "Copier", 
-        "Professional Imaging Product", 
-        "Digital Duplicator"
-    ]
 
-    # Filter the DataFrame based on the allowed types
-    df_raw_certs4 = df_raw_certs4[df_raw_certs4['Product Type'].isin(allowed_types)]
+def display_global_search():
+    st.title("Search All Certifications 🔎")
+    st.markdown('---')
 
+    # One query over the Raw Data tables of every category, backed by a single shared index
+    search_query = search_box("Search Energy Star, EPEAT, WiFi, Bluetooth and MFi listings:", key="global_search")
+    selected_categories = st.multiselect('Categories', list(CATEGORY_LABELS),
+                                         default=list(CATEGORY_LABELS), format_func=CATEGORY_LABELS.get)
 
-    conn = st.connection('s3', type=FilesConnection)
-    df_raw_certs5 = conn.read("scoops-finder/baseline3.csv", input_format="csv", ttl=600)
-    df_raw_certs5 = df_raw_certs5[df_raw_certs5['Category'] == 'Computers & Accessories']
+    if not search_query:
+        return
 
-    conn = st.connection('s3', type=FilesConnection)
-    bt_data_raw = conn.read("scoops-finder/bluetooth.json", input_format="json", ttl=600)
-    bt_data_df = pd.json_normalize(bt_data_raw)
+    # "Show more" raises the per-table limit until the query changes
+    if st.session_state.get('global_search_limit_query') != search_query:
+        st.session_state['global_search_limit_query'] = search_query
+        st.session_state['global_search_limit'] = SEARCH_RESULTS_LIMIT
+    limit = st.session_state['global_search_limit']
 
-    companies_to_include = [
-        "Sharp Corporation", "Toshiba", "Brother Industries, Ltd", "Seiko Epson Corporation", "Canon Marketing Japan Inc.", "HP Inc.", "Ricoh Company Ltd", "XEROX", "Kyocera Corporation"
-    ]
+    results, facet_counts = search_everything(search_query, selected_categories, limit=limit)
+    st.caption(" · ".join(f"{CATEGORY_LABELS[category]}: {count}" for category, count in facet_counts.items()))
+    if not results:
+        st.write("No results found")
+    else:
+        for df_name, (count, result_df) in results.items():
+            st.subheader(f"Results from {df_name}:")
+            st.caption(f"Showing {len(result_df)} of {count} matches")
+            st.dataframe(result_df)
+        if any(count > limit for count, _ in results.values()):
+            if st.button("Show more", key="global_search_more"):
+                st.session_state['global_search_limit'] += SEARCH_RESULTS_LIMIT
+                st.rerun()
+
+    st.subheader("Model number matches")
+    model_matches = search_models(search_query, selected_categories)
+    if model_matches.empty:
+        st.write("No matching models found")
+    else:
+        st.dataframe(model_matches, use_container_width=True, hide_index=True)
 
-    # Filter the DataFrame
-    bt_data_df = bt_data_df[bt_data_df['CompanyName'].isin(companies_to_include)]    
 
-    mfi_data_raw = conn.read("scoops-finder/mfi.json", input_format="json", ttl=600)
-    content_data = mfi_data_raw.get("content", [])
-    mfi_data_df = pd.json_normalize(content_data)
-    mfi_data_df = mfi_data_df[mfi_data_df['brand'].isin(['Canon', 'Brother', 'EPSON', 'HP', 'TOSHIBA', 'SHARP'])]
-    mfi_data_df = mfi_data_df.rename(columns={
-        'upcEan': 'UPC',
-        'models': 'Models',
-        'brand': 'Brand',
-        'accessoryName': 'Accessory Name',
-        'accessoryCategory': 'Accessory Category',
-    }).loc[:, [
-        'UPC', 'Models', 'Brand', 'Accessory Name', 'Accessory Category'
-    ]]
+def show_raw_data_cert():
+    st.header('Raw Certification Data')
 
-    dfs = {'Energy Star': df_sorted, 'EPEAT Registry': df_raw_certs4, 'WiFi Alliance': df_raw_certs5, 'Bluetooth': bt_data_df, 'Apple MFI': mfi_data_df}
+    # Shared per data version; the filters below build new frames rather than editing these
+    dfs = raw_sources('imaging')
+    df_sorted = dfs['Energy Star']
 
-    st.subheader("Search Across DataFrames")
+    # Row bitmaps per filter value, built once per data version: each dropdown's options come
+    # from the selections above it and the rows are only taken once every filter is chosen
+    facets = raw_facets('imaging')
+    energy_star_filters = {}
 
-    # Search Box
-    search_query = st.text_input("Enter a search term:")
+    df_raw_certs4 = dfs['EPEAT Registry']
+    df_raw_certs5 = dfs['WiFi Alliance']
+    bt_data_df = dfs['Bluetooth']
+    mfi_data_df = dfs['Apple MFI']
 
-    if search_query:
-        search_query = search_query.lower()
-        
-        # Search logic
-        results = {}
-        for df_name, df in dfs.items():
-            matched_rows = df.apply(lambda row: row.astype(str).str.lower().str.contains(search_query).any(), axis=1)
-            matched_df = df[matched_rows]
-            if not matched_df.empty:
-                results[df_name] = matched_df
-        
-        if results:
-            for df_name, result_df in results.items():
-                st.subheader(f"Results from {df_name}:")
-                st.dataframe(result_df)
+    show_raw_search('imaging')
+
+    # Fuzzy lookup that ignores punctuation and spacing, e.g. "l8900" finds "MFC-L8900CDW"
+    model_query = st.text_input("Find a model number across sources:")
+    if model_query:
+        model_matches = search_models(model_query, ['imaging'])
+        if model_matches.empty:
+            st.write("No matching models found")
         else:
-            st.write("No results found")
+            st.dataframe(model_matches, use_container_width=True, hide_index=True)
 
     # Organizing filters into a 2x2 grid
     col1, col2 = st.columns(2)
     with col1:
         # Filter by product category
-        categories = ['any'] + list(df_sorted['product_type'].unique())
-        selected_category = st.selectbox('Select a product category', categories, index=0 if 'any' in categories else 1)
-        if selected_category != 'any':
-            df_sorted = df_sorted[df_sorted['product_type'] == selected_category]
-            
+        facet_selectbox('Select a product category', facets['Energy Star'], 'product_type', energy_star_filters,
+                        'imaging_energy_star')
 
         # Filter by brand
-        brands = ['any'] + list(df_sorted['brand_name'].unique())
-        selected_brand = st.selectbox('Select a brand', brands, index=0 if 'any' in brands else 1)
-        if selected_brand != 'any':
-            df_sorted = df_sorted[df_sorted['brand_name'] == selected_brand]
-
-        remanufactured_options = ['any'] + list(df_sorted['remanufactured_product'].unique())
-        selected_remanufactured = st.selectbox('Remanufactured Product', remanufactured_options, index=0)
-        if selected_remanufactured == 'Yes':
-            df_sorted = df_sorted[df_sorted['remanufactured_product'] == "Yes"]
-        elif selected_remanufactured == 'No':
-            df_sorted = df_sorted[df_sorted['remanufactured_product'] == "nan"]
+        facet_selectbox('Select a brand', facets['Energy Star'], 'brand_name', energy_star_filters,
+                        'imaging_energy_star')
+
+        # Labelled from the flag parsed at load time, blank upstream counts as No
+        facet_selectbox('Remanufactured Product', facets['Energy Star'], 'remanufactured_product', energy_star_filters,
+                        'imaging_energy_star', options=['any', 'Yes', 'No'])
 
     with col2:
         # Filter by Markets
-        selected_country = st.selectbox('Select a market', unique_countries, index=0 if 'any' in unique_countries else 1)
-        if selected_country != 'any':
-            df_sorted = df_sorted[df_sorted['markets'].apply(lambda x: selected_country in map(str.strip, x.split(',')))]
+        facet_selectbox('Select a market', facets['Energy Star'], 'markets', energy_star_filters, 'imaging_energy_star')
 
         # Filter by Color/Mono
-        color_capabilities = ['any'] + list(df_sorted['color_capability'].unique())
-        selected_color_capability = st.selectbox('Select a color capability', color_capabilities, index=0 if 'any' in color_capabilities else 1)
-        if selected_color_capability != 'any':
-            df_sorted = df_sorted[df_sorted['color_capability'] == selected_color_capability]
+        facet_selectbox('Select a color capability', facets['Energy Star'], 'color_capability', energy_star_filters,
+                        'imaging_energy_star')
 
         sort_options = {'date_qualified': 'Date Qualified', 'date_available_on_market': 'Date Available on Market'}
         selected_sort = st.selectbox('Sort by', options=list(sort_options.keys()), format_func=lambda x: sort_options[x], index=1)
-        df_sorted = df_sorted.sort_values(by=selected_sort, ascending=False)
+        # Pre-sorted row order with the filtered-out rows dropped, no sort per rerun
+        energy_star_rows = facets['Energy Star'].select(energy_star_filters, sort=selected_sort, ascending=False)
 
     # Display the filtered dataframe
-    df_sorted = df_sorted.rename(columns={
+    energy_star_names = {
         'pd_id': 'Energy Star ID',
         'date_available_on_market': 'Date Available on Market',
         'date_qualified': 'Date Qualified',
@@ -672,139 +508,104 @@ def show_raw_data_cert():
         'power_in_standby_w': 'Power in Standby (W)',
         'markets': 'Markets',
         'energy_star_model_identifier': 'Energy Star Model Identifier'
-    }).loc[:, [
+    }
+    energy_star_columns = [
         'Energy Star ID', 'Date Available on Market', 'Date Qualified', 'Brand', 'Model Name', 'Product Type',
         'UPC', 'Remanufactured Product', 'Color Capability', 'Mono Product Speed (ipm/ppm)', 'Auto Duplex Capable',
         'Typical Electricity Consumption (TEC) (kwh/wk)', 'Power in Sleep (W)', 'Power in Standby (W)', 'Markets',
         'Energy Star Model Identifier'
-    ]]     
+    ]
     
-    df_sorted['Date Available on Market'] = df_sorted['Date Available on Market'].str[:10]
-    df_sorted['Date Qualified'] = df_sorted['Date Qualified'].str[:10]
     
     st.subheader('Energy Star ⚡')
-    st.write(df_sorted)
+    paged_dataframe(df_sorted, 'imaging_energy_star', ['imaging'], state=(energy_star_filters, selected_sort),
+                    dates=['Date Available on Market', 'Date Qualified'],
+                    rows=energy_star_rows, rename=energy_star_names, columns=energy_star_columns)
 
 
     # Organizing filters into a 2x2 grid
     col1, col2 = st.columns(2)
     with col1:
         # Filter by product category
-        categories3 = ['any'] + list(df_raw_certs4['Product Type'].unique())
-        selected_category1 = st.selectbox('Select a product category', categories3, index=0 if 'any' in categories3 else 1)
-        if selected_category1 != 'any':
-            df_raw_certs4 = df_raw_certs4[df_raw_certs4['Product Type'] == selected_category1]
-            
-
-        brands = ['any'] + list(df_raw_certs4['Manufacturer'].unique())
-        selected_brand1 = st.selectbox('Select a brand', brands, index=0 if 'any' in brands else 1)
-        if selected_brand1 != 'any':
-            df_raw_certs4 = df_raw_certs4[df_raw_certs4['Manufacturer'] == selected_brand1]
-
-        remanufactured_options = ['any', 'Active', 'NA']
-        selected_remanufactured1 = st.selectbox('Status', remanufactured_options, index=0)
-        if selected_remanufactured1 == 'Active':
-            df_raw_certs4 = df_raw_certs4[df_raw_certs4['Status'] == "Active"]
-        elif selected_remanufactured1 == 'NA':
-            df_raw_certs4 = df_raw_certs4[df_raw_certs4['Status'] == False]
+        epeat_filters = {}
+        facet_selectbox('Select a product category', facets['EPEAT Registry'], 'Product Type', epeat_filters,
+                        'imaging_epeat')
+        facet_selectbox('Select a brand', facets['EPEAT Registry'], 'Manufacturer', epeat_filters, 'imaging_epeat')
+        facet_selectbox('Status', facets['EPEAT Registry'], 'Status', epeat_filters,
+                        'imaging_epeat', options=['any', 'Active', 'NA'])
 
     with col2:
-        # Filter by Market
-        markets = ['any'] + list(df_raw_certs4['Registered In'].unique())
-        # Defaulting to 'United States' if it exists in the options
-        default_market_index = markets.index('United States') if 'United States' in markets else 0
-        selected_market = st.selectbox('Select a market', markets, index=default_market_index)
-        if selected_market != 'any':
-            df_raw_certs4 = df_raw_certs4[df_raw_certs4['Registered In'] == selected_market]
-
+        # Filter by Market, defaulting to 'United States' if it exists in the options
+        facet_selectbox('Select a market', facets['EPEAT Registry'], 'Registered In', epeat_filters,
+                        'imaging_epeat', default='United States')
 
         # Filter by EPEAT Tier
-        color_capabilities1 = ['any'] + list(df_raw_certs4['EPEAT Tier'].unique())
-        selected_color_capability1 = st.selectbox('Select an EPEAT Tier', color_capabilities1, index=0 if 'any' in color_capabilities1 else 1)
-        if selected_color_capability1 != 'any':
-            df_raw_certs4 = df_raw_certs4[df_raw_certs4['EPEAT Tier'] == selected_color_capability1]
+        facet_selectbox('Select an EPEAT Tier', facets['EPEAT Registry'], 'EPEAT Tier', epeat_filters, 'imaging_epeat')
 
         # Filter by Registration Date
         sort_options = ['Newest', 'Oldest']
         selected_sort = st.selectbox('Sort by Registration Date', sort_options, index=0)  # Default to Newest
-        if selected_sort == 'Newest':
-            df_raw_certs4 = df_raw_certs4.sort_values(by='Registered On', ascending=False)
-        elif selected_sort == 'Oldest':
-            df_raw_certs4 = df_raw_certs4.sort_values(by='Registered On', ascending=True)
+        epeat_rows = facets['EPEAT Registry'].select(epeat_filters, sort='Registered On',
+                                            ascending=selected_sort == 'Oldest')
 
-    df_raw_certs4 = df_raw_certs4.rename(columns={
+    epeat_names = {
         'Id': 'EPEAT Identifier',
-    }).loc[:, [
+    }
+    epeat_columns = [
         'EPEAT Identifier', 'Registered On', 'Product Name', 'Manufacturer', 'Product Category', 'Product Type', 'Status',
         'Registered In', 'Climate+', 'Total Score', 'EPEAT Tier', 'Manufacturer Part Number', 'Universal Product Code'
-    ]]     
+    ]
     st.subheader('EPEAT 🌎')
-    st.write(df_raw_certs4)
+    paged_dataframe(df_raw_certs4, 'imaging_epeat', ['epeat'], state=(epeat_filters, selected_sort),
+                    dates=['Registered On'],
+                    rows=epeat_rows, rename=epeat_names, columns=epeat_columns)
 
     col1, col2 = st.columns(2)
     with col1:
         # Filter by product category
-        categories1 = ['any'] + list(df_raw_certs5['Category'].unique())
-        selected_category2 = st.selectbox('Select a product category', categories1, index=0 if 'any' in categories1 else 1)
-        if selected_category2 != 'any':
-            df_raw_certs5 = df_raw_certs5[df_raw_certs5['Category'] == selected_category2]
+        wifi_filters = {}
+        facet_selectbox('Select a product category', facets['WiFi Alliance'], 'Category', wifi_filters, 'imaging_wifi')
 
         # Filter by brand
-        brands = ['any'] + list(df_raw_certs5['Brand'].unique())
-        selected_brand2 = st.selectbox('Select a brand', brands, index=0 if 'any' in brands else 1)
-        if selected_brand2 != 'any':
-            df_raw_certs5 = df_raw_certs5[df_raw_certs5['Brand'] == selected_brand2]
+        facet_selectbox('Select a brand', facets['WiFi Alliance'], 'Brand', wifi_filters, 'imaging_wifi')
 
     with col2:
         # Filter by Registration Date
         sort_options = ['Newest', 'Oldest']
         selected_sort2 = st.selectbox('Sort by Date', sort_options, index=0)  # Default to Newest
-        if selected_sort2 == 'Newest':
-            df_raw_certs5 = df_raw_certs5.sort_values(by='Date of Last Certification', ascending=False)
-        elif selected_sort2 == 'Oldest':
-            df_raw_certs5 = df_raw_certs5.sort_values(by='Date of Last Certification', ascending=True)
+        wifi_rows = facets['WiFi Alliance'].select(wifi_filters, sort='Date of Last Certification',
+                                          ascending=selected_sort2 == 'Oldest')
 
     st.subheader('WiFi Alliance 📶')
-    st.write(df_raw_certs5)
-
-    st.markdown(
-    """
-    <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/5.15.4/css/all.min.css" rel="stylesheet">
-    """,
-    unsafe_allow_html=True
-    )
+    paged_dataframe(df_raw_certs5, 'imaging_wifi', ['wifi'], state=(wifi_filters, selected_sort2),
+                    dates=['Date of Last Certification'], rows=wifi_rows)
 
     st.markdown("### Bluetooth <i class='fab fa-bluetooth' style='color:blue'></i>", unsafe_allow_html=True)
-    bt_data_df = bt_data_df.rename(columns={
-        'ListingId': 'Listing ID',
-        'Name': 'Product Name',
-        'CompanyName': 'Brand',
-        'ListingDate': 'Certification Date',
-        'ProductListings': 'Product Listings',
-    }).loc[:, [
-        'Listing ID', 'Certification Date', 'Brand', 'Product Name', 'Product Listings'
-    ]]
-    bt_data_df['Certification Date'] = bt_data_df['Certification Date'].str[:10]   
     
     col1, col2 = st.columns(2)
     with col1:
         # Filter by brand
-        brands = ['any'] + list(bt_data_df['Brand'].unique())
-        selected_brand9 = st.selectbox('Select a brand', brands, index=0 if 'any' in brands else 1)
-        if selected_brand9 != 'any':
-            bt_data_df = bt_data_df[bt_data_df['Brand'] == selected_brand9]
+        bluetooth_filters = {}
+        facet_selectbox('Select a brand', facets['Bluetooth'], 'CompanyName', bluetooth_filters, 'imaging_bluetooth')
 
     with col2:
         # Filter by Registration Date
         sort_options = ['Newest', 'Oldest']
         selected_sort9 = st.selectbox('Sort by Date', sort_options, index=0, key='bluetooth_sort')  # Default to Newest
-        if selected_sort9 == 'Newest':
-            bt_data_df = bt_data_df.sort_values(by='Certification Date', ascending=False)
-        elif selected_sort9 == 'Oldest':
-            bt_data_df = bt_data_df.sort_values(by='Certification Date', ascending=True)
-    
-    
-    st.dataframe(bt_data_df, use_container_width=True)
+    bluetooth_rows = facets['Bluetooth'].select(bluetooth_filters, sort='ListingDate', ascending=selected_sort9 == 'Oldest')
+    bluetooth_names = {
+        'ListingId': 'Listing ID',
+        'Name': 'Product Name',
+        'CompanyName': 'Brand',
+        'ListingDate': 'Certification Date',
+        'ProductListings': 'Product Listings',
+    }
+    bluetooth_columns = [
+        'Listing ID', 'Certification Date', 'Brand', 'Product Name', 'Product Listings'
+    ]
+    paged_dataframe(bt_data_df, 'imaging_bluetooth', ['bluetooth'], state=(bluetooth_filters, selected_sort9),
+                    dates=['Certification Date'],
+                    rows=bluetooth_rows, rename=bluetooth_names, columns=bluetooth_columns)
 
     st.markdown("### Apple MFi <i class='fab fa-apple'></i>", unsafe_allow_html=True)
     col1, col2 = st.columns(2)
@@ -817,17 +618,17 @@ def show_raw_data_cert():
 
     with col2:
         st.empty()   
-    st.dataframe(mfi_data_df, use_container_width=True)
+    paged_dataframe(mfi_data_df, 'imaging_mfi', ['mfi'], state=selected_brand9)
 
 
 def show_changelog_cert():
     # Code to display changelog
+    prefetch_datasets("imaging_changelog", "epeat_changelog", "wifi_changelog")
     st.header('Changelogs')
     # Example: st.write(data_changelog)
     st.subheader('Energy Star ⚡')
     # Example: st.write(data_changelog)
-    conn = st.connection('s3', type=FilesConnection)
-    placement_changelog1 = conn.read("scoops-finder/imaging-changelog.csv", input_format="csv", ttl=600)
+    placement_changelog1 = load_dataset("imaging_changelog")
     df_clean = placement_changelog1.drop_duplicates(subset=['pd_id'])  # Drop duplicates based on 'pd_id'
     
     # Define the columns you want to keep
@@ -840,8 +641,6 @@ def show_changelog_cert():
     # Select only the specified columns
     df_clean = df_clean[columns_to_keep]
 
-    # Keep only the first 10 characters of the "Date" column
-    df_clean['Date Detected'] = df_clean['Date Detected'].str[:10]
 
     # Rename the columns
     df_clean.rename(columns={
@@ -857,14 +656,12 @@ def show_changelog_cert():
     }, inplace=True)
     
 
-    df_clean['Date Available on Market'] = df_clean['Date Available on Market'].str[:10]
-    df_clean['Date Qualified'] = df_clean['Date Qualified'].str[:10]
     df_clean = df_clean.sort_values(by='Date Detected', ascending=False)
-    st.dataframe(df_clean, use_container_width=True)
+    paged_dataframe(df_clean, 'imaging_energy_star_changelog', ['imaging_changelog'],
+                    dates=['Date Detected', 'Date Available on Market', 'Date Qualified'])
 
     st.subheader('EPEAT 🌎')
-    conn = st.connection('s3', type=FilesConnection)
-    placement_tracking2 = conn.read("scoops-finder/changelog-epeat.csv", input_format="csv", ttl=600)
+    placement_tracking2 = load_dataset("epeat_changelog")
     df_epeat_changelog = placement_tracking2
 
     columns_to_keep2 = ["Date Detected", "Registered On", "Product Name", "Manufacturer", "Climate+", "Product Category", 
@@ -875,139 +672,36 @@ def show_changelog_cert():
     
     # Rename the "Date" column to "Date Detected"
     df_epeat_changelog.rename(columns={'Date': 'Date Detected'}, inplace=True)
-    df_epeat_changelog['Date Detected'] = df_epeat_changelog['Date Detected'].str[:10]
-    df_epeat_changelog['Registered On'] = df_epeat_changelog['Registered On'].str[:10]
     df_epeat_changelog = df_epeat_changelog.sort_values(by='Date Detected', ascending=False)
     df_epeat_changelog = df_epeat_changelog[df_epeat_changelog['Product Category'].isin(['Imaging Equipment'])]
-    st.dataframe(df_epeat_changelog, use_container_width=True)
+    paged_dataframe(df_epeat_changelog, 'imaging_epeat_changelog', ['epeat_changelog'],
+                    dates=['Date Detected', 'Registered On'])
 
     st.subheader('WiFi Alliance 📶')
-    conn = st.connection('s3', type=FilesConnection)
-    placement_tracking3 = conn.read("scoops-finder/changelog-wifi.csv", input_format="csv", ttl=600)
+    placement_tracking3 = load_dataset("wifi_changelog")
 
     df_wifi_changelog = placement_tracking3
 
     columns_to_keep3 = ["Date", "Product", "Brand", "Model Number", "Category"]
 
     df_wifi_changelog = df_wifi_changelog[columns_to_keep3]
-    df_wifi_changelog['Date'] = df_wifi_changelog['Date'].str[:10]
     df_wifi_changelog.rename(columns={'Date': 'Date Detected'}, inplace=True)
     df_wifi_changelog = df_wifi_changelog.sort_values(by='Date Detected', ascending=False)
     
-    st.dataframe(df_wifi_changelog, use_container_width=True)
+    paged_dataframe(df_wifi_changelog, 'imaging_wifi_changelog', ['wifi_changelog'], dates=['Date Detected'])
 
 
 def show_insights_cert():
     # Code to display insights
     st.header('Insights')
     # Example: st.write(data_insights)
-    conn = st.connection('s3', type=FilesConnection)
-    df = conn.read("scoops-finder/imaging-data.csv", input_format="csv", ttl=600)
-
-    # Specify the columns to keep
-    columns_to_keep = ['brand_name', 'model_name', 'product_type',
-                    'color_capability', 'date_available_on_market', 'date_qualified',
-                    'markets', 'monochrome_product_speed_ipm_or_mppm']
-
-    # Create a new DataFrame with only the specified columns
-    new_df = df[columns_to_keep]
-
-    # Rename the columns
-    new_df = new_df.rename(columns={
-        'brand_name': 'Brand',
-        'model_name': 'Model',
-        'product_type': 'Product Type',
-        'color_capability': 'Color/Mono',
-        'date_available_on_market': 'Date Available',
-        'date_qualified': 'Date Qualified',
-        'markets': 'Target Markets',
-        'monochrome_product_speed_ipm_or_mppm': 'Print Speed'
-    })
-
-    # Specify the brands to filter
-    brands_to_show = ["Canon", "Brother", "HP", "Epson", "Konica Minolta", "Kyocera",
-                    "Lexmark", "Ricoh", "Sharp", "Toshiba", "Xerox", "Pantum", "Fujifilm", "HP Inc.", "Zhuhai Pantum Electronics Co., Ltd."]
-
-    # Specify the product types to filter
-    product_types_to_show = ['Printers', 'Multifunction Devices (MFD)']
-
-    # Cut off the "Date Available" and "Date Qualified" columns to remove anything after the first 10 digits
-    new_df['Date Available'] = new_df['Date Available'].str[:10]
-    new_df['Date Qualified'] = new_df['Date Qualified'].str[:10]
-
-    # Filter the new DataFrame to only include specified brands, product types, and hide entries with "Label Printer" in the Model column
-    filtered_df = new_df[(new_df['Brand'].isin(brands_to_show)) &
-                        (new_df['Product Type'].isin(product_types_to_show)) &
-                        (~new_df['Model'].str.contains('Model Printer|Label Printer', case=False))]
-
-    # Sort the filtered DataFrame by Date Available (Newest to Oldest)
-    filtered_df.sort_values(by='Date Available', ascending=False, inplace=True)
-    filtered_df.reset_index(drop=True, inplace=True)
-    estardf = filtered_df
-
-    # Print filtered results.
-    # Add metric to show latest 3 records based on product name
-    # latest_records = filtered_df.head(3)['Model'].tolist()
-    # st.metric("Latest 3 Products", ", ".join(latest_records))
-    # Create connection object and retrieve file contents.
-    # Specify input format is a csv and to cache the result for 600 seconds.
-    conn = st.connection('s3', type=FilesConnection)
-    df2 = conn.read("scoops-finder/baseline3.csv", input_format="csv", ttl=600)
-    # Keep only the desired columns
-    df2_modified = df2[["CID", "Date of Last Certification", "Brand", "Product", "Model Number"]]
-    # Filter by specified brands
-    df2_modified = df2_modified[df2_modified["Brand"].isin(brands_to_show)]
-    # Sort the dataframe by "Date of Last Certification", from newest to oldest
-    df2_modified.sort_values(by="Date of Last Certification", ascending=False, inplace=True)
-    df2_modified.reset_index(drop=True, inplace=True)
-    df2_modified.drop_duplicates(inplace=True)
-    # Write the modified dataframe
-    conn = st.connection('s3', type=FilesConnection)
-    df3 = conn.read("scoops-finder/baseline4.csv", input_format="csv", ttl=600)
-    # Keep only the desired columns
-    df3_modified = df3[["Id", "Registered On", "Product Type", "Product Name", "Manufacturer"]]
-    # Filter by specified brands
-    df3_modified = df3_modified[df3_modified["Manufacturer"].isin(brands_to_show)]
-    # Sort the dataframe by "Date of Last Certification", from newest to oldest
-    df3_modified.sort_values(by="Registered On", ascending=False, inplace=True)
-    df3_modified.reset_index(drop=True, inplace=True)
-    df3_modified.drop_duplicates(inplace=True)
-    # Write the modified dataframe
-    # Rename and remove columns for filtered_df
-    filtered_df = filtered_df.rename(columns={'Model': 'Product Name', 'Date Available': 'Certification Date'})
-    filtered_df = filtered_df.drop(columns=['Color/Mono', 'Date Qualified', 'Target Markets', 'Print Speed'])
-    filtered_df = filtered_df[['Product Name', 'Brand', 'Certification Date', 'Product Type']]
-    # Rename and remove columns for df2_modified
-    df2_modified = df2_modified.rename(columns={'Manufacturer': 'Brand', 'Product': 'Product Name', 'Date of Last Certification': 'Certification Date'})
-    df2_modified = df2_modified.drop(columns=['CID', 'Model Number'])
-    df2_modified = df2_modified[['Product Name', 'Brand', 'Certification Date']]
-    # Rename and remove columns for df3_modified
-    df3_modified = df3_modified.rename(columns={'Registered On': 'Certification Date', 'Manufacturer': 'Brand'})
-    df3_modified = df3_modified.drop(columns=['Id'])
-    df3_modified = df3_modified[['Product Name', 'Brand', 'Certification Date', 'Product Type']]
-    df3_modified = df3_modified[df3_modified['Product Type'].isin(['Printer', 'Multifunction Device'])]
-    
-    # Add a "Source" column to each dataframe
-    filtered_df['Source'] = 'Energy Star'
-    df2_modified['Source'] = 'WiFi Alliance'
-    df3_modified['Source'] = 'EPEAT Registry'
-    
-    # Concatenate the dataframes
-    combined_df = pd.concat([filtered_df, df2_modified, df3_modified], ignore_index=True)
-    # Assuming "Certification Date" is already in string format
-    # If not, convert it to string before truncating
-    
-    # Truncate the date to keep only the first 10 characters
-    # Convert the truncated date to datetime format
-    combined_df['Certification Date'] = pd.to_datetime(combined_df['Certification Date'], errors='coerce')
+    # Copy the shared frame, the charts below add their own columns to it
+    # Count each product once per source, re-listings of the same model share a Product ID
+    combined_df = first_per_product(combined_certifications('imaging'), by=['Source', 'Product ID']).copy()
     combined_df['Brand'] = combined_df['Brand'].replace('HP Inc.', 'HP')
-    # Sort the combined dataframe by "Certification Date" in descending order
-    combined_df.sort_values(by='Certification Date', ascending=False, inplace=True)
 
     st.title('Certification Analysis By Brand Over Time')
 
-    # Assuming combined_df is loaded correctly
-    combined_df['Certification Date'] = pd.to_datetime(combined_df['Certification Date'])
     combined_df['Quarter'] = combined_df['Certification Date'].dt.to_period('Q')
 
     # Sort quarters and create quarter strings
@@ -1066,8 +760,6 @@ def show_insights_cert():
 
     st.title('Certification Analysis By Brand Over Time')
 
-    # Assuming combined_df is loaded correctly
-    combined_df['Certification Date'] = pd.to_datetime(combined_df['Certification Date'])
     combined_df['Quarter'] = combined_df['Certification Date'].dt.to_period('Q')
     combined_df['Quarter String'] = combined_df['Quarter'].apply(lambda q: f'{q.year}-Q{q.quarter}')
     unique_quarters_str = [f'{q.year}-Q{q.quarter}' for q in combined_df['Quarter'].drop_duplicates().sort_values()]
@@ -1134,7 +826,6 @@ def show_insights_cert():
     st.title('Certification Analysis By Source Over Time')
 
    # Assuming combined_df is loaded correctly
-    combined_df['Certification Date'] = pd.to_datetime(combined_df['Certification Date'])
     combined_df['Quarter'] = combined_df['Certification Date'].dt.to_period('Q')
 
     # Sort quarters and create quarter strings
@@ -1204,8 +895,6 @@ def show_insights_cert():
 
     st.title('Certification by Brand This Quarter')
 
-    # Assuming combined_df is loaded correctly
-    combined_df['Certification Date'] = pd.to_datetime(combined_df['Certification Date'])
     combined_df['Quarter'] = combined_df['Certification Date'].dt.to_period('Q')
 
     # Sort quarters and create quarter strings
@@ -1288,262 +977,21 @@ def display_certifications_computers():
         show_insights_cert_computers()    
 
 def show_recent_cert_computers():
-    lnk = '<link rel="stylesheet" href="https://use.fontawesome.com/releases/v5.12.1/css/all.css" crossorigin="anonymous">'
-    wch_colour_font = (0, 0, 0)
-    fontsize = 14
-    valign = "left"
-    iconname = "fas fa-xmark"
-    sline = "New Certifications Detected"
-    container = st.container()
-
-    st.markdown('''
-    <style>
-    .grid-container {
-        display: grid;
-        grid-template-columns: repeat(3, 1fr); /* Maintains 3 columns */
-        grid-gap: 20px; /* Space between cards */
-        padding: 10px;
-        width: auto; /* Adjust based on the actual space available or use 100% if it should be fully responsive */
-    }
-
-    .card {
-        height: auto;
-        min-height: 120px;
-        position: relative;
-        width: 100%; /* This makes each card responsive within its grid column */
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        padding: 2px;
-        border-radius: 24px;
-        overflow: hidden;
-        line-height: 1.6;
-        transition: all 0.48s cubic-bezier(0.23, 1, 0.32, 1);
-        margin: 15px; /* Added margin */
-    }
-
-    .content {
-    width: 100%;
-    display: flex;
-    flex-direction: column;
-    align-items: flex-start;
-    gap: 24px;
-    padding: 20px;
-    padding-bottom: 0px;
-    border-radius: 22px;
-    color: #ffffff;
-    overflow: hidden;
-    background: #ffffff;
-    transition: all 0.48s cubic-bezier(0.23, 1, 0.32, 1);
-    }
-
-    .content .heading {
-    font-weight: 600;
-    font-size: 20px;
-    line-height: 1;
-    z-index: 1;
-    transition: all 0.48s cubic-bezier(0.23, 1, 0.32, 1);
-    }
-
-    .content .para {
-    z-index: 1;
-    opacity: 0.8;
-    font-size: 16px;
-    font-weight: 400;
-    transition: all 0.48s cubic-bezier(0.23, 1, 0.32, 1);
-    }
-
-    .card::before {
-    content: "";
-    position: absolute;
-    height: 500%;
-    width: 500%;
-    border-radius: inherit;
-    background: #3775cb;
-    background: linear-gradient(to right, #3775cb, #3775cb);
-    transform-origin: center;
-    }
-
-    .card:hover::before {
-    animation-play-state: running;
-    z-index: -1;
-    width: 20%;
-    }
-    .card:hover .content .heading,
-    .card:hover .content .para {
-    color: #000000;
-    }
-
-    .card:hover {
-    box-shadow: 0rem 6px 13px rgba(10, 60, 255, 0.1),
-        0rem 24px 24px rgba(10, 60, 255, 0.09),
-        0rem 55px 33px rgba(10, 60, 255, 0.05),
-        0rem 97px 39px rgba(10, 60, 255, 0.01), 0rem 152px 43px rgba(10, 60, 255, 0);
-    color: #000000;
-    }
-
-    </style>
-    ''', unsafe_allow_html=True)
-
-    emoji_dict = {
-            "Energy Star": "⚡",
-            "WiFi Alliance": "📶",
-            "EPEAT": "🌎"
-        }
-
-    # Sample data iteration - replace 'newest_records' with your actual DataFrame
-    
-    # Define the number of columns
-    num_columns = 2
-    conn = st.connection('s3', type=FilesConnection)
-    newest_records1 = conn.read("scoops-finder/computers-data.csv", input_format="csv", ttl=600)
-    newest_records1['model_name'] = newest_records1['model_name'].str.replace(r"\(ENERGY STAR\)", "", regex=True)
-
-    conn = st.connection('s3', type=FilesConnection)
-    newest_records2 = conn.read("scoops-finder/baseline4.csv", input_format="csv", ttl=600)
-    product_types = ["Notebook", "Desktop", "Integrated Desktop Computer", "Tablet", "Signage Display", "Workstation", "Thin Client"]
-    # Filter the DataFrame to include only the rows with the specified product types
-    newest_records2 = newest_records2[newest_records2["Product Type"].isin(product_types)]
-    newest_records2 = newest_records2[newest_records2["Registered In"] == "United States"]
-
-    
-    conn = st.connection('s3', type=FilesConnection)
-    newest_records3 = conn.read("scoops-finder/baseline3.csv", input_format="csv", ttl=600)
-    newest_records3 = newest_records3[newest_records3["Category"] == "Computers & Accessories"]
-
-    conn = st.connection('s3', type=FilesConnection)
-    newest_records4 = conn.read("scoops-finder/tco_data.json", input_format="json", ttl=600)
-    newest_records4 = pd.DataFrame(newest_records4)
-    # Display the filtered dataframe
-    newest_records4 = newest_records4.rename(columns={
-        'id': 'TCO ID',
-        'idkey': 'ID Key',
-        'brand': 'Brand',
-        'name': 'Product',
-        'category': 'Product Type',
-        'tec': 'TEC Value',
-        'cert_no': 'Certification Number',
-        'cert_id': 'Certification ID',
-        'cert_date': 'Date Certified',
-        'edge': 'Edge',
-        'recycled_plastic': 'Recycled Plastic',
-        'cert_expiry_date': 'Certification Expiry Date',
-        'enhanced_acoustic_limiting': 'Enhanced Acoustic Limiting',
-        'full_function_erg_stand': 'Full Function Erg Stand',
-        'halogen_free': 'Halogen Free',
-        'public_comment': "Public Comment",
-        'recycled_plastic_edge': 'Recycled Plastic Edge',
-        'size': 'Size',
-        'size_office': 'Size Office',
-        'size_video': 'Size Video',
-        'sound_power_level': 'Sound Power Level',
-        'latest_version': 'Version',
-        'resolution_height': 'Resolution Height',
-        'resolution_width': 'Resolution Width',
-        'total_weight': 'Total Weight',
-    }).loc[:, [
-        'Date Certified', 'Product Type', 'Brand', 'Product'
-    ]]
-    newest_records4 = newest_records4[newest_records4["Product Type"].isin(["Notebooks", "Desktops", "All-inOnePCs", "Tablets"])].sort_values(by="Date Certified", ascending=False)
-
-    # Rename columns to standardize across DataFrames
-    newest_records1.rename(columns={
-        'brand_name': 'Brand',
-        'model_name': 'Product',
-        'date_available_on_market': 'Date Certified',
-        'type': 'Product Type'
-    }, inplace=True)
+    # Newest 20 products, each once whichever sources list it, as one cached HTML grid
+    st.markdown(recent_cards('computers'), unsafe_allow_html=True)
 
-    newest_records2.rename(columns={
-        'Manufacturer': 'Brand',
-        'Product Name': 'Product',
-        'Registered On': 'Date Certified',
-        'Product Type': 'Product Type'
-    }, inplace=True)
 
-    newest_records3.rename(columns={
-        'Brand': 'Brand',
-        'Product': 'Product',
-        'Date of Last Certification': 'Date Certified',
-        'Category': 'Product Type'
-    }, inplace=True)
-
-    # Add a source column to each DataFrame
-    newest_records1['Source'] = 'Energy Star'
-    newest_records2['Source'] = 'EPEAT'
-    newest_records3['Source'] = 'WiFi Alliance'
-    newest_records4['Source'] = 'TCO'
-
-    # Combine the DataFrames
-    combined_df = pd.concat([newest_records1, newest_records2, newest_records3, newest_records4], ignore_index=True)
-    # Display the combined DataFrame
-    combined_df['Date Certified'] = combined_df['Date Certified'].str[:10]
-
-    combined_df = combined_df.sort_values('Date Certified', ascending=False)
-    combined_df = combined_df.head(20)
-    rows = [st.columns(num_columns) for _ in range((len(combined_df) + num_columns - 1) // num_columns)]
-    # Initialize a counter for DataFrame row indices
-    row_index = 0
-    emoji_dict = {
-            "Energy Star": "⚡",
-            "WiFi Alliance": "📶",
-            "EPEAT": "🌎",
-            "TCO": "♻️"
-        }    
-
-
-    # Fill each cell in the grid with content
-    for row in rows:
-        for col in row:
-            if row_index < len(combined_df):
-                with col:
-                    row_data = combined_df.iloc[row_index]
-                    product_name = row_data['Product']
-                    certification_date = row_data['Date Certified']
-                    brand = row_data['Brand']
-                    product_type = row_data['Product Type']
-                    source = row_data['Source']
-                    emoji = emoji_dict.get(source, "📝")
-                    # Embed data into HTML
-                    html_content = f"""
-                    <div class="card">
-                        <div class="content">
-                            <p class="heading">{product_name}</p>
-                            <p class="para">
-                                Brand: {brand}<br>
-                                Product Type: {product_type}<br>
-                                Certification Date: {certification_date}<br>
-                                Source: {source} {emoji}
-                            </p>
-                        </div>
-                    </div>
-                    """
-                    st.markdown(html_content, unsafe_allow_html=True)
-
-                    row_index += 1
-    
 def show_raw_data_cert_computers():
 
+    prefetch_datasets("computers", "epeat", "wifi", "tco", "bluetooth", "mfi")
     st.header('Raw Certification Data')
-    conn = st.connection('s3', type=FilesConnection)
-    newest_records = conn.read("scoops-finder/computers-data.csv", input_format="csv", ttl=600)
-    newest_records = newest_records.sort_values('date_available_on_market', ascending=False)
-
-    conn = st.connection('s3', type=FilesConnection)
-    epeat_data = conn.read("scoops-finder/baseline4.csv", input_format="csv", ttl=600)
-    epeat_data = epeat_data.query('`Product Category` == "Computers & Displays"')
-    epeat_data = epeat_data.sort_values('Registered On', ascending=False)
-    epeat_data = epeat_data.query('`Product Type` != "Monitors"')
+    # Shared per data version; the filters below build new frames rather than editing these
+    dfs = raw_sources('computers')
+    newest_records = dfs['Energy Star']
+    epeat_data = dfs['EPEAT Registry']
+    wifi_data = dfs['WiFi Alliance']
 
-    
-    conn = st.connection('s3', type=FilesConnection)
-    wifi_data = conn.read("scoops-finder/baseline3.csv", input_format="csv", ttl=600)
-    wifi_data = wifi_data.query('`Category` == "Computers & Accessories"')
-    wifi_data = wifi_data.sort_values('Date of Last Certification', ascending=False)
-
-    conn = st.connection('s3', type=FilesConnection)
-    tco_certs = conn.read("scoops-finder/tco_data.json", input_format="json", ttl=600)
-    tco_certs = pd.DataFrame(tco_certs)
+    tco_certs = load_dataset("tco")
     # Display the filtered dataframe
     tco_certs = tco_certs.rename(columns={
         'id': 'TCO ID',
@@ -1578,100 +1026,53 @@ def show_raw_data_cert_computers():
     tco_certs = tco_certs[tco_certs["Product Category"].isin(["Notebooks", "Desktops", "All-inOnePCs", "Tablets"])].sort_values(by="Certification Date", ascending=False)
 
 
-    def extract_unique_countries(market_col):
-        unique_countries = set()
-        # Split each row's market string by comma and strip spaces
-        market_col.apply(lambda x: unique_countries.update(map(str.strip, x.split(','))))
-        return ['any'] + sorted(unique_countries)
-
-    unique_countries = extract_unique_countries(newest_records['markets'])
+    # Row bitmaps per filter value, built once per data version: each dropdown's options come
+    # from the selections above it and the rows are only taken once every filter is chosen
+    facets = raw_facets('computers')
+    energy_star_filters = {}
 
 
-    conn = st.connection('s3', type=FilesConnection)
-    bt_data_raw = conn.read("scoops-finder/bluetooth.json", input_format="json", ttl=600)
-    bt_data_df = pd.json_normalize(bt_data_raw)
-
-    companies_to_include = [
-        "Sharp Corporation", "Toshiba Corporation", "Acer", "Apple Inc.", "Google LLC", "Lenovo (Singapore)", "Dell Computer Corporation", "Asustek Computer Inc.", "Acer Inc.", "Micro-Star International CO., LTD."
-    ]
+    bt_data_df = dfs['Bluetooth']
+    mfi_data_df = dfs['Apple MFI']
 
-    # Filter the DataFrame
-    bt_data_df = bt_data_df[bt_data_df['CompanyName'].isin(companies_to_include)]
-    bt_data_df['ListingDate'] = bt_data_df['ListingDate'].str[:10]
-    
+    show_raw_search('computers')
 
-    mfi_data_raw = conn.read("scoops-finder/mfi.json", input_format="json", ttl=600)
-    content_data = mfi_data_raw.get("content", [])
-    mfi_data_df = pd.json_normalize(content_data)
-    mfi_data_df = mfi_data_df[mfi_data_df['brand'].isin(['Lenovo', 'Razer', 'HP', 'TOSHIBA', 'SAMSUNG', "DELL"])]
-    
-    keywords = ["Printer", "Ink", "OfficeJet Pro", "DeskJet", "Speaker", "Sprocket", "Headset", "Tango", "Boombox"]
-    # Create a regex pattern that matches any of the keywords
-    pattern = '|'.join(keywords)
-    # Drop rows where accessoryName contains any of the keywords
-    mfi_data_df = mfi_data_df[~mfi_data_df['accessoryName'].str.contains(pattern, case=False, na=False)]
-
-
-    dfs = {'Energy Star': newest_records, 'EPEAT Registry': epeat_data, 'WiFi Alliance': wifi_data, 'Bluetooth': bt_data_df, 'Apple MFI': mfi_data_df}
-
-    st.subheader("Search Across DataFrames")
-
-    # Search Box
-    search_query = st.text_input("Enter a search term:")
-
-    if search_query:
-        search_query = search_query.lower()
-        
-        # Search logic
-        results = {}
-        for df_name, df in dfs.items():
-            matched_rows = df.apply(lambda row: row.astype(str).str.lower().str.contains(search_query).any(), axis=1)
-            matched_df = df[matched_rows]
-            if not matched_df.empty:
-                results[df_name] = matched_df
-        
-        if results:
-            for df_name, result_df in results.items():
-                st.subheader(f"Results from {df_name}:")
-                st.dataframe(result_df)
+    # Fuzzy lookup that ignores punctuation and spacing, e.g. "l8900" finds "MFC-L8900CDW"
+    model_query = st.text_input("Find a model number across sources:")
+    if model_query:
+        model_matches = search_models(model_query, ['computers'])
+        if model_matches.empty:
+            st.write("No matching models found")
         else:
-            st.write("No results found")
-
-    
-    unique_countries = extract_unique_countries(newest_records['markets'])
+            st.dataframe(model_matches, use_container_width=True, hide_index=True)
 
     col1, col2 = st.columns(2)
     with col1:
         # Filter by product category
-        categories = ['any'] + list(newest_records['type'].unique())
-        selected_category = st.selectbox('Select a product category', categories, index=0 if 'any' in categories else 1)
-        if selected_category != 'any':
-            newest_records = newest_records[newest_records['type'] == selected_category]
+        facet_selectbox('Select a product category', facets['Energy Star'], 'type', energy_star_filters,
+                        'computers_energy_star')
 
         # Filter by brand
-        brands = ['any'] + list(newest_records['brand_name'].unique())
-        selected_brand = st.selectbox('Select a brand', brands, index=0 if 'any' in brands else 1)
-        if selected_brand != 'any':
-            newest_records = newest_records[newest_records['brand_name'] == selected_brand]
+        facet_selectbox('Select a brand', facets['Energy Star'], 'brand_name', energy_star_filters,
+                        'computers_energy_star')
 
         sort_options = {'date_qualified': 'Date Qualified', 'date_available_on_market': 'Date Available on Market'}
         selected_sort = st.selectbox('Sort by', options=list(sort_options.keys()), format_func=lambda x: sort_options[x], index=1)
-        newest_records = newest_records.sort_values(by=selected_sort, ascending=False)
 
     with col2:
         # Filter by Markets
-        selected_country = st.selectbox('Select a market', unique_countries, index=0 if 'any' in unique_countries else 1)
-        if selected_country != 'any':
-            newest_records = newest_records[newest_records['markets'].apply(lambda x: selected_country in map(str.strip, x.split(',')))]
+        facet_selectbox('Select a market', facets['Energy Star'], 'markets', energy_star_filters,
+                        'computers_energy_star')
 
         # Filter by Color/Mono
-        color_capabilities = ['any'] + list(newest_records['touch_screen'].unique())
-        selected_color_capability = st.selectbox('Touch Screen', color_capabilities, index=0 if 'any' in color_capabilities else 1)
-        if selected_color_capability != 'any':
-            newest_records = newest_records[newest_records['touch_screen'] == selected_color_capability]
+        facet_selectbox('Touch Screen', facets['Energy Star'], 'touch_screen', energy_star_filters,
+                        'computers_energy_star')
+
+    # Pre-sorted row order with the filtered-out rows dropped, no sort per rerun
+    energy_star_rows = facets['Energy Star'].select(energy_star_filters, sort=selected_sort, ascending=False)
 
     # Display the filtered dataframe
-    newest_records = newest_records.rename(columns={
+    energy_star_names = {
         'pd_id': 'Energy Star ID',
         'date_available_on_market': 'Date Available on Market',
         'date_qualified': 'Date Qualified',
@@ -1692,107 +1093,80 @@ def show_raw_data_cert_computers():
         'bluetooh_capability': 'Bluetooth Capability',
         'markets': 'Markets',
         'energy_star_model_identifier': 'Energy Star Model Identifier'
-    }).loc[:, [
+    }
+    energy_star_columns = [
         'Energy Star ID', 'Date Available on Market', 'Date Qualified', 'Brand', 'Model Name', 'Model Number', 'Product Type', 'Touch Screen', 'Processor Brand', 'Processor Model', 'CPU Core Count',
         'Processor Base Clock Speed (ghz)', 'Operating System Name', 'System RAM', 'Product DIMM Count', 'Ethernet Capability', 'Bluetooth Capability', 'Markets',
         'Energy Star Model Identifier', 'UPC'
-    ]]
+    ]
     
-    newest_records['Date Available on Market'] = newest_records['Date Available on Market'].str[:10]
-    newest_records['Date Qualified'] = newest_records['Date Qualified'].str[:10]
     
     st.subheader('Energy Star ⚡')
-    st.write(newest_records)
+    paged_dataframe(newest_records, 'computers_energy_star', ['computers'], state=(energy_star_filters, selected_sort),
+                    dates=['Date Available on Market', 'Date Qualified'],
+                    rows=energy_star_rows, rename=energy_star_names, columns=energy_star_columns)
 
     col1, col2 = st.columns(2)
     with col1:
         # Filter by product category
-        categories3 = ['any'] + list(epeat_data['Product Type'].unique())
-        selected_category1 = st.selectbox('Select a product category', categories3, index=0 if 'any' in categories3 else 1)
-        if selected_category1 != 'any':
-            epeat_data = epeat_data[epeat_data['Product Type'] == selected_category1]
-            
-
-        brands = ['any'] + list(epeat_data['Manufacturer'].unique())
-        selected_brand1 = st.selectbox('Select a brand', brands, index=0 if 'any' in brands else 1)
-        if selected_brand1 != 'any':
-            epeat_data = epeat_data[epeat_data['Manufacturer'] == selected_brand1]
-
-        remanufactured_options = ['any', 'Active', 'NA']
-        selected_remanufactured1 = st.selectbox('Status', remanufactured_options, index=0)
-        if selected_remanufactured1 == 'Active':
-            epeat_data = epeat_data[epeat_data['Status'] == "Active"]
-        elif selected_remanufactured1 == 'NA':
-            epeat_data = epeat_data[epeat_data['Status'] == False]
+        epeat_filters = {}
+        facet_selectbox('Select a product category', facets['EPEAT Registry'], 'Product Type', epeat_filters,
+                        'computers_epeat')
+        facet_selectbox('Select a brand', facets['EPEAT Registry'], 'Manufacturer', epeat_filters, 'computers_epeat')
+        facet_selectbox('Status', facets['EPEAT Registry'], 'Status', epeat_filters,
+                        'computers_epeat', options=['any', 'Active', 'NA'])
 
     with col2:
-        # Filter by Market
-        markets = ['any'] + list(epeat_data['Registered In'].unique())
-        # Defaulting to 'United States' if it exists in the options
-        default_market_index = markets.index('United States') if 'United States' in markets else 0
-        selected_market = st.selectbox('Select a market', markets, index=default_market_index)
-        if selected_market != 'any':
-            epeat_data = epeat_data[epeat_data['Registered In'] == selected_market]
-
+        # Filter by Market, defaulting to 'United States' if it exists in the options
+        facet_selectbox('Select a market', facets['EPEAT Registry'], 'Registered In', epeat_filters,
+                        'computers_epeat', default='United States')
 
         # Filter by EPEAT Tier
-        color_capabilities1 = ['any'] + list(epeat_data['EPEAT Tier'].unique())
-        selected_color_capability1 = st.selectbox('Select an EPEAT Tier', color_capabilities1, index=0 if 'any' in color_capabilities1 else 1)
-        if selected_color_capability1 != 'any':
-            epeat_data = epeat_data[epeat_data['EPEAT Tier'] == selected_color_capability1]
+        facet_selectbox('Select an EPEAT Tier', facets['EPEAT Registry'], 'EPEAT Tier', epeat_filters,
+                        'computers_epeat')
 
         # Filter by Registration Date
         sort_options = ['Newest', 'Oldest']
         selected_sort = st.selectbox('Sort by Registration Date', sort_options, index=0)  # Default to Newest
-        if selected_sort == 'Newest':
-            epeat_data = epeat_data.sort_values(by='Registered On', ascending=False)
-        elif selected_sort == 'Oldest':
-            epeat_data = epeat_data.sort_values(by='Registered On', ascending=True)
+        epeat_rows = facets['EPEAT Registry'].select(epeat_filters, sort='Registered On',
+                                               ascending=selected_sort == 'Oldest')
 
 
-    epeat_data = epeat_data.rename(columns={
+    epeat_names = {
         'Id': 'EPEAT Identifier',
-    }).loc[:, [
+    }
+    epeat_columns = [
         'EPEAT Identifier', 'Registered On', 'Product Name', 'Manufacturer', 'Product Category', 'Product Type', 'Status',
         'Registered In', 'Climate+', 'Total Score', 'EPEAT Tier', 'Manufacturer Part Number', 'Universal Product Code'
-    ]]     
+    ]
     st.subheader('EPEAT 🌎')
-    st.write(epeat_data)
+    paged_dataframe(epeat_data, 'computers_epeat', ['epeat'], state=(epeat_filters, selected_sort),
+                    dates=['Registered On'],
+                    rows=epeat_rows, rename=epeat_names, columns=epeat_columns)
 
     col1, col2 = st.columns(2)
     with col1:
         # Filter by product category
-        categories1 = ['any'] + list(wifi_data['Category'].unique())
-        selected_category2 = st.selectbox('Select a product category', categories1, index=0 if 'any' in categories1 else 1)
-        if selected_category2 != 'any':
-            wifi_data = wifi_data[wifi_data['Category'] == selected_category2]
+        wifi_filters = {}
+        facet_selectbox('Select a product category', facets['WiFi Alliance'], 'Category', wifi_filters,
+                        'computers_wifi')
 
         # Filter by brand
-        brands = ['any'] + list(wifi_data['Brand'].unique())
-        selected_brand2 = st.selectbox('Select a brand', brands, index=0 if 'any' in brands else 1)
-        if selected_brand2 != 'any':
-            wifi_data = wifi_data[wifi_data['Brand'] == selected_brand2]
+        facet_selectbox('Select a brand', facets['WiFi Alliance'], 'Brand', wifi_filters, 'computers_wifi')
 
     with col2:
         # Filter by Registration Date
         sort_options = ['Newest', 'Oldest']
         selected_sort2 = st.selectbox('Sort by Date', sort_options, index=0)  # Default to Newest
-        if selected_sort2 == 'Newest':
-            wifi_data = wifi_data.sort_values(by='Date of Last Certification', ascending=False)
-        elif selected_sort2 == 'Oldest':
-            wifi_data = wifi_data.sort_values(by='Date of Last Certification', ascending=True)
+        wifi_rows = facets['WiFi Alliance'].select(wifi_filters, sort='Date of Last Certification',
+                                              ascending=selected_sort2 == 'Oldest')
     st.subheader('WiFi Alliance 📶')
-    st.write(wifi_data)
+    paged_dataframe(wifi_data, 'computers_wifi', ['wifi'], state=(wifi_filters, selected_sort2),
+                    dates=['Date of Last Certification'], rows=wifi_rows)
 
 
 
 
-    st.markdown(
-    """
-    <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/5.15.4/css/all.min.css" rel="stylesheet">
-    """,
-    unsafe_allow_html=True
-    )
     st.markdown("### TCO Certification <i class='fas fa-leaf' style='color:green'></i>", unsafe_allow_html=True)
 
     col1, col2 = st.columns(2)
@@ -1818,26 +1192,11 @@ def show_raw_data_cert_computers():
         elif selected_sort2 == 'Certification Expiry Date':
             tco_certs = tco_certs.sort_values(by='Certification Expiry Date', ascending=False)
 
-    st.dataframe(tco_certs)
+    paged_dataframe(tco_certs, 'computers_tco', ['tco'], state=(selected_category2, selected_brand2, selected_sort2),
+                    dates=['Certification Date', 'Certification Expiry Date'])
 
 
-    st.markdown(
-    """
-    <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/5.15.4/css/all.min.css" rel="stylesheet">
-    """,
-    unsafe_allow_html=True
-    )
-
     st.markdown("### Bluetooth <i class='fab fa-bluetooth' style='color:blue'></i>", unsafe_allow_html=True)
-    bt_data_df = bt_data_df.rename(columns={
-        'ListingId': 'Listing ID',
-        'Name': 'Product Name',
-        'CompanyName': 'Brand',
-        'ListingDate': 'Certification Date',
-        'ProductListings': 'Product Listings',
-    }).loc[:, [
-        'Listing ID', 'Certification Date', 'Brand', 'Product Name', 'Product Listings'
-    ]]
 
 
 
@@ -1845,33 +1204,28 @@ def show_raw_data_cert_computers():
     col1, col2 = st.columns(2)
     with col1:
         # Filter by brand
-        brands = ['any'] + list(bt_data_df['Brand'].unique())
-        selected_brand9 = st.selectbox('Select a brand', brands, index=0 if 'any' in brands else 1)
-        if selected_brand9 != 'any':
-            bt_data_df = bt_data_df[bt_data_df['Brand'] == selected_brand9]
+        bluetooth_filters = {}
+        facet_selectbox('Select a brand', facets['Bluetooth'], 'CompanyName', bluetooth_filters, 'computers_bluetooth')
 
     with col2:
         # Filter by Registration Date
         sort_options = ['Newest', 'Oldest']
         selected_sort9 = st.selectbox('Sort by Date', sort_options, index=0, key='bluetooth_sort')  # Default to Newest
-        if selected_sort9 == 'Newest':
-            bt_data_df = bt_data_df.sort_values(by='Certification Date', ascending=False)
-        elif selected_sort9 == 'Oldest':
-            bt_data_df = bt_data_df.sort_values(by='Certification Date', ascending=True)
-
-    st.dataframe(bt_data_df, use_container_width=True)
+    bluetooth_rows = facets['Bluetooth'].select(bluetooth_filters, sort='ListingDate', ascending=selected_sort9 == 'Oldest')
+    bluetooth_names = {
+        'ListingId': 'Listing ID',
+        'Name': 'Product Name',
+        'CompanyName': 'Brand',
+        'ListingDate': 'Certification Date',
+        'ProductListings': 'Product Listings',
+    }
+    bluetooth_columns = [
+        'Listing ID', 'Certification Date', 'Brand', 'Product Name', 'Product Listings'
+    ]
+    paged_dataframe(bt_data_df, 'computers_bluetooth', ['bluetooth'], state=(bluetooth_filters, selected_sort9),
+                    dates=['Certification Date'],
+                    rows=bluetooth_rows, rename=bluetooth_names, columns=bluetooth_columns)
     st.markdown("### Apple MFi <i class='fab fa-apple'></i>", unsafe_allow_html=True)
-
-    mfi_data_df = mfi_data_df.rename(columns={
-        'upcEan': 'UPC',
-        'models': 'Models',
-        'brand': 'Brand',
-        'accessoryName': 'Accessory Name',
-        'accessoryCategory': 'Accessory Category',
-    }).loc[:, [
-        'UPC', 'Models', 'Brand', 'Accessory Name', 'Accessory Category'
-    ]]
-
     col1, col2 = st.columns(2)
     with col1:
         # Filter by brand
@@ -1882,22 +1236,21 @@ def show_raw_data_cert_computers():
 
     with col2:
         st.empty()   
-    st.dataframe(mfi_data_df, use_container_width=True)
+    paged_dataframe(mfi_data_df, 'computers_mfi', ['mfi'], state=selected_brand9)
 
 
 
 def show_changelog_cert_computers():
     
+    prefetch_datasets("computers_changelog", "epeat_changelog", "wifi_changelog",
+                      "bluetooth_changelog", "mfi_changelog")
     st.header('Changelogs')
     # Example: st.write(data_changelog)
     st.subheader('Energy Star ⚡')
     # Example: st.write(data_changelog)
-    conn = st.connection('s3', type=FilesConnection)
-    placement_changelog1 = conn.read("scoops-finder/computers-changelog.csv", input_format="csv", ttl=600)
+    placement_changelog1 = load_dataset("computers_changelog")
     df_clean = placement_changelog1.drop_duplicates(subset=['pd_id'])  # Drop duplicates based on 'pd_id'
 
-    # Keep only the first 10 characters of the "Date" column
-    df_clean['Date Detected'] = df_clean['Date Detected'].str[:10]
     
     df_clean = df_clean.rename(columns={
         'Date Detected': 'Date Detected',
@@ -1927,14 +1280,12 @@ def show_changelog_cert_computers():
         'Energy Star Model Identifier', 'UPC', 'Energy Star ID'
     ]]
 
-    df_clean['Date Available on Market'] = df_clean['Date Available on Market'].str[:10]
-    df_clean['Date Qualified'] = df_clean['Date Qualified'].str[:10]
     df_clean = df_clean.sort_values(by='Date Detected', ascending=False)
-    st.write(df_clean, use_container_width=True)
+    paged_dataframe(df_clean, 'computers_energy_star_changelog', ['computers_changelog'],
+                    dates=['Date Detected', 'Date Available on Market', 'Date Qualified'])
 
     st.subheader('EPEAT 🌎')
-    conn = st.connection('s3', type=FilesConnection)
-    placement_tracking2 = conn.read("scoops-finder/changelog-epeat.csv", input_format="csv", ttl=600)
+    placement_tracking2 = load_dataset("epeat_changelog")
     df_epeat_changelog = placement_tracking2
 
     columns_to_keep2 = ["Date Detected", "Registered On", "Product Name", "Manufacturer", "Climate+", "Product Category", 
@@ -1945,50 +1296,31 @@ def show_changelog_cert_computers():
     
     # Rename the "Date" column to "Date Detected"
     df_epeat_changelog.rename(columns={'Date': 'Date Detected'}, inplace=True)
-    df_epeat_changelog['Date Detected'] = df_epeat_changelog['Date Detected'].str[:10]
-    df_epeat_changelog['Registered On'] = df_epeat_changelog['Registered On'].str[:10]
     df_epeat_changelog = df_epeat_changelog.sort_values(by='Date Detected', ascending=False)
     df_epeat_changelog = df_epeat_changelog[df_epeat_changelog['Product Type'].isin(['Desktop', 'Notebook', 'Tablet/Slate'])]
 
-    st.dataframe(df_epeat_changelog, use_container_width=True)
+    paged_dataframe(df_epeat_changelog, 'computers_epeat_changelog', ['epeat_changelog'],
+                    dates=['Date Detected', 'Registered On'])
 
     st.subheader('WiFi Alliance 📶')
-    conn = st.connection('s3', type=FilesConnection)
-    placement_tracking3 = conn.read("scoops-finder/changelog-wifi.csv", input_format="csv", ttl=600)
+    placement_tracking3 = load_dataset("wifi_changelog")
 
     df_wifi_changelog = placement_tracking3
 
     columns_to_keep3 = ["Date", "Product", "Brand", "Model Number", "Category"]
 
     df_wifi_changelog = df_wifi_changelog[columns_to_keep3]
-    df_wifi_changelog['Date'] = df_wifi_changelog['Date'].str[:10]
     df_wifi_changelog.rename(columns={'Date': 'Date Detected'}, inplace=True)
     df_wifi_changelog = df_wifi_changelog.sort_values(by='Date Detected', ascending=False)
 
-    st.dataframe(df_wifi_changelog, use_container_width=True)
+    paged_dataframe(df_wifi_changelog, 'computers_wifi_changelog', ['wifi_changelog'], dates=['Date Detected'])
 
-    st.markdown(
-    """
-    <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/5.15.4/css/all.min.css" rel="stylesheet">
-    """,
-    unsafe_allow_html=True
-    )
     
     st.markdown("### Bluetooth <i class='fab fa-bluetooth' style='color:blue'></i>", unsafe_allow_html=True)
 
-    conn = st.connection('s3', type=FilesConnection)
-    bt_data_raw = conn.read("scoops-finder/changelog-bluetooth.json", input_format="json", ttl=600)
-    bt_data_df = pd.json_normalize(bt_data_raw)
-
-    companies_to_include = [
-        "Xiaomi Inc.", "Dell Computer Corporation",
-        "Panasonic Holdings Corporation", "LG Electronics Inc.",
-        "Samsung Electronics Co., Ltd.", "NEC Personal Computers, Ltd.",
-        "Lenovo (Singapore) Pte Ltd.", "Acer Inc.", "Sharp Corporation",
-        "Toshiba Corporation", "Huawei Technologies Co., Ltd.",
-        "Microsoft Corporation", "Google LLC", "ASUStek Computer Inc.",
-        "Fujitsu Client Computing Limited", "Apple Inc."
-    ]
+    bt_data_df = load_dataset("bluetooth_changelog")
+
+    companies_to_include = BLUETOOTH_CHANGELOG_COMPANIES['computers']
 
     # Filter the DataFrame
     bt_data_df = bt_data_df[bt_data_df['CompanyName'].isin(companies_to_include)]
@@ -2002,15 +1334,11 @@ def show_changelog_cert_computers():
     }).loc[:, [
         'Date Detected', 'Listing ID', 'Certification Date', 'Brand', 'Product Name', 'Product Listings'
     ]]
-    bt_data_df['Date Detected'] = bt_data_df['Date Detected'].str[:10]
-    bt_data_df['Certification Date'] = bt_data_df['Certification Date'].str[:10]
-    st.dataframe(bt_data_df, use_container_width=True)
+    paged_dataframe(bt_data_df, 'computers_bluetooth_changelog', ['bluetooth_changelog'],
+                    dates=['Date Detected', 'Certification Date'])
     
     st.markdown("## Apple MFi <i class='fab fa-apple'></i>", unsafe_allow_html=True)
-    mfi_data_changelog = conn.read("scoops-finder/changelog-mfi.json", input_format="json", ttl=600)
-    # Extract only dictionary items from the list
-    content_data1 = [item for item in mfi_data_changelog if isinstance(item, dict)]
-    mfi_data_changelog_df = pd.json_normalize(content_data1)
+    mfi_data_changelog_df = load_dataset("mfi_changelog")
     mfi_data_changelog_df = mfi_data_changelog_df.rename(columns={
         'Date Detected': 'Date Detected',
         'upcEan': 'UPC',
@@ -2021,96 +1349,15 @@ def show_changelog_cert_computers():
     }).loc[:, [
         'Date Detected', 'UPC', 'Models', 'Brand', 'Accessory Name', 'Accessory Category'
     ]]
-    mfi_data_changelog_df['Date Detected'] = mfi_data_changelog_df['Date Detected'].str[:10]
-    st.dataframe(mfi_data_changelog_df, use_container_width=True)
+    paged_dataframe(mfi_data_changelog_df, 'computers_mfi_changelog', ['mfi_changelog'], dates=['Date Detected'])
 
 
 def show_insights_cert_computers():
     # Add industry-specific details or requirements.
 
-    conn = st.connection('s3', type=FilesConnection)
-    newest_records1 = conn.read("scoops-finder/computers-data.csv", input_format="csv", ttl=600)
-    newest_records1['model_name'] = newest_records1['model_name'].str.replace(r"\(ENERGY STAR\)", "", regex=True)
-
-    conn = st.connection('s3', type=FilesConnection)
-    newest_records2 = conn.read("scoops-finder/baseline4.csv", input_format="csv", ttl=600)
-    product_types = ["Notebook", "Desktop", "Integrated Desktop Computer", "Tablet", "Signage Display", "Workstation", "Thin Client"]
-    # Filter the DataFrame to include only the rows with the specified product types
-    newest_records2 = newest_records2[newest_records2["Product Type"].isin(product_types)]
-    newest_records2 = newest_records2[newest_records2["Registered In"] == "United States"]
-
-    
-    conn = st.connection('s3', type=FilesConnection)
-    newest_records3 = conn.read("scoops-finder/baseline3.csv", input_format="csv", ttl=600)
-    newest_records3 = newest_records3[newest_records3["Category"] == "Computers & Accessories"]
-
-    conn = st.connection('s3', type=FilesConnection)
-    newest_records4 = conn.read("scoops-finder/tco_data.json", input_format="json", ttl=600)
-    newest_records4 = pd.DataFrame(newest_records4)
-    # Display the filtered dataframe
-    newest_records4 = newest_records4.rename(columns={
-        'id': 'TCO ID',
-        'idkey': 'ID Key',
-        'brand': 'Brand',
-        'name': 'Product',
-        'category': 'Product Type',
-        'tec': 'TEC Value',
-        'cert_no': 'Certification Number',
-        'cert_id': 'Certification ID',
-        'cert_date': 'Date Certified',
-        'edge': 'Edge',
-        'recycled_plastic': 'Recycled Plastic',
-        'cert_expiry_date': 'Certification Expiry Date',
-        'enhanced_acoustic_limiting': 'Enhanced Acoustic Limiting',
-        'full_function_erg_stand': 'Full Function Erg Stand',
-        'halogen_free': 'Halogen Free',
-        'public_comment': "Public Comment",
-        'recycled_plastic_edge': 'Recycled Plastic Edge',
-        'size': 'Size',
-        'size_office': 'Size Office',
-        'size_video': 'Size Video',
-        'sound_power_level': 'Sound Power Level',
-        'latest_version': 'Version',
-        'resolution_height': 'Resolution Height',
-        'resolution_width': 'Resolution Width',
-        'total_weight': 'Total Weight',
-    }).loc[:, [
-        'Date Certified', 'Product Type', 'Brand', 'Product'
-    ]]
-    newest_records4 = newest_records4[newest_records4["Product Type"].isin(["Notebooks", "Desktops", "All-inOnePCs", "Tablets"])].sort_values(by="Date Certified", ascending=False)
-
-    # Rename columns to standardize across DataFrames
-    newest_records1.rename(columns={
-        'brand_name': 'Brand',
-        'model_name': 'Product',
-        'date_available_on_market': 'Date Certified',
-        'type': 'Product Type'
-    }, inplace=True)
-
-    newest_records2.rename(columns={
-        'Manufacturer': 'Brand',
-        'Product Name': 'Product',
-        'Registered On': 'Date Certified',
-        'Product Type': 'Product Type'
-    }, inplace=True)
-
-    newest_records3.rename(columns={
-        'Brand': 'Brand',
-        'Product': 'Product',
-        'Date of Last Certification': 'Date Certified',
-        'Category': 'Product Type'
-    }, inplace=True)
-
-    # Add a source column to each DataFrame
-    newest_records1['Source'] = 'Energy Star'
-    newest_records2['Source'] = 'EPEAT'
-    newest_records3['Source'] = 'WiFi Alliance'
-    newest_records4['Source'] = 'TCO'
-
-    # Combine the DataFrames
-    combined_df = pd.concat([newest_records1, newest_records2, newest_records3, newest_records4], ignore_index=True)
-    # Display the combined DataFrame
-    combined_df['Date Certified'] = combined_df['Date Certified'].str[:10]
+    # Copy the shared frame, the charts below add their own columns to it
+    # Count each product once per source, re-listings of the same model share a Product ID
+    combined_df = first_per_product(combined_certifications('computers'), by=['Source', 'Product ID']).copy()
 
     combined_df['Brand'] = combined_df['Brand'].replace({
     "ASUSTeK Computer Inc.": "ASUS",
@@ -2133,9 +1380,7 @@ def show_insights_cert_computers():
      
 
     st.title('Certification Analysis By Brand Over Time')
-    # Assuming combined_df is loaded correctly
-    combined_df['Date Certified'] = pd.to_datetime(combined_df['Date Certified'])
-    combined_df['Quarter'] = combined_df['Date Certified'].dt.to_period('Q')
+    combined_df['Quarter'] = combined_df['Certification Date'].dt.to_period('Q')
 
     # Sort quarters and create quarter strings
     unique_quarters = combined_df['Quarter'].drop_duplicates().sort_values()
@@ -2194,9 +1439,7 @@ def show_insights_cert_computers():
 
     st.title('Certification Analysis By Brand Over Time')
 
-    # Assuming combined_df is loaded correctly
-    combined_df['Date Certified'] = pd.to_datetime(combined_df['Date Certified'])
-    combined_df['Quarter'] = combined_df['Date Certified'].dt.to_period('Q')
+    combined_df['Quarter'] = combined_df['Certification Date'].dt.to_period('Q')
     combined_df['Quarter String'] = combined_df['Quarter'].apply(lambda q: f'{q.year}-Q{q.quarter}')
     unique_quarters_str = [f'{q.year}-Q{q.quarter}' for q in combined_df['Quarter'].drop_duplicates().sort_values()]
 
@@ -2262,8 +1505,7 @@ def show_insights_cert_computers():
     st.title('Certification Analysis By Source Over Time')
 
    # Assuming combined_df is loaded correctly
-    combined_df['Date Certified'] = pd.to_datetime(combined_df['Date Certified'])
-    combined_df['Quarter'] = combined_df['Date Certified'].dt.to_period('Q')
+    combined_df['Quarter'] = combined_df['Certification Date'].dt.to_period('Q')
 
     # Sort quarters and create quarter strings
     unique_quarters = combined_df['Quarter'].drop_duplicates().sort_values()
@@ -2330,9 +1572,7 @@ def show_insights_cert_computers():
 
     st.title('Certification by Brand This Quarter')
 
-    # Assuming combined_df is loaded correctly
-    combined_df['Date Certified'] = pd.to_datetime(combined_df['Date Certified'])
-    combined_df['Quarter'] = combined_df['Date Certified'].dt.to_period('Q')
+    combined_df['Quarter'] = combined_df['Certification Date'].dt.to_period('Q')
 
     # Sort quarters and create quarter strings
     unique_quarters = combined_df['Quarter'].drop_duplicates().sort_values(ascending=True)  # Sort ascending
@@ -2417,292 +1657,64 @@ def display_certifications_televisions():
 
 
 def show_recent_cert_televisions():
-    lnk = '<link rel="stylesheet" href="https://use.fontawesome.com/releases/v5.12.1/css/all.css" crossorigin="anonymous">'
-    wch_colour_font = (0, 0, 0)
-    fontsize = 14
-    valign = "left"
-    iconname = "fas fa-xmark"
-    sline = "New Certifications Detected"
-    container = st.container()
-
-    st.markdown('''
-    <style>
-    .grid-container {
-        display: grid;
-        grid-template-columns: repeat(3, 1fr); /* Maintains 3 columns */
-        grid-gap: 20px; /* Space between cards */
-        padding: 10px;
-        width: auto; /* Adjust based on the actual space available or use 100% if it should be fully responsive */
-    }
-
-    .card {
-        height: auto;
-        min-height: 120px;
-        position: relative;
-        width: 100%; /* This makes each card responsive within its grid column */
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        padding: 2px;
-        border-radius: 24px;
-        overflow: hidden;
-        line-height: 1.6;
-        transition: all 0.48s cubic-bezier(0.23, 1, 0.32, 1);
-        margin: 15px; /* Added margin */
-    }
-
-    .content {
-    width: 100%;
-    display: flex;
-    flex-direction: column;
-    align-items: flex-start;
-    gap: 24px;
-    padding: 20px;
-    padding-bottom: 0px;
-    border-radius: 22px;
-    color: #ffffff;
-    overflow: hidden;
-    background: #ffffff;
-    transition: all 0.48s cubic-bezier(0.23, 1, 0.32, 1);
-    }
-
-    .content .heading {
-    font-weight: 600;
-    font-size: 20px;
-    line-height: 1;
-    z-index: 1;
-    transition: all 0.48s cubic-bezier(0.23, 1, 0.32, 1);
-    }
-
-    .content .para {
-    z-index: 1;
-    opacity: 0.8;
-    font-size: 16px;
-    font-weight: 400;
-    transition: all 0.48s cubic-bezier(0.23, 1, 0.32, 1);
-    }
-
-    .card::before {
-    content: "";
-    position: absolute;
-    height: 500%;
-    width: 500%;
-    border-radius: inherit;
-    background: #3775cb;
-    background: linear-gradient(to right, #3775cb, #3775cb);
-    transform-origin: center;
-    }
-
-    .card:hover::before {
-    animation-play-state: running;
-    z-index: -1;
-    width: 20%;
-    }
-    .card:hover .content .heading,
-    .card:hover .content .para {
-    color: #000000;
-    }
-
-    .card:hover {
-    box-shadow: 0rem 6px 13px rgba(10, 60, 255, 0.1),
-        0rem 24px 24px rgba(10, 60, 255, 0.09),
-        0rem 55px 33px rgba(10, 60, 255, 0.05),
-        0rem 97px 39px rgba(10, 60, 255, 0.01), 0rem 152px 43px rgba(10, 60, 255, 0);
-    color: #000000;
-    }
-
-    </style>
-    ''', unsafe_allow_html=True)
-
-    emoji_dict = {
-            "Energy Star": "⚡",
-            "WiFi Alliance": "📶",
-            "EPEAT": "🌎"
-        }
-
-    # Sample data iteration - replace 'newest_records' with your actual DataFrame
-    
-    # Define the number of columns
-    num_columns = 2
-    conn = st.connection('s3', type=FilesConnection)
-    newest_records1 = conn.read("scoops-finder/televisions-data.csv", input_format="csv", ttl=600)
-
-    conn = st.connection('s3', type=FilesConnection)
-    newest_records2 = conn.read("scoops-finder/baseline3.csv", input_format="csv", ttl=600)
-    newest_records2 = newest_records2[newest_records2["Category"] == "Televisions & Set Top Boxes"]
-
-    # Rename columns to standardize across DataFrames
-    newest_records1.rename(columns={
-        'brand_name': 'Brand',
-        'model_name': 'Product',
-        'date_available_on_market': 'Date Certified',
-        'product_type': 'Product Type'
-    }, inplace=True)
-
-    newest_records2.rename(columns={
-        'Brand': 'Brand',
-        'Product': 'Product',
-        'Date of Last Certification': 'Date Certified',
-        'Category': 'Product Type'
-    }, inplace=True)
-
-    # Add a source column to each DataFrame
-    newest_records1['Source'] = 'Energy Star'
-    newest_records2['Source'] = 'WiFi Alliance'
-
-    # Combine the DataFrames
-    combined_df = pd.concat([newest_records1, newest_records2], ignore_index=True)
-    # Display the combined DataFrame
-    combined_df = combined_df.sort_values('Date Certified', ascending=False)
-    combined_df['Date Certified'] = combined_df['Date Certified'].str[:10]
-    combined_df = combined_df.head(20)
-    rows = [st.columns(num_columns) for _ in range((len(combined_df) + num_columns - 1) // num_columns)]
-    # Initialize a counter for DataFrame row indices
-    row_index = 0
-    emoji_dict = {
-            "Energy Star": "⚡",
-            "WiFi Alliance": "📶",
-            "EPEAT": "🌎"
-        }    
-
-    # Fill each cell in the grid with content
-    for row in rows:
-        for col in row:
-            if row_index < len(combined_df):
-                with col:
-                    row_data = combined_df.iloc[row_index]
-                    product_name = row_data['Product']
-                    certification_date = row_data['Date Certified']
-                    brand = row_data['Brand']
-                    product_type = row_data['Product Type']
-                    source = row_data['Source']
-                    emoji = emoji_dict.get(source, "📝")
-                    # Embed data into HTML
-                    html_content = f"""
-                    <div class="card">
-                        <div class="content">
-                            <p class="heading">{product_name}</p>
-                            <p class="para">
-                                Brand: {brand}<br>
-                                Product Type: {product_type}<br>
-                                Certification Date: {certification_date}<br>
-                                Source: {source} {emoji}
-                            </p>
-                        </div>
-                    </div>
-                    """
-                    st.markdown(html_content, unsafe_allow_html=True)
-
-                    row_index += 1
+    # Newest 20 products, each once whichever sources list it, as one cached HTML grid
+    st.markdown(recent_cards('televisions'), unsafe_allow_html=True)
 
 
 def show_raw_data_cert_televisions():
     
     # Add industry-specific details or requirements.
     st.subheader('Energy Star ⚡')
-    conn = st.connection('s3', type=FilesConnection)
-    newest_records = conn.read("scoops-finder/televisions-data.csv", input_format="csv", ttl=600)
-    newest_records = newest_records.sort_values('date_available_on_market', ascending=False)
-
-    conn = st.connection('s3', type=FilesConnection)
-    wifi_data = conn.read("scoops-finder/baseline3.csv", input_format="csv", ttl=600)
-    wifi_data = wifi_data.query('`Category` == "Televisions & Set Top Boxes"')
-    wifi_data = wifi_data.sort_values('Date of Last Certification', ascending=False)
-
-    def extract_unique_countries(market_col):
-        unique_countries = set()
-        # Split each row's market string by comma and strip spaces
-        market_col.apply(lambda x: unique_countries.update(map(str.strip, x.split(','))))
-        return ['any'] + sorted(unique_countries)
-
-    unique_countries = extract_unique_countries(newest_records['markets'])
+    # Shared per data version; the filters below build new frames rather than editing these
+    dfs = raw_sources('televisions')
+    newest_records = dfs['Energy Star']
+    wifi_data = dfs['WiFi Alliance']
 
+    # Row bitmaps per filter value, built once per data version: each dropdown's options come
+    # from the selections above it and the rows are only taken once every filter is chosen
+    facets = raw_facets('televisions')
+    energy_star_filters = {}
 
-    conn = st.connection('s3', type=FilesConnection)
-    bt_data_raw = conn.read("scoops-finder/bluetooth.json", input_format="json", ttl=600)
-    bt_data_df = pd.json_normalize(bt_data_raw)
-
-    companies_to_include = [
-        "Sharp Corporation", "Hisense Company Limited", "AmTRAN Technology Co., Ltd", "TCL Communication Ltd.", "LG Electronics Inc.", "Samsung Electronics Co., Ltd."
-    ]
-
-    # Filter the DataFrame
-    bt_data_df = bt_data_df[bt_data_df['CompanyName'].isin(companies_to_include)]    
-    bt_data_df["ListingDate"] = bt_data_df["ListingDate"].str[:10]
-
-
-    mfi_data_raw = conn.read("scoops-finder/mfi.json", input_format="json", ttl=600)
-    content_data = mfi_data_raw.get("content", [])
-    mfi_data_df = pd.json_normalize(content_data)
-    mfi_data_df = mfi_data_df[mfi_data_df['brand'].isin(['Sony', 'LG', 'TCL', 'Hisense', 'JVCKENWOOD Corporation', 'SHARP'])]
-    mfi_data_df = mfi_data_df.rename(columns={
-        'upcEan': 'UPC',
-        'models': 'Models',
-        'brand': 'Brand',
-        'accessoryName': 'Accessory Name',
-        'accessoryCategory': 'Accessory Category',
-    }).loc[:, [
-        'UPC', 'Models', 'Brand', 'Accessory Name', 'Accessory Category'
-    ]]
-
-    dfs = {'Energy Star': newest_records, 'WiFi Alliance': wifi_data, 'Bluetooth': bt_data_df, 'Apple MFI': mfi_data_df}
 
-    st.subheader("Search Across DataFrames")
+    bt_data_df = dfs['Bluetooth']
+    mfi_data_df = dfs['Apple MFI']
 
-    # Search Box
-    search_query = st.text_input("Enter a search term:")
+    show_raw_search('televisions')
 
-    if search_query:
-        search_query = search_query.lower()
-        
-        # Search logic
-        results = {}
-        for df_name, df in dfs.items():
-            matched_rows = df.apply(lambda row: row.astype(str).str.lower().str.contains(search_query).any(), axis=1)
-            matched_df = df[matched_rows]
-            if not matched_df.empty:
-                results[df_name] = matched_df
-        
-        if results:
-            for df_name, result_df in results.items():
-                st.subheader(f"Results from {df_name}:")
-                st.dataframe(result_df)
+    # Fuzzy lookup that ignores punctuation and spacing, e.g. "l8900" finds "MFC-L8900CDW"
+    model_query = st.text_input("Find a model number across sources:")
+    if model_query:
+        model_matches = search_models(model_query, ['televisions'])
+        if model_matches.empty:
+            st.write("No matching models found")
         else:
-            st.write("No results found")
-
-    
-    unique_countries = extract_unique_countries(newest_records['markets'])
+            st.dataframe(model_matches, use_container_width=True, hide_index=True)
 
     col1, col2 = st.columns(2)
     with col1:
         # Filter by product category
-        categories = ['any'] + list(newest_records['product_type'].unique())
-        selected_category = st.selectbox('Select a product category', categories, index=0 if 'any' in categories else 1)
-        if selected_category != 'any':
-            newest_records = newest_records[newest_records['product_type'] == selected_category]
+        facet_selectbox('Select a product category', facets['Energy Star'], 'product_type', energy_star_filters,
+                        'televisions_energy_star')
 
         # Filter by brand
-        brands = ['any'] + list(newest_records['brand_name'].unique())
-        selected_brand = st.selectbox('Select a brand', brands, index=0 if 'any' in brands else 1)
-        if selected_brand != 'any':
-            newest_records = newest_records[newest_records['brand_name'] == selected_brand]
+        facet_selectbox('Select a brand', facets['Energy Star'], 'brand_name', energy_star_filters,
+                        'televisions_energy_star')
 
         sort_options = {'date_qualified': 'Date Qualified', 'date_available_on_market': 'Date Available on Market'}
         selected_sort = st.selectbox('Sort by', options=list(sort_options.keys()), format_func=lambda x: sort_options[x], index=1)
-        newest_records = newest_records.sort_values(by=selected_sort, ascending=False)
 
     with col2:
         # Filter by Markets
-        selected_country = st.selectbox('Select a market', unique_countries, index=0 if 'any' in unique_countries else 1)
-        if selected_country != 'any':
-            newest_records = newest_records[newest_records['markets'].apply(lambda x: selected_country in map(str.strip, x.split(',')))]
+        facet_selectbox('Select a market', facets['Energy Star'], 'markets', energy_star_filters,
+                        'televisions_energy_star')
 
         # Filter by Color/Mono
-        color_capabilities = ['any'] + list(newest_records['display_type'].unique())
-        selected_color_capability = st.selectbox('Display Type', color_capabilities, index=0 if 'any' in color_capabilities else 1)
-        if selected_color_capability != 'any':
-            newest_records = newest_records[newest_records['display_type'] == selected_color_capability]
-    newest_records = newest_records.rename(columns={
+        facet_selectbox('Display Type', facets['Energy Star'], 'display_type', energy_star_filters,
+                        'televisions_energy_star')
+
+    # Pre-sorted row order with the filtered-out rows dropped, no sort per rerun
+    energy_star_rows = facets['Energy Star'].select(energy_star_filters, sort=selected_sort, ascending=False)
+    energy_star_names = {
         'pd_id': 'Energy Star ID',
         'date_available_on_market': 'Date Available on Market',
         'date_qualified': 'Date Qualified',
@@ -2726,80 +1738,68 @@ def show_raw_data_cert_televisions():
         'additional_model_information': 'Additional Model Information',
         'markets': 'Markets',
         'energy_star_model_identifier': 'Energy Star Model Identifier'
-    }).loc[:, [
+    }
+    energy_star_columns = [
         'Energy Star ID', 'Date Available on Market', 'Date Qualified', 'Brand', 'Model Name', 'Model Number', 'Product Type', 'Application',  'Resolution Format', 'Display Type', 'Backlit Technology Type', 'Diagonal Viewable Screen Size (in)',
         'Screen Area (Square in)', 'Native Horizontal Resolution Pixels', 'Native Vertical Resolution Pixels', 'High Contrast Ratio HCR Display', 'Low Power Wireless Technologies Supported', 'Features', 'Automatic Brightness Control', 'Additional Model Information', 'Markets',
         'Energy Star Model Identifier', 'UPC'
-    ]] 
+    ]
     
-    newest_records['Date Available on Market'] = newest_records['Date Available on Market'].str[:10]
-    newest_records['Date Qualified'] = newest_records['Date Qualified'].str[:10]    
     
     st.subheader('Energy Star ⚡')
-    st.write(newest_records)
+    paged_dataframe(newest_records, 'televisions_energy_star', ['televisions'], state=(energy_star_filters, selected_sort),
+                    dates=['Date Available on Market', 'Date Qualified'],
+                    rows=energy_star_rows, rename=energy_star_names, columns=energy_star_columns)
 
     col1, col2 = st.columns(2)
     with col1:
         # Filter by product category
-        categories1 = ['any'] + list(wifi_data['Category'].unique())
-        selected_category2 = st.selectbox('Select a product category', categories1, index=0 if 'any' in categories1 else 1)
-        if selected_category2 != 'any':
-            wifi_data = wifi_data[wifi_data['Category'] == selected_category2]
+        wifi_filters = {}
+        facet_selectbox('Select a product category', facets['WiFi Alliance'], 'Category', wifi_filters,
+                        'televisions_wifi')
 
         # Filter by brand
-        brands = ['any'] + list(wifi_data['Brand'].unique())
-        selected_brand2 = st.selectbox('Select a brand', brands, index=0 if 'any' in brands else 1)
-        if selected_brand2 != 'any':
-            wifi_data = wifi_data[wifi_data['Brand'] == selected_brand2]
+        facet_selectbox('Select a brand', facets['WiFi Alliance'], 'Brand', wifi_filters, 'televisions_wifi')
 
     with col2:
         # Filter by Registration Date
         sort_options = ['Newest', 'Oldest']
         selected_sort2 = st.selectbox('Sort by Date', sort_options, index=0)  # Default to Newest
-        if selected_sort2 == 'Newest':
-            wifi_data = wifi_data.sort_values(by='Date of Last Certification', ascending=False)
-        elif selected_sort2 == 'Oldest':
-            wifi_data = wifi_data.sort_values(by='Date of Last Certification', ascending=True)
+        wifi_rows = facets['WiFi Alliance'].select(wifi_filters, sort='Date of Last Certification',
+                                              ascending=selected_sort2 == 'Oldest')
 
     st.subheader('WiFi Alliance 📶')
-    st.write(wifi_data)
-
-    st.markdown(
-    """
-    <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/5.15.4/css/all.min.css" rel="stylesheet">
-    """,
-    unsafe_allow_html=True
-    )
+    paged_dataframe(wifi_data, 'televisions_wifi', ['wifi'], state=(wifi_filters, selected_sort2),
+                    dates=['Date of Last Certification'], rows=wifi_rows)
 
     st.markdown("### Bluetooth <i class='fab fa-bluetooth' style='color:blue'></i>", unsafe_allow_html=True)
-    bt_data_df = bt_data_df.rename(columns={
-        'ListingId': 'Listing ID',
-        'Name': 'Product Name',
-        'CompanyName': 'Brand',
-        'ListingDate': 'Certification Date',
-        'ProductListings': 'Product Listings',
-    }).loc[:, [
-        'Listing ID', 'Certification Date', 'Brand', 'Product Name', 'Product Listings'
-    ]]
 
 
     col1, col2 = st.columns(2)
     with col1:
         # Filter by brand
-        brands = ['any'] + list(bt_data_df['Brand'].unique())
-        selected_brand9 = st.selectbox('Select a brand', brands, index=0 if 'any' in brands else 1)
-        if selected_brand9 != 'any':
-            bt_data_df = bt_data_df[bt_data_df['Brand'] == selected_brand9]
+        bluetooth_filters = {}
+        facet_selectbox('Select a brand', facets['Bluetooth'], 'CompanyName', bluetooth_filters,
+                        'televisions_bluetooth')
 
     with col2:
         # Filter by Registration Date
         sort_options = ['Newest', 'Oldest']
         selected_sort9 = st.selectbox('Sort by Date', sort_options, index=0, key='bluetooth_sort')  # Default to Newest
-        if selected_sort9 == 'Newest':
-            bt_data_df = bt_data_df.sort_values(by='Certification Date', ascending=False)
-        elif selected_sort9 == 'Oldest':
-            bt_data_df = bt_data_df.sort_values(by='Certification Date', ascending=True)
-    st.dataframe(bt_data_df, use_container_width=True)
+    bluetooth_rows = facets['Bluetooth'].select(bluetooth_filters, sort='ListingDate', ascending=selected_sort9 == 'Oldest')
+    bluetooth_names = {
+        'ListingId': 'Listing ID',
+        'Name': 'Product Name',
+        'CompanyName': 'Brand',
+        'ListingDate': 'Certification Date',
+        'ProductListings': 'Product Listings',
+    }
+    bluetooth_columns = [
+        'Listing ID', 'Certification Date', 'Brand', 'Product Name', 'Product Listings'
+    ]
+    paged_dataframe(bt_data_df, 'televisions_bluetooth', ['bluetooth'], state=(bluetooth_filters, selected_sort9),
+                    dates=['Certification Date'],
+                    rows=bluetooth_rows, rename=bluetooth_names, columns=bluetooth_columns)
     st.markdown("### Apple MFi <i class='fab fa-apple'></i>", unsafe_allow_html=True)
     col1, col2 = st.columns(2)
     with col1:
@@ -2811,22 +1811,20 @@ def show_raw_data_cert_televisions():
 
     with col2:
         st.empty()  
-    st.dataframe(mfi_data_df, use_container_width=True)
+    paged_dataframe(mfi_data_df, 'televisions_mfi', ['mfi'], state=selected_brand9)
 
     
 
 
 def show_changelog_cert_televisions():
+    prefetch_datasets("televisions_changelog", "wifi_changelog", "bluetooth_changelog", "mfi_changelog")
     st.header('Changelogs')
     # Example: st.write(data_changelog)
     st.subheader('Energy Star ⚡')
     # Example: st.write(data_changelog)
-    conn = st.connection('s3', type=FilesConnection)
-    placement_changelog1 = conn.read("scoops-finder/televisions-changelog.csv", input_format="csv", ttl=600)
+    placement_changelog1 = load_dataset("televisions_changelog")
     df_clean = placement_changelog1.drop_duplicates(subset=['pd_id'])  # Drop duplicates based on 'pd_id'
 
-    # Keep only the first 10 characters of the "Date" column
-    df_clean['Date Detected'] = df_clean['Date Detected'].str[:10]
     df_clean = df_clean.rename(columns={
         'pd_id': 'Energy Star ID',
         'date_available_on_market': 'Date Available on Market',
@@ -2857,42 +1855,28 @@ def show_changelog_cert_televisions():
         'Energy Star Model Identifier', 'UPC', 'Energy Star ID'
     ]] 
 
-    df_clean['Date Available on Market'] = df_clean['Date Available on Market'].str[:10]
-    df_clean['Date Qualified'] = df_clean['Date Qualified'].str[:10]
-    df_clean['Date Detected'] = df_clean['Date Detected'].str[:10]
     df_clean = df_clean.sort_values(by='Date Available on Market', ascending=False)
-    st.write(df_clean, use_container_width=True)
+    paged_dataframe(df_clean, 'televisions_energy_star_changelog', ['televisions_changelog'],
+                    dates=['Date Detected', 'Date Available on Market', 'Date Qualified'])
 
     st.subheader('WiFi Alliance 📶')
-    conn = st.connection('s3', type=FilesConnection)
-    placement_tracking3 = conn.read("scoops-finder/changelog-wifi.csv", input_format="csv", ttl=600)
+    placement_tracking3 = load_dataset("wifi_changelog")
 
     df_wifi_changelog = placement_tracking3
 
     columns_to_keep3 = ["Date", "Product", "Brand", "Model Number", "Category"]
 
     df_wifi_changelog = df_wifi_changelog[columns_to_keep3]
-    df_wifi_changelog['Date'] = df_wifi_changelog['Date'].str[:10]
     df_wifi_changelog.rename(columns={'Date': 'Date Detected'}, inplace=True)
     df_wifi_changelog = df_wifi_changelog.sort_values(by='Date Detected', ascending=False)
 
-    st.dataframe(df_wifi_changelog, use_container_width=True)
+    paged_dataframe(df_wifi_changelog, 'televisions_wifi_changelog', ['wifi_changelog'], dates=['Date Detected'])
 
-    st.markdown(
-    """
-    <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/5.15.4/css/all.min.css" rel="stylesheet">
-    """,
-    unsafe_allow_html=True
-    )
     
     st.markdown("### Bluetooth <i class='fab fa-bluetooth' style='color:blue'></i>", unsafe_allow_html=True)
 
-    conn = st.connection('s3', type=FilesConnection)
-    bt_data_raw = conn.read("scoops-finder/changelog-bluetooth.json", input_format="json", ttl=600)
-    bt_data_df = pd.json_normalize(bt_data_raw)
-    companies_to_include = [
-        "Sharp Corporation", "Hisense Company Limited", "AmTRAN Technology Co., Ltd", "TCL Communication Ltd.", "LG Electronics Inc.", "Samsung Electronics Co., Ltd."
-    ]
+    bt_data_df = load_dataset("bluetooth_changelog")
+    companies_to_include = BLUETOOTH_CHANGELOG_COMPANIES['televisions']
 
     # Filter the DataFrame
     bt_data_df = bt_data_df[bt_data_df['CompanyName'].isin(companies_to_include)]
@@ -2906,15 +1890,11 @@ def show_changelog_cert_televisions():
     }).loc[:, [
         'Date Detected', 'Certification Date', 'Listing ID', 'Brand', 'Product Name', 'Product Listings'
     ]]
-    bt_data_df['Date Detected'] = bt_data_df['Date Detected'].str[:10]
-    bt_data_df['Certification Date'] = bt_data_df['Certification Date'].str[:10]
-    st.dataframe(bt_data_df, use_container_width=True)
+    paged_dataframe(bt_data_df, 'televisions_bluetooth_changelog', ['bluetooth_changelog'],
+                    dates=['Date Detected', 'Certification Date'])
     
     st.markdown("## Apple MFi <i class='fab fa-apple'></i>", unsafe_allow_html=True)
-    mfi_data_changelog = conn.read("scoops-finder/changelog-mfi.json", input_format="json", ttl=600)
-    # Extract only dictionary items from the list
-    content_data1 = [item for item in mfi_data_changelog if isinstance(item, dict)]
-    mfi_data_changelog_df = pd.json_normalize(content_data1)
+    mfi_data_changelog_df = load_dataset("mfi_changelog")
     mfi_data_changelog_df = mfi_data_changelog_df.rename(columns={
         'Date Detected': 'Date Detected',
         'upcEan': 'UPC',
@@ -2925,8 +1905,7 @@ def show_changelog_cert_televisions():
     }).loc[:, [
         'Date Detected', 'UPC', 'Models', 'Brand', 'Accessory Name', 'Accessory Category'
     ]]
-    mfi_data_changelog_df['Date Detected'] = mfi_data_changelog_df['Date Detected'].str[:10]
-    st.dataframe(mfi_data_changelog_df, use_container_width=True)
+    paged_dataframe(mfi_data_changelog_df, 'televisions_mfi_changelog', ['mfi_changelog'], dates=['Date Detected'])
 
 
 
@@ -2935,84 +1914,9 @@ def show_insights_cert_televisions():
     
     # Add industry-specific details or requirements.
     st.subheader('Energy Star ⚡')
-    conn = st.connection('s3', type=FilesConnection)
-    newest_records = conn.read("scoops-finder/televisions-data.csv", input_format="csv", ttl=600)
-    newest_records = newest_records.sort_values('date_available_on_market', ascending=False)
-
-    conn = st.connection('s3', type=FilesConnection)
-    wifi_data = conn.read("scoops-finder/baseline3.csv", input_format="csv", ttl=600)
-    wifi_data = wifi_data.query('`Category` == "Televisions & Set Top Boxes"')
-    wifi_data = wifi_data.sort_values('Date of Last Certification', ascending=False)
-
-    def extract_unique_countries(market_col):
-        unique_countries = set()
-        # Split each row's market string by comma and strip spaces
-        market_col.apply(lambda x: unique_countries.update(map(str.strip, x.split(','))))
-        return ['any'] + sorted(unique_countries)
-
-    unique_countries = extract_unique_countries(newest_records['markets'])
-
-
-    conn = st.connection('s3', type=FilesConnection)
-    bt_data_raw = conn.read("scoops-finder/bluetooth.json", input_format="json", ttl=600)
-    bt_data_df = pd.json_normalize(bt_data_raw)
-
-    companies_to_include = [
-        "Sharp Corporation", "Hisense Company Limited", "AmTRAN Technology Co., Ltd", "TCL Communication Ltd.", "LG Electronics Inc.", "Samsung Electronics Co., Ltd."
-    ]
-
-    # Filter the DataFrame
-    bt_data_df = bt_data_df[bt_data_df['CompanyName'].isin(companies_to_include)]    
-    bt_data_df["ListingDate"] = bt_data_df["ListingDate"].str[:10]
-
-
-    mfi_data_raw = conn.read("scoops-finder/mfi.json", input_format="json", ttl=600)
-    content_data = mfi_data_raw.get("content", [])
-    mfi_data_df = pd.json_normalize(content_data)
-    mfi_data_df = mfi_data_df[mfi_data_df['brand'].isin(['Sony', 'LG', 'TCL', 'Hisense', 'JVCKENWOOD Corporation', 'SHARP'])]
-    mfi_data_df = mfi_data_df.rename(columns={
-        'upcEan': 'UPC',
-        'models': 'Models',
-        'brand': 'Brand',
-        'accessoryName': 'Accessory Name',
-        'accessoryCategory': 'Accessory Category',
-    }).loc[:, [
-        'UPC', 'Models', 'Brand', 'Accessory Name', 'Accessory Category'
-    ]]
-
-    # Define the number of columns
-    num_columns = 2
-    conn = st.connection('s3', type=FilesConnection)
-    newest_records1 = conn.read("scoops-finder/televisions-data.csv", input_format="csv", ttl=600)
-
-    conn = st.connection('s3', type=FilesConnection)
-    newest_records2 = conn.read("scoops-finder/baseline3.csv", input_format="csv", ttl=600)
-    newest_records2 = newest_records2[newest_records2["Category"] == "Televisions & Set Top Boxes"]
-
-    # Rename columns to standardize across DataFrames
-    newest_records1.rename(columns={
-        'brand_name': 'Brand',
-        'model_name': 'Product',
-        'date_available_on_market': 'Date Certified',
-        'product_type': 'Product Type'
-    }, inplace=True)
-
-    newest_records2.rename(columns={
-        'Brand': 'Brand',
-        'Product': 'Product',
-        'Date of Last Certification': 'Date Certified',
-        'Category': 'Product Type'
-    }, inplace=True)
-
-    # Add a source column to each DataFrame
-    newest_records1['Source'] = 'Energy Star'
-    newest_records2['Source'] = 'WiFi Alliance'
-
-    # Combine the DataFrames
-    combined_df = pd.concat([newest_records1, newest_records2], ignore_index=True)
-    # Display the combined DataFrame
-    combined_df = combined_df.sort_values('Date Certified', ascending=False)
-    combined_df['Date Certified'] = combined_df['Date Certified'].str[:10]
+    # Copy the shared frame, the charts below add their own columns to it
+    # Count each product once per source, re-listings of the same model share a Product ID
+    combined_df = first_per_product(combined_certifications('televisions'), by=['Source', 'Product ID']).copy()
 
     brands_to_keep = [
         "LG", "Samsung", "Funai ElectricCo,. LTD.", "Sharp Corporation", 
@@ -3026,9 +1930,7 @@ def show_insights_cert_televisions():
     combined_df = combined_df[combined_df["Brand"].isin(brands_to_keep)]
 
     st.title('Certification Analysis By Brand Over Time')
-    # Assuming combined_df is loaded correctly
-    combined_df['Date Certified'] = pd.to_datetime(combined_df['Date Certified'])
-    combined_df['Quarter'] = combined_df['Date Certified'].dt.to_period('Q')
+    combined_df['Quarter'] = combined_df['Certification Date'].dt.to_period('Q')
 
     # Sort quarters and create quarter strings
     unique_quarters = combined_df['Quarter'].drop_duplicates().sort_values()
@@ -3087,9 +1989,7 @@ def show_insights_cert_televisions():
 
     st.title('Certification Analysis By Brand Over Time')
 
-    # Assuming combined_df is loaded correctly
-    combined_df['Date Certified'] = pd.to_datetime(combined_df['Date Certified'])
-    combined_df['Quarter'] = combined_df['Date Certified'].dt.to_period('Q')
+    combined_df['Quarter'] = combined_df['Certification Date'].dt.to_period('Q')
     combined_df['Quarter String'] = combined_df['Quarter'].apply(lambda q: f'{q.year}-Q{q.quarter}')
     unique_quarters_str = [f'{q.year}-Q{q.quarter}' for q in combined_df['Quarter'].drop_duplicates().sort_values()]
 
@@ -3155,8 +2055,7 @@ def show_insights_cert_televisions():
     st.title('Certification Analysis By Source Over Time')
 
    # Assuming combined_df is loaded correctly
-    combined_df['Date Certified'] = pd.to_datetime(combined_df['Date Certified'])
-    combined_df['Quarter'] = combined_df['Date Certified'].dt.to_period('Q')
+    combined_df['Quarter'] = combined_df['Certification Date'].dt.to_period('Q')
 
     # Sort quarters and create quarter strings
     unique_quarters = combined_df['Quarter'].drop_duplicates().sort_values()
@@ -3223,9 +2122,7 @@ def show_insights_cert_televisions():
 
     st.title('Certification by Brand This Quarter')
 
-    # Assuming combined_df is loaded correctly
-    combined_df['Date Certified'] = pd.to_datetime(combined_df['Date Certified'])
-    combined_df['Quarter'] = combined_df['Date Certified'].dt.to_period('Q')
+    combined_df['Quarter'] = combined_df['Certification Date'].dt.to_period('Q')
 
     # Sort quarters and create quarter strings
     unique_quarters = combined_df['Quarter'].drop_duplicates().sort_values(ascending=True)  # Sort ascending
@@ -3298,26 +2195,58 @@ def display_placements_televisions():
 
 
 def main():
+    # Start the background cache warmer once per server process
+    get_warmer()
+
     if 'logged_in' not in st.session_state:
         st.session_state['logged_in'] = False
 
+    # Icon font rules for the headings and links, once per run rather than per section
+    st.markdown(icon_css(), unsafe_allow_html=True)
+
     if st.session_state['logged_in']:
         if 'page' not in st.session_state:
             st.session_state['page'] = 'home'
-        
+
         sidebar()
 
-        # Redirect based on the selected page
-        if st.session_state['page'] == 'home':
-            display_dashboard()
-        elif st.session_state['page'] == 'certifications':
-            display_certifications_page()  # Renamed for clarity
-        elif st.session_state['page'] == 'placements':
-            display_placements_page()  # Renamed for clarity
+        # Time the page and attribute its dataset loads to it
+        with get_metrics().page(current_page_label):
+            # Redirect based on the selected page
+            if st.session_state['page'] == 'home':
+                display_dashboard()
+            elif st.session_state['page'] == 'certifications':
+                display_certifications_page()  # Renamed for clarity
+            elif st.session_state['page'] == 'placements':
+                display_placements_page()  # Renamed for clarity
+            elif st.session_state['page'] == 'search':
+                display_global_search()
+
+        if is_admin(st.session_state.get('username')):
+            show_load_metrics()
     else:
         display_login_form()
 
 
+def current_page_label():
+    page = st.session_state.get('page', 'home')
+    if page == 'home':
+        return page
+    return f"{page} / {st.session_state.get('selected_product_type')} / {st.session_state.get('current_page')}"
+
+
+def show_load_metrics():
+    # Admin-only view of how each dataset was served and what it cost
+    metrics = get_metrics()
+    with st.expander("Data load metrics"):
+        st.markdown("**Datasets**")
+        st.dataframe(metrics.summary(), use_container_width=True)
+        st.markdown("**Pages**")
+        st.dataframe(metrics.page_summary(), use_container_width=True)
+        if metrics.log_path:
+            st.caption(f"Also written to {metrics.log_path}")
+
+
 def page1():
     st.title("Page 1")
     st.write("Welcome to Page 1")
@@ -3357,214 +2286,36 @@ def display_placements_imaging():
 def show_recent():
     # Code to display recent data
     st.header('Recent Placements')
-    conn = st.connection('s3', type=FilesConnection)
-    df5 = conn.read("scoops-finder/brand_counts.csv", input_format="csv", ttl=600)
-    df5 = df5[-10:]
-    df5 = df5.sort_values(by='Brand').reset_index(drop=True)
-
-    # Create metrics for the latest 5 records
-
-    lnk = '<link rel="stylesheet" href="https://use.fontawesome.com/releases/v5.12.1/css/all.css" crossorigin="anonymous">'
-    wch_colour_font = (0, 0, 0)
-    fontsize = 20
-    valign = "left"
-    iconname = "fas fa-xmark"
-        
-    container = st.container()
-
-    # Add your placements data here
-    conn = st.connection('s3', type=FilesConnection)
-    df4 = conn.read("scoops-finder/tracking.csv", input_format="csv", ttl=600)
-    df4.drop_duplicates(subset="Product Name", inplace=True)
-    df4 = df4.sort_values(by='Date Detected', ascending=True)
-    latest_df4 = df4.tail(5)  # Get the latest 5 records
-    latest_df4 = latest_df4.iloc[::-1]
-
-    
-    st.markdown('''
-    <style>
-    .grid-container {
-        display: grid;
-        grid-template-columns: repeat(3, 1fr); /* Maintains 3 columns */
-        grid-gap: 20px; /* Space between cards */
-        padding: 10px;
-        width: auto; /* Adjust based on the actual space available or use 100% if it should be fully responsive */
-    }
-
-    .card {
-        height: auto;
-        min-height: 120px;
-        position: relative;
-        width: 100%; /* This makes each card responsive within its grid column */
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        padding: 2px;
-        border-radius: 24px;
-        overflow: hidden;
-        line-height: 1.6;
-        transition: all 0.48s cubic-bezier(0.23, 1, 0.32, 1);
-        margin: 15px; /* Added margin */
-    }
+    # Latest 5 placements as one cached HTML grid
+    st.markdown(recent_placement_cards(), unsafe_allow_html=True)
 
-    .content {
-    width: 100%;
-    display: flex;
-    flex-direction: column;
-    align-items: flex-start;
-    gap: 24px;
-    padding: 20px;
-    padding-bottom: 0px;
-    border-radius: 22px;
-    color: #ffffff;
-    overflow: hidden;
-    background: #ffffff;
-    transition: all 0.48s cubic-bezier(0.23, 1, 0.32, 1);
-    }
-
-    .content .heading {
-    font-weight: 600;
-    font-size: 20px;
-    line-height: 1;
-    z-index: 1;
-    transition: all 0.48s cubic-bezier(0.23, 1, 0.32, 1);
-    }
-
-    .content .para {
-    z-index: 1;
-    opacity: 0.8;
-    font-size: 16px;
-    font-weight: 400;
-    transition: all 0.48s cubic-bezier(0.23, 1, 0.32, 1);
-    }
-
-    .card::before {
-    content: "";
-    position: absolute;
-    height: 500%;
-    width: 500%;
-    border-radius: inherit;
-    background: #3775cb;
-    background: linear-gradient(to right, #3775cb, #3775cb);
-    transform-origin: center;
-    }
-
-    .card:hover::before {
-    animation-play-state: running;
-    z-index: -1;
-    width: 20%;
-    }
-    .card:hover .content .heading,
-    .card:hover .content .para {
-    color: #000000;
-    }
-
-    .card:hover {
-    box-shadow: 0rem 6px 13px rgba(10, 60, 255, 0.1),
-        0rem 24px 24px rgba(10, 60, 255, 0.09),
-        0rem 55px 33px rgba(10, 60, 255, 0.05),
-        0rem 97px 39px rgba(10, 60, 255, 0.01), 0rem 152px 43px rgba(10, 60, 255, 0);
-    color: #000000;
-    }
-
-    </style>
-    ''', unsafe_allow_html=True)
-
-
-    # Sample data iteration - replace 'newest_records' with your actual DataFrame
-    # Define the number of columns
-    # Provide a layout option for the user to switch
-    num_columns = 2
-
-    # Generate rows with the appropriate number of columns
-    rows = [st.columns(num_columns) for _ in range((len(latest_df4) + num_columns - 1) // num_columns)]
-
-    # Initialize a counter for DataFrame row indices
-    row_index = 0
-
-    # Fill each cell in the grid with content
-    for row in rows:
-        for col in row:
-            if row_index < len(latest_df4):
-                with col:
-                    row_data = latest_df4.iloc[row_index]
-                    brand = row_data['Brand']
-                    count = df5[df5['Brand'] == brand]['Count'].values[0]
-                    metric_label = row_data['Action']
-                    metric_value = row_data['Product Name']
-                    metric_delta = str(count)
-                    date_detected = row_data['Date Detected']  # Assuming 'Date Detected' is the column name in df4
-
-
-                    if metric_label == 'Added':
-                        title = "New Product Added"
-                        emoji = "🆕"
-                    elif metric_label == 'Removed':
-                        title = "Product Removed"
-                        emoji = "❌"
-                    else:
-                        title = "Certification Spotted"
-
-                    # Embed data into HTML
-                    html_content = f"""
-                    <div class="card">
-                        <div class="content">
-                            <p class="heading">{metric_value}</p>
-                            <p class="para">
-                                {title} {emoji}
-                                <br>
-                                Brand: {brand}<br>
-                                Product Type: {metric_value}<br>
-                                Certification Date: {date_detected}<br>
-                            </p>
-                        </div>
-                    </div>
-                    """
-                    st.markdown(html_content, unsafe_allow_html=True)
-
-                    row_index += 1   
-
-    # Example: st.write(data_recent)
 
 def show_raw_data():
     # Code to display raw data
     st.header('Raw Placement Data')
-    conn2 = st.connection('s3', type=FilesConnection)
 
-    # Read data from CSV
-    raw_data_placements = conn2.read("scoops-finder/combined_products.csv", input_format="csv", ttl=600)
-
-    # Convert 'Date Detected' to datetime and sort descending
-    raw_data_placements['Date Detected'] = pd.to_datetime(raw_data_placements['Date Detected'])
-    raw_data_placements.sort_values('Date Detected', ascending=False, inplace=True)
+    # Brand bitmaps and the newest-first row order, built once per data version
+    facets = placement_facets()
 
     # Create a list of unique brands for the selectbox, with an 'All Brands' option
-    unique_brands = ['All Brands'] + sorted(raw_data_placements['Brand'].unique().tolist())
+    unique_brands = ['All Brands'] + sorted(facets.values['Brand'])
 
     # Sidebar to select brand
     selected_brand = st.selectbox('Select a brand to display', unique_brands)
 
-    # Filter data based on selected brand, unless 'All Brands' is selected
-    if selected_brand != 'All Brands':
-        filtered_data = raw_data_placements[raw_data_placements['Brand'] == selected_brand].reset_index(drop=True)
-    else:
-        filtered_data = raw_data_placements.reset_index(drop=True)
+    # Rows of the selected brand, unless 'All Brands' is selected, by 'Date Detected' descending
+    rows = facets.select({'Brand': 'any' if selected_brand == 'All Brands' else selected_brand},
+                         sort='Date Detected', ascending=False)
 
-    # Display the filtered data
-    st.write(filtered_data)
+    # Display the filtered data a page at a time
+    paged_dataframe(facets.frame, 'placements_raw', ['combined_products'], state=selected_brand,
+                    dates=['Date Detected'], rows=rows)
 
 
 def show_changelog():
     # Code to display changelog
     st.header('Changelog')
-    conn5 = st.connection('s3', type=FilesConnection)
-    placement_tracking5 = conn5.read("scoops-finder/tracking.csv", input_format="csv", ttl=600)
-    # Establishing connection and reading the data
-    conn = st.connection('s3', type=FilesConnection)
-    placement_tracking = conn.read("scoops-finder/tracking.csv", input_format="csv", ttl=600)
-
-    conn = st.connection('s3', type=FilesConnection)
-    placement_changelog = conn.read("scoops-finder/brand_counts.csv", input_format="csv", ttl=600)
+    placement_changelog = load_dataset("brand_counts")
 
     # Reshape the DataFrame
     pivoted_df = placement_changelog.pivot_table(index='Date', columns='Brand', values='Count', fill_value=0)
@@ -3586,8 +2337,7 @@ def show_insights():
     # Code to display insights
     st.header('Insights')
     # Assuming 'st.connection' and 'FilesConnection' are valid in your environment
-    conn = st.connection('s3', type=FilesConnection)
-    placement_changelog = conn.read("scoops-finder/brand_counts.csv", input_format="csv", ttl=600)
+    placement_changelog = load_dataset("brand_counts")
 
     # Reshape the DataFrame
     pivoted_df = placement_changelog.pivot_table(index='Date', columns='Brand', values='Count', fill_value=0)
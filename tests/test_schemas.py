@@ -0,0 +1,18 @@
+import io
+
+import pandas as pd
+
+from scooper.schemas import ReadSchema, read_csv
+
+DATES = ReadSchema(columns=('date',), dates=('date',))
+
+
+def test_iso_dates_keep_their_calendar_day():
+    frame = read_csv(io.StringIO("date\n2023-05-01T23:00:00.000\n2023-05-02T01:00:00+02:00\n"), DATES)
+    assert frame['date'].tolist() == [pd.Timestamp('2023-05-01'), pd.Timestamp('2023-05-02')]
+
+
+def test_mixed_utc_offsets_parse_to_days():
+    frame = read_csv(io.StringIO("date\n05/01/2023 23:00 -0700\n05/02/2023 01:00 +0200\nnot a date\n"), DATES)
+    assert frame['date'].tolist()[:2] == [pd.Timestamp('2023-05-02'), pd.Timestamp('2023-05-01')]
+    assert frame['date'].isna().tolist() == [False, False, True]
@@ -0,0 +1,19 @@
+import pandas as pd
+
+from scooper.search import TokenIndex
+
+FRAME = pd.DataFrame({
+    'Brand': ['Brother', 'Brother', 'HP'],
+    'Model': ['MFC-L8900CDW', 'HL-L8360CDW', 'M428fdw'],
+})
+
+
+def test_token_prefixes_match():
+    assert TokenIndex(FRAME).search('brother l83').tolist() == [1]
+
+
+def test_model_number_fragment_matches_inside_a_token():
+    index = TokenIndex(FRAME)
+    assert index.search('8900').tolist() == [0]
+    assert index.search('brother 8900').tolist() == [0]
+    assert index.search('8900 xyz').tolist() == []